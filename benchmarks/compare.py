@@ -0,0 +1,37 @@
+"""Сравнивает два JSON-отчета benchmarks.run: пропускную способность и p99."""
+
+import argparse
+import json
+from pathlib import Path
+
+
+def change(old: float, new: float) -> str:
+    if not old:
+        return "n/a"
+    return f"{(new - old) / old * 100:+.1f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark reports.")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text())
+    candidate = json.loads(args.candidate.read_text())
+    print(f"baseline {baseline.get('commit')} -> candidate {candidate.get('commit')}")  # noqa: T201
+    for name, new in candidate["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            print(f"{name:<36} new")  # noqa: T201
+            continue
+        print(  # noqa: T201
+            f"{name:<36} throughput {old['throughput']:>10.1f} -> {new['throughput']:>10.1f} "
+            f"({change(old['throughput'], new['throughput'])})  "
+            f"p99 {old['p99_ms']:>8.2f} -> {new['p99_ms']:>8.2f} ms "
+            f"({change(old['p99_ms'], new['p99_ms'])})"
+        )
+
+
+if __name__ == "__main__":
+    main()
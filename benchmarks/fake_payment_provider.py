@@ -0,0 +1,96 @@
+"""Локальный имитатор платежного провайдера для нагрузочного тестирования вебхуков.
+
+Отправляет подписанные уведомления «ожидание» -> «оплачено» пачками и с повторами,
+как это делают реальные провайдеры:
+
+    python -m benchmarks.fake_payment_provider --url http://localhost:8000 \\
+        --secret "$PAYMENT_WEBHOOK_SECRET" --user-id <uuid> --course-id 1 --payments 1000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+import httpx
+
+from benchmarks.run import summarize
+from course_web_service.apps.payment_app.enums import PaymentStatus
+from course_web_service.apps.payment_app.services import sign_payload
+
+WEBHOOK_PATH = "/api/v1/payments/webhook"
+
+
+def build_webhooks(args: argparse.Namespace) -> list[dict]:
+    """Для каждого платежа — «ожидание» и «оплачено», каждое с retries повторами."""
+    webhooks = []
+    for index in range(args.payments):
+        payment = {
+            "transaction_id": f"fake-{uuid.uuid4().hex}",
+            "user_id": args.user_id[index % len(args.user_id)],
+            "course_id": args.course_id[index % len(args.course_id)],
+            "amount": "1990.00",
+            "payment_method": "card",
+        }
+        for payment_status in (PaymentStatus.PENDING, PaymentStatus.PAID):
+            webhooks += [{**payment, "status": payment_status.value}] * (1 + args.retries)
+    return webhooks
+
+
+async def deliver(args: argparse.Namespace) -> dict:
+    webhooks = build_webhooks(args)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+    duplicates = errors = 0
+
+    async def send(client: httpx.AsyncClient, webhook: dict) -> None:
+        nonlocal duplicates, errors
+        body = json.dumps(webhook).encode()
+        headers = {
+            "Content-Type": "application/json",
+            "X-Signature": sign_payload(body, args.secret),
+        }
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(WEBHOOK_PATH, content=body, headers=headers)
+            latencies.append(time.perf_counter() - start)
+        if response.status_code != 200:
+            errors += 1
+        elif response.json()["duplicate"]:
+            duplicates += 1
+
+    start = time.perf_counter()
+    async with httpx.AsyncClient(base_url=args.url, timeout=30) as client:
+        # Уведомления одного платежа идут по порядку, разные платежи — вперемешку и пачками.
+        step = 2 * (1 + args.retries)
+        for offset in range(0, len(webhooks), step * args.concurrency):
+            burst = webhooks[offset : offset + step * args.concurrency]
+            pending = [
+                webhook for webhook in burst if webhook["status"] != PaymentStatus.PAID.value
+            ]
+            paid = [webhook for webhook in burst if webhook["status"] == PaymentStatus.PAID.value]
+            await asyncio.gather(*(send(client, webhook) for webhook in pending))
+            await asyncio.gather(*(send(client, webhook) for webhook in paid))
+    result = summarize("webhook", latencies, time.perf_counter() - start, errors)
+    result["duplicates"] = duplicates
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fake payment provider for webhook load tests.")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--secret", required=True)
+    parser.add_argument("--user-id", action="append", required=True)
+    parser.add_argument("--course-id", type=int, action="append", required=True)
+    parser.add_argument("--payments", type=int, default=1000)
+    parser.add_argument("--retries", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    result = asyncio.run(deliver(args))
+    print(json.dumps(result, indent=2))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
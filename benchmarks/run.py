@@ -0,0 +1,485 @@
+"""Нагрузочные и микро-бенчмарки горячих путей приложения.
+
+Запуск без внешних сервисов (UserManager заменяется хранилищем в памяти):
+
+    python -m benchmarks.run --output bench.json
+
+Запуск против PostgreSQL из настроек DB_*: на сервере создается отдельная БД со случайным
+именем, схема и контент для сценария прогресса, после прогона БД удаляется. База из DB_NAME
+не затрагивается; пользователю нужно право CREATEDB.
+
+    python -m benchmarks.run --postgres --output bench.json
+
+Сравнение двух прогонов:
+
+    python -m benchmarks.compare old.json new.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import NamedTuple
+
+import httpx
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from sqlalchemy import insert, inspect, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from benchmarks.stand_in import (
+    ROLES,
+    InMemoryProgressManager,
+    InMemoryRefreshTokenManager,
+    InMemoryUserManager,
+)
+from course_web_service.apps.auth_app.cache import principal_cache
+from course_web_service.apps.auth_app.handlers import AuthHandler
+from course_web_service.apps.auth_app.manager import RefreshTokenManager
+from course_web_service.apps.auth_app.ratelimit import (
+    InMemoryRateLimiterBackend,
+    LoginRateLimiter,
+    RateLimit,
+    login_rate_limiter,
+)
+from course_web_service.apps.progress_app.manager import ProgressManager
+from course_web_service.apps.progress_app.schemas import ProgressEvent
+from course_web_service.apps.progress_app.services import ProgressService
+from course_web_service.apps.user_app.manager import UserManager
+from course_web_service.apps.user_app.roles import role_registry
+from course_web_service.apps.user_app.schemas import RoleSchema, UserInDB, UserReturnData
+from course_web_service.core.responses import ORJSONResponse
+from course_web_service.core.settings import DBSettings, settings
+from course_web_service.database.initial_data.initial_data import InitialDataLoader
+from course_web_service.database.models import Base
+from course_web_service.database.models.content import Assignment
+from course_web_service.database.models.course import Lesson
+from course_web_service.main import app
+
+API_PREFIX = "/api/v1"
+BENCH_PASSWORD = "bench_password_123"  # noqa: S105
+PROGRESS_BATCH_SIZE = 500
+
+
+def summarize(name: str, latencies: list[float], wall_time: float, errors: int = 0) -> dict:
+    """Считает пропускную способность и перцентили задержки в миллисекундах."""
+    ordered = sorted(latencies)
+
+    def percentile(value: float) -> float:
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, int(round(value / 100 * (len(ordered) - 1))))
+        return ordered[index] * 1000
+
+    return {
+        "name": name,
+        "operations": len(latencies),
+        "errors": errors,
+        "throughput": len(latencies) / wall_time if wall_time else 0.0,
+        "mean_ms": statistics.fmean(ordered) * 1000 if ordered else 0.0,
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+    }
+
+
+async def measure(
+    name: str,
+    operation: Callable[[int], Awaitable[bool | None]],
+    count: int,
+    concurrency: int,
+) -> dict:
+    """Выполняет операцию count раз с заданным параллелизмом."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def run_one(index: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            ok = await operation(index)
+            latencies.append(time.perf_counter() - start)
+            if ok is False:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_one(index) for index in range(count)))
+    return summarize(name, latencies, time.perf_counter() - start, errors)
+
+
+def measure_sync(name: str, operation: Callable[[], object], count: int) -> dict:
+    """Выполняет синхронную операцию count раз подряд."""
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(count):
+        op_start = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - op_start)
+    return summarize(name, latencies, time.perf_counter() - start)
+
+
+class ProgressContent(NamedTuple):
+    """Урок и задания, на которые ссылаются события прогресса."""
+
+    lesson_id: uuid.UUID
+    assignment_ids: list[uuid.UUID]
+
+
+def random_progress_content(batch_size: int = PROGRESS_BATCH_SIZE) -> ProgressContent:
+    """Случайные ID для прогонов без БД, где внешние ключи не проверяются."""
+    return ProgressContent(uuid.uuid4(), [uuid.uuid4() for _ in range(batch_size // 5)])
+
+
+def progress_events(content: ProgressContent, batch_size: int = PROGRESS_BATCH_SIZE) -> list[dict]:
+    """Пакет событий прогресса: по 5 событий на задание, часть — не по порядку."""
+    lesson_id = content.lesson_id
+    assignments = content.assignment_ids
+    now = datetime.now(UTC)
+    return [
+        {
+            "assignment_id": str(assignments[index % len(assignments)]),
+            "lesson_id": str(lesson_id),
+            "status": "в процессе",
+            "score": float(index % 100),
+            "occurred_at": (now - timedelta(seconds=(index * 7) % 13)).isoformat(),
+        }
+        for index in range(batch_size)
+    ]
+
+
+def with_events_per_second(result: dict, batch_size: int = PROGRESS_BATCH_SIZE) -> dict:
+    result["events_per_second"] = result["throughput"] * batch_size
+    return result
+
+
+async def run_micro_benchmarks(count: int) -> list[dict]:
+    """Микро-бенчмарки кодирования токенов и пути сериализации пользователя."""
+    handler = AuthHandler()
+    token = await handler.create_access_token(data={"sub": "bench@example.com"})
+    now = datetime.now(UTC)
+    user_data = {
+        "id": uuid.uuid4(),
+        "email": "bench@example.com",
+        "first_name": "Bench",
+        "last_name": "User",
+        "is_active": True,
+        "is_verified": True,
+        "role_id": 4,
+        "created_at": now,
+        "updated_at": now,
+        "role": RoleSchema(id=4, name="User", description=None),
+    }
+    user = UserReturnData(**user_data)
+    role = user_data["role"]
+    user_row = SimpleNamespace(
+        **{key: value for key, value in user_data.items() if key != "role"},
+        hashed_password="$2b$12$" + "x" * 53,
+    )
+
+    def user_read_revalidate() -> bytes:
+        """Прежний путь /users/{id}: три валидации и сериализация через json."""
+        user_in_db = UserInDB(**vars(user_row), role=role)
+        response_data = UserReturnData(**user_in_db.model_dump())
+        validated = UserReturnData.model_validate(response_data.model_dump())
+        return JSONResponse(validated.model_dump(mode="json")).body
+
+    def user_read_single_validate() -> bytes:
+        """Текущий путь /users/{id}: одна валидация строки, доверенные DTO и orjson."""
+        user_in_db = UserInDB.model_validate(user_row, from_attributes=True)
+        user_in_db.role = role
+        return ORJSONResponse(user_in_db.to_return_data()).body
+
+    async def encode(_: int) -> None:
+        await handler.create_access_token(data={"sub": "bench@example.com"})
+
+    async def decode(_: int) -> None:
+        await handler.decode_token(token, token_type_for_logger="access")  # noqa: S106
+
+    events = [ProgressEvent(**event) for event in progress_events(random_progress_content())]
+    user_id = uuid.uuid4()
+    limiter = LoginRateLimiter(
+        backend=InMemoryRateLimiterBackend(maxsize=count * 2),
+        per_email=RateLimit(burst=5, per_minute=5),
+        per_ip=RateLimit(burst=30, per_minute=120),
+        enabled=True,
+    )
+
+    async def login_limit(index: int) -> None:
+        try:
+            await limiter.check(
+                email=f"bench-{index}@example.com", client_ip=f"10.0.{index % 256}.1"
+            )
+        except HTTPException:
+            pass
+
+    return [
+        with_events_per_second(
+            measure_sync(
+                "micro.progress_collapse",
+                lambda: ProgressService.collapse_events(events, default_user_id=user_id),
+                max(1, count // 50),
+            )
+        ),
+        await measure("micro.login_rate_limit", login_limit, count, 1),
+        await measure("micro.jwt_encode", encode, count, 1),
+        await measure("micro.jwt_decode", decode, count, 1),
+        measure_sync("micro.user_return_data_validate", lambda: UserReturnData(**user_data), count),
+        measure_sync("micro.user_return_data_dump_json", user.model_dump_json, count),
+        measure_sync("micro.user_read_revalidate", user_read_revalidate, count),
+        measure_sync("micro.user_read_single_validate", user_read_single_validate, count),
+    ]
+
+
+async def run_http_benchmarks(
+    client: httpx.AsyncClient, count: int, concurrency: int, content: ProgressContent
+) -> list:
+    """Сценарий: регистрация, получение и обновление токенов, операции над /users/{id}."""
+    run_id = uuid.uuid4().hex[:8]
+    emails = [f"bench-{run_id}-{index}@example.com" for index in range(count)]
+    user_ids: list[str | None] = [None] * count
+    access_tokens: list[str | None] = [None] * count
+    refresh_tokens: list[str | None] = [None] * count
+
+    async def register(index: int) -> bool:
+        response = await client.post(
+            f"{API_PREFIX}/auth/register",
+            json={"email": emails[index], "password": BENCH_PASSWORD},
+        )
+        if response.status_code == 201:
+            user_ids[index] = response.json()["id"]
+        return response.status_code == 201
+
+    async def token(index: int) -> bool:
+        response = await client.post(
+            f"{API_PREFIX}/auth/token",
+            data={"username": emails[index], "password": BENCH_PASSWORD},
+        )
+        if response.status_code == 200:
+            access_tokens[index] = response.json()["access_token"]
+            refresh_tokens[index] = response.json()["refresh_token"]
+        return response.status_code == 200
+
+    async def refresh(index: int) -> bool:
+        response = await client.post(
+            f"{API_PREFIX}/auth/refresh", params={"refresh_token": refresh_tokens[index]}
+        )
+        if response.status_code == 200:
+            access_tokens[index] = response.json()["access_token"]
+            refresh_tokens[index] = response.json()["refresh_token"]
+        return response.status_code == 200
+
+    def auth_headers(index: int) -> dict:
+        return {"Authorization": f"Bearer {access_tokens[index]}"}
+
+    async def read_user(index: int) -> bool:
+        response = await client.get(
+            f"{API_PREFIX}/users/{user_ids[index]}", headers=auth_headers(index)
+        )
+        return response.status_code == 200
+
+    async def update_user(index: int) -> bool:
+        response = await client.patch(
+            f"{API_PREFIX}/users/{user_ids[index]}",
+            json={"first_name": f"Bench{index}"},
+            headers=auth_headers(index),
+        )
+        return response.status_code == 200
+
+    async def progress_batch(index: int) -> bool:
+        response = await client.post(
+            f"{API_PREFIX}/progress/batch",
+            json={"events": progress_events(content)},
+            headers=auth_headers(index),
+        )
+        return response.status_code == 200
+
+    async def delete_user(index: int) -> bool:
+        response = await client.delete(
+            f"{API_PREFIX}/users/{user_ids[index]}", headers=auth_headers(index)
+        )
+        return response.status_code == 200
+
+    return [
+        await measure("http.auth_register", register, count, concurrency),
+        await measure("http.auth_token", token, count, concurrency),
+        await measure("http.auth_refresh", refresh, count, concurrency),
+        await measure("http.users_read", read_user, count, concurrency),
+        await measure("http.users_update", update_user, count, concurrency),
+        with_events_per_second(
+            await measure("http.progress_batch", progress_batch, count, concurrency)
+        ),
+        await measure("http.users_delete", delete_user, count, concurrency),
+    ]
+
+
+async def run_in_memory(count: int, concurrency: int) -> list[dict]:
+    """HTTP-сценарий в процессе с заменой UserManager на хранилище в памяти."""
+    InMemoryUserManager.reset()
+    InMemoryProgressManager.reset()
+    InMemoryRefreshTokenManager.reset()
+    role_registry.load(ROLES)
+    app.dependency_overrides[UserManager] = InMemoryUserManager
+    app.dependency_overrides[ProgressManager] = InMemoryProgressManager
+    app.dependency_overrides[RefreshTokenManager] = InMemoryRefreshTokenManager
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            return await run_http_benchmarks(client, count, concurrency, random_progress_content())
+    finally:
+        app.dependency_overrides.pop(UserManager, None)
+        app.dependency_overrides.pop(ProgressManager, None)
+        app.dependency_overrides.pop(RefreshTokenManager, None)
+
+
+async def create_bench_database(db_settings: DBSettings) -> str:
+    """Создает пустую БД со случайным именем на сервере из настроек и возвращает ее имя."""
+    name = f"bench_{uuid.uuid4().hex[:12]}"
+    admin = create_async_engine(
+        db_settings.model_copy(update={"db_name": "postgres"}).db_url,
+        isolation_level="AUTOCOMMIT",
+    )
+    try:
+        async with admin.connect() as connection:
+            await connection.execute(text(f'CREATE DATABASE "{name}"'))
+    finally:
+        await admin.dispose()
+    return name
+
+
+async def drop_bench_database(db_settings: DBSettings, name: str) -> None:
+    """Удаляет БД, созданную create_bench_database."""
+    admin = create_async_engine(
+        db_settings.model_copy(update={"db_name": "postgres"}).db_url,
+        isolation_level="AUTOCOMMIT",
+    )
+    try:
+        async with admin.connect() as connection:
+            await connection.execute(text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+    finally:
+        await admin.dispose()
+
+
+async def create_bench_schema(db_url: str) -> None:
+    """Создает таблицы приложения, отказываясь работать с непустой БД."""
+    engine = create_async_engine(db_url)
+    try:
+        async with engine.begin() as connection:
+            existing = await connection.run_sync(
+                lambda sync_connection: inspect(sync_connection).get_table_names()
+            )
+            if existing:
+                raise RuntimeError(f"Benchmark database is not empty: {sorted(existing)}.")
+            await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            await connection.run_sync(Base.metadata.create_all)
+    finally:
+        await engine.dispose()
+
+
+async def seed_progress_content(db, batch_size: int = PROGRESS_BATCH_SIZE) -> ProgressContent:
+    """Создает курс с уроком и заданиями, чтобы пакеты прогресса проходили проверки FK."""
+    async with db.db_session() as session:
+        await InitialDataLoader().load_demo_courses(
+            session, courses=1, topics_per_course=1, lessons_per_topic=1
+        )
+        lesson_id = await session.scalar(select(Lesson.id))
+        deadline = datetime.now(UTC) + timedelta(days=30)
+        assignment_ids = await session.scalars(
+            insert(Assignment).returning(Assignment.id, sort_by_parameter_order=True),
+            [
+                {
+                    "lesson_id": lesson_id,
+                    "title": f"Assignment {number}",
+                    "description": "Benchmark assignment",
+                    "deadline": deadline,
+                }
+                for number in range(batch_size // 5)
+            ],
+        )
+        content = ProgressContent(lesson_id, list(assignment_ids.all()))
+        await session.commit()
+    return content
+
+
+async def run_postgres(count: int, concurrency: int) -> list[dict]:
+    """HTTP-сценарий против отдельной БД, которая создается и удаляется на время прогона."""
+    db_settings = settings.db_settings
+    name = await create_bench_database(db_settings)
+    settings.db_settings = db_settings.model_copy(update={"db_name": name})
+    try:
+        await create_bench_schema(settings.db_settings.db_url)
+        async with app.router.lifespan_context(app):
+            content = await seed_progress_content(app.state.db)
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                return await run_http_benchmarks(client, count, concurrency, content)
+    finally:
+        settings.db_settings = db_settings
+        await drop_bench_database(db_settings, name)
+
+
+def current_commit() -> str | None:
+    """Возвращает хэш текущего коммита для сравнения прогонов."""
+    try:
+        return subprocess.check_output(  # noqa: S603
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> dict:
+    principal_cache.hits = principal_cache.misses = 0
+    # Все HTTP-запросы идут с одного адреса: лимит попыток входа меряется микро-бенчмарком.
+    login_rate_limiter.enabled = False
+    results = await run_micro_benchmarks(args.micro_iterations)
+    if args.postgres:
+        results += await run_postgres(args.requests, args.concurrency)
+    else:
+        results += await run_in_memory(args.requests, args.concurrency)
+    return {
+        "commit": current_commit(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "backend": "postgres" if args.postgres else "in-memory",
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "principal_cache": principal_cache.metrics(),
+        "results": {result["name"]: result for result in results},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run hot-path benchmarks.")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--micro-iterations", type=int, default=5000)
+    parser.add_argument("--postgres", action="store_true")
+    parser.add_argument("--output", type=Path, default=Path("bench.json"))
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    for result in report["results"].values():
+        print(  # noqa: T201
+            f"{result['name']:<36} {result['throughput']:>10.1f} ops/s "
+            f"p50 {result['p50_ms']:>8.2f} ms  p99 {result['p99_ms']:>8.2f} ms  "
+            f"errors {result['errors']}"
+            + (
+                f"  {result['events_per_second']:.0f} events/s"
+                if "events_per_second" in result
+                else ""
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+from fastapi import HTTPException, status
+
+from course_web_service.apps.auth_app.schemas import RefreshTokenRecord
+from course_web_service.apps.user_app.enums import PermissionsUserChange
+from course_web_service.apps.user_app.roles import role_registry
+from course_web_service.apps.user_app.schemas import (
+    CreateUser,
+    DeleteUserResponse,
+    GetUserByEmail,
+    GetUserByID,
+    RoleSchema,
+    UpdateUserToDB,
+    UserInDB,
+    UserReturnData,
+)
+
+ROLES = [
+    RoleSchema(id=1, name="Admin", description="Администратор системы"),
+    RoleSchema(id=2, name="Manager", description="Менеджер системы"),
+    RoleSchema(id=3, name="Curator", description="Куратор курсов"),
+    RoleSchema(id=4, name="User", description="Обычный пользователь системы"),
+]
+
+
+class InMemoryUserManager:
+    """Замена UserManager без базы данных с той же семантикой ошибок и прав доступа."""
+
+    users: dict[uuid.UUID, UserInDB] = {}
+
+    def __init__(self) -> None:
+        self.users = InMemoryUserManager.users
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.users.clear()
+
+    async def create_user(self, user: CreateUser) -> UserReturnData:
+        if any(existing.email == user.email for existing in self.users.values()):
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="User already exists.")
+        now = datetime.now(UTC)
+        user_in_db = UserInDB(
+            id=uuid.uuid4(),
+            email=user.email,
+            hashed_password=user.hashed_password,
+            is_active=False,
+            is_verified=False,
+            role_id=user.role_id,
+            created_at=now,
+            updated_at=now,
+            role=role_registry.get(user.role_id),
+        )
+        self.users[user_in_db.id] = user_in_db
+        return user_in_db.to_return_data()
+
+    async def get_user_by_email(self, user: GetUserByEmail) -> UserInDB:
+        for existing in self.users.values():
+            if existing.email == user.email:
+                return existing
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
+
+    async def get_user_by_id(self, user: GetUserByID) -> UserInDB:
+        if user.id not in self.users:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
+        return self.users[user.id]
+
+    async def get_target_and_caller(
+        self, target: GetUserByID, caller: GetUserByEmail
+    ) -> tuple[UserInDB, UserInDB]:
+        return await self.get_user_by_id(target), await self.get_user_by_email(caller)
+
+    async def get_roles(self) -> list[RoleSchema]:
+        return list(ROLES)
+
+    async def update_password_hash(self, user_id: uuid.UUID, old_hash: str, new_hash: str) -> bool:
+        user = self.users.get(user_id)
+        if user is None or user.hashed_password != old_hash:
+            return False
+        self.users[user_id] = user.model_copy(update={"hashed_password": new_hash})
+        return True
+
+    async def update_user_info(
+        self, target: GetUserByID, caller_email: str, update_data: UpdateUserToDB
+    ) -> UserReturnData:
+        user = await self._check_can_change(target, caller_email)
+        updated = user.model_copy(update=update_data.model_dump(exclude_unset=True))
+        self.users[user.id] = updated
+        return updated.to_return_data()
+
+    async def delete_user(self, target: GetUserByID, caller_email: str) -> DeleteUserResponse:
+        user = await self._check_can_change(target, caller_email)
+        del self.users[user.id]
+        return DeleteUserResponse(message="User deleted successfully.")
+
+    async def _check_can_change(self, target: GetUserByID, caller_email: str) -> UserInDB:
+        user = await self.get_user_by_id(target)
+        caller = await self.get_user_by_email(GetUserByEmail(email=caller_email))
+        privileged = role_registry.ids_by_names(item.value for item in PermissionsUserChange)
+        if caller.id != user.id and caller.role_id not in privileged:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Permission denied.")
+        return user
+
+
+class InMemoryProgressManager:
+    """Замена ProgressManager без базы данных: применяет только более новые события."""
+
+    progress: dict[tuple[uuid.UUID, uuid.UUID], datetime] = {}
+
+    def __init__(self) -> None:
+        self.progress = InMemoryProgressManager.progress
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.progress.clear()
+
+    async def upsert_progress(self, rows: list[dict]) -> int:
+        applied = 0
+        for row in rows:
+            key = (row["user_id"], row["assignment_id"])
+            current = self.progress.get(key)
+            if current is None or current < row["event_at"]:
+                self.progress[key] = row["event_at"]
+                applied += 1
+        return applied
+
+
+class InMemoryRefreshTokenManager:
+    """Замена RefreshTokenManager без базы данных: ротация и отзыв семейств токенов."""
+
+    tokens: dict[uuid.UUID, dict] = {}
+
+    def __init__(self) -> None:
+        self.tokens = InMemoryRefreshTokenManager.tokens
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.tokens.clear()
+
+    async def create(self, user_id: uuid.UUID, record: RefreshTokenRecord) -> None:
+        self.tokens[record.jti] = {
+            "user_id": user_id,
+            "family_id": record.jti,
+            "token_hash": record.token_hash,
+            "expires_at": record.expires_at,
+            "revoked_at": None,
+        }
+
+    async def rotate(self, jti: uuid.UUID, token_hash: str, new: RefreshTokenRecord) -> bool:
+        token = self.tokens.get(jti)
+        now = datetime.now(UTC)
+        if (
+            token is None
+            or token["token_hash"] != token_hash
+            or token["revoked_at"] is not None
+            or token["expires_at"] <= now
+        ):
+            return False
+        token["revoked_at"] = now
+        self.tokens[new.jti] = {
+            **token,
+            "token_hash": new.token_hash,
+            "expires_at": new.expires_at,
+            "revoked_at": None,
+        }
+        return True
+
+    async def get_token(self, jti: uuid.UUID):
+        token = self.tokens.get(jti)
+        return SimpleNamespace(id=jti, **token) if token else None
+
+    async def revoke_family(self, jti: uuid.UUID) -> list[tuple[uuid.UUID, datetime]]:
+        token = self.tokens.get(jti)
+        if token is None:
+            return []
+        revoked = []
+        for other_jti, other in self.tokens.items():
+            if other["family_id"] == token["family_id"] and other["revoked_at"] is None:
+                other["revoked_at"] = datetime.now(UTC)
+                revoked.append((other_jti, other["expires_at"]))
+        return revoked
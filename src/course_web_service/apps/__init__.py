@@ -1,7 +1,23 @@
 from fastapi import APIRouter
 
+from course_web_service.apps.analytics_app.routes import analytics_router
 from course_web_service.apps.auth_app.routes import auth_router
+from course_web_service.apps.course_app.routes import course_router
+from course_web_service.apps.entitlement_app.routes import entitlement_router
+from course_web_service.apps.payment_app.routes import payment_router
+from course_web_service.apps.progress_app.routes import dashboard_router, progress_router
+from course_web_service.apps.review_app.routes import review_router
+from course_web_service.apps.user_app.routes import role_router, user_router
 
 apps_router = APIRouter(prefix="/api/v1")
 
 apps_router.include_router(router=auth_router)
+apps_router.include_router(router=user_router)
+apps_router.include_router(router=role_router)
+apps_router.include_router(router=course_router)
+apps_router.include_router(router=review_router)
+apps_router.include_router(router=progress_router)
+apps_router.include_router(router=dashboard_router)
+apps_router.include_router(router=payment_router)
+apps_router.include_router(router=entitlement_router)
+apps_router.include_router(router=analytics_router)
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+import time
+from datetime import timedelta
+
+from course_web_service.apps.analytics_app.manager import AnalyticsManager
+from course_web_service.core.core_dependecy.db_dependency import DBDependency
+from course_web_service.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class DailyStatsJob:
+    """Периодически дополняет дневную статистику курсов строками новее отметки."""
+
+    def __init__(
+        self,
+        interval_s: int = settings.analytics_settings.analytics_refresh_interval_s,
+        lag_s: int = settings.analytics_settings.analytics_watermark_lag_s,
+        rebuild_interval_s: int = settings.analytics_settings.analytics_review_rebuild_interval_s,
+    ):
+        self.interval_s = interval_s
+        self.lag = timedelta(seconds=lag_s)
+        self.rebuild_interval_s = rebuild_interval_s
+        self.runs = 0
+        self.failed_runs = 0
+        self.rows_total = 0
+        self.rebuilds = 0
+        self._next_rebuild_at = 0.0
+        self._db: DBDependency | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self, db: DBDependency) -> None:
+        """Запускает фоновую задачу, если задан интервал."""
+        if self.interval_s <= 0 or self._task is not None:
+            return
+        self._db = db
+        self._task = asyncio.create_task(self._run(), name="daily-stats-refresh")
+
+    async def stop(self) -> None:
+        """Останавливает фоновую задачу."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_once(self) -> int:
+        """Обрабатывает одно окно; ошибки логируются, окно будет взято повторно."""
+        if self._db is None:
+            return 0
+        try:
+            rows = await AnalyticsManager(db=self._db).refresh_daily_stats(self.lag)
+        except Exception as e:
+            self.failed_runs += 1
+            logger.error("Failed to refresh daily stats: %s", e, exc_info=True)
+            return 0
+        self.runs += 1
+        self.rows_total += rows
+        await self.rebuild_if_due()
+        return rows
+
+    async def rebuild_if_due(self) -> None:
+        """Раз в rebuild_interval_s пересчитывает итоги отзывов, чтобы учесть удаления."""
+        if self._db is None or self.rebuild_interval_s <= 0:
+            return
+        now = time.monotonic()
+        if now < self._next_rebuild_at:
+            return
+        self._next_rebuild_at = now + self.rebuild_interval_s
+        try:
+            await AnalyticsManager(db=self._db).rebuild_review_stats()
+        except Exception as e:
+            self.failed_runs += 1
+            logger.error("Failed to rebuild review stats: %s", e, exc_info=True)
+            return
+        self.rebuilds += 1
+
+    def metrics(self) -> dict:
+        """Возвращает счетчики запусков и обработанных строк."""
+        return {
+            "runs": self.runs,
+            "failed_runs": self.failed_runs,
+            "rows_total": self.rows_total,
+            "rebuilds": self.rebuilds,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval_s)
+
+
+daily_stats_job = DailyStatsJob()
@@ -0,0 +1,261 @@
+import logging
+from datetime import UTC, date, datetime, timedelta
+
+from fastapi import Depends
+from sqlalchemy import Date, Integer, and_, cast, exists, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from course_web_service.core.core_dependecy.db_dependency import DBDependency, get_db
+from course_web_service.database.models.analytics import AnalyticsWatermark, CourseDailyStats
+from course_web_service.database.models.course import Course
+from course_web_service.database.models.payment import Purchase
+from course_web_service.database.models.review import Review
+from course_web_service.database.models.user import Curator
+
+logger = logging.getLogger(__name__)
+
+DAILY_STATS_WATERMARK = "course_daily_stats"
+UPSERT_CHUNK_SIZE = 1000
+# Ключ advisory-блокировки, чтобы полный пересчет отзывов шел в одном воркере.
+REVIEW_STATS_REBUILD_LOCK = 2_026_101_820
+
+
+def utc_day(column):
+    """День события по UTC."""
+    return cast(func.timezone("UTC", column), Date)
+
+
+class AnalyticsManager:
+    """Класс для наполнения и чтения дневной статистики курсов."""
+
+    def __init__(
+        self, model: type[CourseDailyStats] = CourseDailyStats, db: DBDependency = Depends(get_db)
+    ) -> None:
+        """Инициализирует менеджер статистики."""
+        self.db = db
+        self.model = model
+
+    @staticmethod
+    def source_until_query(lag: timedelta):
+        """Граница окна: строки моложе lag могут принадлежать еще не закоммиченным транзакциям.
+
+        На реплике граница не обгоняет последнюю примененную транзакцию.
+        """
+        replayed_at = func.coalesce(func.pg_last_xact_replay_timestamp(), func.now())
+        return select(replayed_at - lag)
+
+    @staticmethod
+    def source_rows_query(after: datetime, until: datetime):
+        """Строит приращения покупок в окне (after, until] по курсу и дню.
+
+        Покупки только добавляются, поэтому их можно суммировать с накопленным.
+        Счетчик приводится к integer: иначе Postgres вернет numeric, а asyncpg
+        не примет Decimal для целочисленных колонок при записи.
+        """
+        return (
+            select(
+                Purchase.course_id,
+                utc_day(Purchase.created_at).label("day"),
+                cast(func.count(), Integer).label("purchases_count"),
+                func.sum(Purchase.price).label("revenue"),
+            )
+            .where(Purchase.created_at > after, Purchase.created_at <= until)
+            .group_by(Purchase.course_id, utc_day(Purchase.created_at))
+            .order_by(Purchase.course_id, utc_day(Purchase.created_at))
+        )
+
+    @staticmethod
+    def review_rows_query(after: datetime | None = None, until: datetime | None = None):
+        """Строит полные итоги отзывов за (курс, день), где отзывы менялись в (after, until].
+
+        Отзыв меняет оценку после создания, поэтому окно берется по updated_at, а итоги дня
+        пересчитываются целиком. Без границ — итоги по всем дням (полный пересчет).
+        """
+        day = utc_day(Review.created_at)
+        query = select(
+            Review.course_id,
+            day.label("day"),
+            cast(func.count(), Integer).label("reviews_count"),
+            cast(func.sum(Review.rating), Integer).label("rating_sum"),
+        )
+        if after is not None:
+            changed = (
+                select(Review.course_id, day.label("day"))
+                .where(Review.updated_at > after, Review.updated_at <= until)
+                .distinct()
+                .subquery("changed")
+            )
+            query = query.join(
+                changed, and_(changed.c.course_id == Review.course_id, changed.c.day == day)
+            )
+        return query.group_by(Review.course_id, day).order_by(Review.course_id, day)
+
+    def upsert_query(self, rows: list[dict]):
+        """Прибавляет дневные приращения покупок к уже накопленной статистике."""
+        statement = pg_insert(self.model).values(rows)
+        excluded = statement.excluded
+        return statement.on_conflict_do_update(
+            index_elements=[self.model.course_id, self.model.day],
+            set_={
+                "purchases_count": self.model.purchases_count + excluded.purchases_count,
+                "revenue": self.model.revenue + excluded.revenue,
+                "updated_at": func.now(),
+            },
+        )
+
+    def review_upsert_query(self, rows: list[dict]):
+        """Заменяет итоги отзывов за день пересчитанными значениями."""
+        statement = pg_insert(self.model).values(rows)
+        excluded = statement.excluded
+        return statement.on_conflict_do_update(
+            index_elements=[self.model.course_id, self.model.day],
+            set_={
+                "reviews_count": excluded.reviews_count,
+                "rating_sum": excluded.rating_sum,
+                "updated_at": func.now(),
+            },
+        )
+
+    def reset_deleted_reviews_query(self):
+        """Обнуляет итоги отзывов за дни, от которых не осталось ни одного отзыва."""
+        return (
+            update(self.model)
+            .where(
+                or_(self.model.reviews_count != 0, self.model.rating_sum != 0),
+                ~exists().where(
+                    Review.course_id == self.model.course_id,
+                    utc_day(Review.created_at) == self.model.day,
+                ),
+            )
+            .values(reviews_count=0, rating_sum=0, updated_at=func.now())
+        )
+
+    @staticmethod
+    def advance_watermark_query(after: datetime, until: datetime):
+        """Сдвигает отметку, только если ее не сдвинул другой воркер."""
+        return (
+            update(AnalyticsWatermark)
+            .where(
+                AnalyticsWatermark.name == DAILY_STATS_WATERMARK,
+                AnalyticsWatermark.processed_until == after,
+            )
+            .values(processed_until=until)
+            .returning(AnalyticsWatermark.name)
+        )
+
+    async def get_watermark(self) -> datetime:
+        """Возвращает отметку обработанных строк, создавая ее при первом запуске."""
+        async with self.db.db_session() as session:
+            await session.execute(
+                pg_insert(AnalyticsWatermark)
+                .values(
+                    name=DAILY_STATS_WATERMARK, processed_until=datetime(1970, 1, 1, tzinfo=UTC)
+                )
+                .on_conflict_do_nothing(index_elements=[AnalyticsWatermark.name])
+            )
+            await session.commit()
+            return await session.scalar(
+                select(AnalyticsWatermark.processed_until).where(
+                    AnalyticsWatermark.name == DAILY_STATS_WATERMARK
+                )
+            )
+
+    async def refresh_daily_stats(self, lag: timedelta) -> int:
+        """Учитывает строки новее отметки; агрегирует на реплике, пишет в основную БД.
+
+        Возвращает число обновленных пар (курс, день).
+        """
+        after = await self.get_watermark()
+        async with self.db.read_session() as source:
+            until = await source.scalar(self.source_until_query(lag))
+            if until <= after:
+                return 0
+            rows = [
+                dict(row._mapping)
+                for row in await source.execute(self.source_rows_query(after, until))
+            ]
+            review_rows = [
+                dict(row._mapping)
+                for row in await source.execute(self.review_rows_query(after, until))
+            ]
+
+        async with self.db.db_session() as session:
+            advanced = await session.execute(self.advance_watermark_query(after, until))
+            if advanced.first() is None:
+                await session.rollback()
+                logger.info("Daily stats window (%s, %s] taken by another worker", after, until)
+                return 0
+            for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+                await session.execute(self.upsert_query(rows[start : start + UPSERT_CHUNK_SIZE]))
+            await self._write_review_rows(session, review_rows)
+            await session.commit()
+        updated = len(rows) + len(review_rows)
+        logger.info("Daily stats refreshed up to %s: %s rows", until.isoformat(), updated)
+        return updated
+
+    async def rebuild_review_stats(self) -> int:
+        """Пересчитывает итоги отзывов за все дни: учитывает удаленные отзывы.
+
+        Удаление не оставляет строк с updated_at, поэтому окно по отметке его не видит.
+        Если пересчет уже идет в другом воркере, возвращает 0.
+        """
+        async with self.db.read_session() as source:
+            review_rows = [
+                dict(row._mapping) for row in await source.execute(self.review_rows_query())
+            ]
+        async with self.db.db_session() as session:
+            locked = await session.scalar(
+                select(func.pg_try_advisory_xact_lock(REVIEW_STATS_REBUILD_LOCK))
+            )
+            if not locked:
+                await session.rollback()
+                return 0
+            await self._write_review_rows(session, review_rows)
+            reset = (await session.execute(self.reset_deleted_reviews_query())).rowcount
+            await session.commit()
+        logger.info("Review stats rebuilt: %s days, %s reset", len(review_rows), reset)
+        return len(review_rows) + reset
+
+    async def _write_review_rows(self, session: AsyncSession, rows: list[dict]) -> None:
+        for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            await session.execute(self.review_upsert_query(rows[start : start + UPSERT_CHUNK_SIZE]))
+
+    async def get_curator_user_id(self, curator_id: int):
+        """Возвращает ID пользователя-куратора или None, если куратора нет."""
+        async with self.db.db_session() as session:
+            return await session.scalar(select(Curator.user_id).where(Curator.id == curator_id))
+
+    def curator_stats_query(
+        self, curator_id: int, date_from: date, date_to: date, course_id: int | None = None
+    ):
+        """Строит запрос дневной статистики курсов куратора за период."""
+        query = (
+            select(
+                self.model.course_id,
+                Course.title.label("course_title"),
+                self.model.day,
+                self.model.purchases_count,
+                self.model.revenue,
+                self.model.reviews_count,
+                self.model.rating_sum,
+            )
+            .join(Course, Course.id == self.model.course_id)
+            .where(
+                Course.curator_id == curator_id,
+                self.model.day.between(date_from, date_to),
+            )
+        )
+        if course_id is not None:
+            query = query.where(self.model.course_id == course_id)
+        return query.order_by(self.model.day, self.model.course_id)
+
+    async def get_curator_stats(
+        self, curator_id: int, date_from: date, date_to: date, course_id: int | None = None
+    ) -> list:
+        """Читает статистику из предагрегированной таблицы (с реплики, если она настроена)."""
+        async with self.db.read_session() as session:
+            result = await session.execute(
+                self.curator_stats_query(curator_id, date_from, date_to, course_id)
+            )
+            return result.all()
@@ -0,0 +1,28 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends
+
+from course_web_service.apps.analytics_app.schemas import CuratorStats
+from course_web_service.apps.analytics_app.services import AnalyticsService
+from course_web_service.apps.auth_app.security import oauth2_scheme
+
+analytics_router = APIRouter(prefix="/curators", tags=["analytics"])
+
+
+@analytics_router.get("/{curator_id}/stats", response_model=CuratorStats)
+async def read_curator_stats(
+    curator_id: int,
+    date_from: date,
+    date_to: date,
+    course_id: int | None = None,
+    service: AnalyticsService = Depends(AnalyticsService),
+    token: str = Depends(oauth2_scheme),
+):
+    """Возвращает выручку, продажи и оценки курсов куратора по дням из предагрегатов."""
+    return await service.get_curator_stats(
+        token=token,
+        curator_id=curator_id,
+        date_from=date_from,
+        date_to=date_to,
+        course_id=course_id,
+    )
@@ -0,0 +1,37 @@
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict, computed_field
+
+
+class CourseDailyStatsItem(BaseModel):
+    """Схема продаж и оценок курса за день."""
+
+    course_id: int
+    course_title: str
+    day: date
+    purchases_count: int
+    revenue: Decimal
+    reviews_count: int
+    rating_sum: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @computed_field
+    @property
+    def rating_avg(self) -> float | None:
+        """Средняя оценка отзывов, оставленных в этот день."""
+        if not self.reviews_count:
+            return None
+        return round(self.rating_sum / self.reviews_count, 2)
+
+
+class CuratorStats(BaseModel):
+    """Схема статистики курсов куратора за период."""
+
+    curator_id: int
+    date_from: date
+    date_to: date
+    purchases_count: int
+    revenue: Decimal
+    days: list[CourseDailyStatsItem]
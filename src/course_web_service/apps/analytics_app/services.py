@@ -0,0 +1,66 @@
+import logging
+from datetime import date
+
+from fastapi import Depends, HTTPException, status
+
+from course_web_service.apps.analytics_app.manager import AnalyticsManager
+from course_web_service.apps.analytics_app.schemas import CourseDailyStatsItem, CuratorStats
+from course_web_service.apps.auth_app.handlers import AuthHandler
+from course_web_service.apps.auth_app.manager import RefreshTokenManager
+from course_web_service.apps.auth_app.services import AuthService
+from course_web_service.apps.user_app.manager import UserManager
+from course_web_service.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AnalyticsService(AuthService):
+    """Класс для выдачи статистики курсов кураторам."""
+
+    def __init__(
+        self,
+        analytics: AnalyticsManager = Depends(AnalyticsManager),
+        manager: UserManager = Depends(UserManager),
+        auth: AuthHandler = Depends(AuthHandler),
+        tokens: RefreshTokenManager = Depends(RefreshTokenManager),
+    ):
+        """Инициализирует сервис статистики."""
+        super().__init__(manager=manager, auth=auth, tokens=tokens)
+        self.analytics = analytics
+
+    async def get_curator_stats(
+        self,
+        token: str,
+        curator_id: int,
+        date_from: date,
+        date_to: date,
+        course_id: int | None = None,
+    ) -> CuratorStats:
+        """Возвращает статистику курсов куратора (ему самому или admin/manager)."""
+        self._check_range(date_from, date_to)
+        current_user = await self.get_current_user(token=token)
+        curator_user_id = await self.analytics.get_curator_user_id(curator_id)
+        if curator_user_id is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Curator not found.")
+        if curator_user_id != current_user.id and not self._is_privileged(current_user):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Permission denied.")
+
+        rows = await self.analytics.get_curator_stats(curator_id, date_from, date_to, course_id)
+        days = [CourseDailyStatsItem.model_validate(row) for row in rows]
+        return CuratorStats(
+            curator_id=curator_id,
+            date_from=date_from,
+            date_to=date_to,
+            purchases_count=sum(item.purchases_count for item in days),
+            revenue=sum((item.revenue for item in days), start=0),
+            days=days,
+        )
+
+    @staticmethod
+    def _check_range(date_from: date, date_to: date) -> None:
+        max_days = settings.analytics_settings.analytics_max_range_days
+        if date_from > date_to or (date_to - date_from).days >= max_days:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Date range must be ordered and shorter than {max_days} days.",
+            )
@@ -0,0 +1,129 @@
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from course_web_service.apps.user_app.schemas import UserReturnData
+from course_web_service.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PrincipalCacheBackend(ABC):
+    """Абстрактное хранилище для кэша пользователей по токену."""
+
+    @abstractmethod
+    async def get(self, key: str) -> UserReturnData | None:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: UserReturnData, ttl: float) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        pass
+
+
+class InMemoryPrincipalCacheBackend(PrincipalCacheBackend):
+    """LRU-кэш в памяти процесса с TTL для каждой записи."""
+
+    def __init__(self, maxsize: int = settings.auth_settings.principal_cache_maxsize):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float, UserReturnData]] = OrderedDict()
+
+    async def get(self, key: str) -> UserReturnData | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: UserReturnData, ttl: float) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisPrincipalCacheBackend(PrincipalCacheBackend):
+    """Общий для всех воркеров кэш в Redis."""
+
+    key_prefix = "principal:"
+
+    def __init__(self, url: str):
+        try:
+            from redis import asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("Redis principal cache requires the 'redis' package.") from e
+        self._client = redis.from_url(url)
+
+    async def get(self, key: str) -> UserReturnData | None:
+        raw = await self._client.get(self.key_prefix + key)
+        return UserReturnData.model_validate_json(raw) if raw else None
+
+    async def set(self, key: str, value: UserReturnData, ttl: float) -> None:
+        await self._client.set(self.key_prefix + key, value.model_dump_json(), px=int(ttl * 1000))
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self.key_prefix + key)
+
+
+class PrincipalCache:
+    """Кэш текущих пользователей по `sub` токена со счетчиками попаданий."""
+
+    def __init__(
+        self,
+        backend: PrincipalCacheBackend,
+        ttl: int = settings.auth_settings.principal_cache_ttl,
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, sub: str) -> UserReturnData | None:
+        """Возвращает пользователя из кэша или None."""
+        user = await self.backend.get(sub)
+        if user is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return user
+
+    async def set(self, sub: str, user: UserReturnData, expires_at: float | None = None) -> None:
+        """Кладет пользователя в кэш не дольше, чем живет токен."""
+        ttl = float(self.ttl)
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        if ttl > 0:
+            await self.backend.set(sub, user, ttl)
+
+    async def invalidate(self, sub: str) -> None:
+        """Удаляет пользователя из кэша."""
+        await self.backend.delete(sub)
+
+    def metrics(self) -> dict:
+        """Возвращает счетчики попаданий и промахов."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def build_principal_cache_backend() -> PrincipalCacheBackend:
+    """Выбирает хранилище кэша по настройкам."""
+    if settings.auth_settings.principal_cache_redis_url:
+        logger.info("Using Redis principal cache backend.")
+        return RedisPrincipalCacheBackend(settings.auth_settings.principal_cache_redis_url)
+    return InMemoryPrincipalCacheBackend()
+
+
+principal_cache = PrincipalCache(backend=build_principal_cache_backend())
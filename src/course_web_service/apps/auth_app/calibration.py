@@ -0,0 +1,98 @@
+import argparse
+import secrets
+import statistics
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from course_web_service.apps.auth_app.hashing import SUPPORTED_SCHEMES, build_crypt_context
+from course_web_service.core.settings import settings
+
+BCRYPT_ROUNDS = range(10, 17)
+ARGON2_TIME_COSTS = range(2, 11)
+
+
+def measure_hash_ms(samples: int = 3, **context_kwargs) -> float:
+    """Возвращает медианное время хэширования пароля (мс) с заданными параметрами."""
+    context = build_crypt_context(**context_kwargs)
+    password = secrets.token_urlsafe(16)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.hash(password)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def pick_cost(costs: Iterable[int], measure: Callable[[int], float], target_ms: float) -> int:
+    """Выбирает наибольшую стоимость, укладывающуюся в target_ms (но не ниже минимальной)."""
+    chosen = None
+    for cost in costs:
+        if chosen is not None and measure(cost) > target_ms:
+            break
+        chosen = cost
+    return chosen
+
+
+def calibrate(scheme: str, target_ms: float, samples: int = 3) -> dict[str, int]:
+    """Подбирает параметры схемы под бюджет задержки на текущем хосте."""
+    auth_settings = settings.auth_settings
+    if scheme == "argon2":
+        memory_cost = auth_settings.password_argon2_memory_cost
+        parallelism = auth_settings.password_argon2_parallelism
+        time_cost = pick_cost(
+            ARGON2_TIME_COSTS,
+            lambda cost: measure_hash_ms(
+                samples,
+                scheme="argon2",
+                argon2_time_cost=cost,
+                argon2_memory_cost=memory_cost,
+                argon2_parallelism=parallelism,
+            ),
+            target_ms,
+        )
+        return {
+            "password_hash_scheme": scheme,
+            "password_argon2_time_cost": time_cost,
+            "password_argon2_memory_cost": memory_cost,
+            "password_argon2_parallelism": parallelism,
+        }
+    rounds = pick_cost(
+        BCRYPT_ROUNDS,
+        lambda cost: measure_hash_ms(samples, scheme="bcrypt", bcrypt_rounds=cost),
+        target_ms,
+    )
+    return {"password_hash_scheme": scheme, "password_bcrypt_rounds": rounds}
+
+
+def update_env_file(path: Path, values: dict[str, object]) -> None:
+    """Записывает значения в env-файл, заменяя существующие ключи."""
+    lines = path.read_text().splitlines() if path.exists() else []
+    pending = {key.upper(): value for key, value in values.items()}
+    for index, line in enumerate(lines):
+        key = line.split("=", 1)[0].strip()
+        if key in pending:
+            lines[index] = f"{key}={pending.pop(key)}"
+    lines.extend(f"{key}={value}" for key, value in pending.items())
+    path.write_text("\n".join(lines) + "\n")
+
+
+def calibrate_password_hash():
+    """Подбирает стоимость хэширования паролей под целевую задержку на этом хосте."""
+    parser = argparse.ArgumentParser(description="Calibrate password hashing cost.")
+    parser.add_argument(
+        "--scheme", choices=SUPPORTED_SCHEMES, default=settings.auth_settings.password_hash_scheme
+    )
+    parser.add_argument(
+        "--target-ms", type=float, default=settings.auth_settings.password_hash_target_ms
+    )
+    parser.add_argument("--samples", type=int, default=3)
+    parser.add_argument("--env-file", type=Path, default=None)
+    args = parser.parse_args()
+
+    values = calibrate(args.scheme, args.target_ms, args.samples)
+    values["password_hash_target_ms"] = int(args.target_ms)
+    for key, value in values.items():
+        print(f"{key.upper()}={value}")
+    if args.env_file is not None:
+        update_env_file(args.env_file, values)
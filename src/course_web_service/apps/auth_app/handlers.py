@@ -1,10 +1,15 @@
+import hashlib
 import logging
+import time
+import uuid
 from datetime import UTC, datetime, timedelta
 
 import jwt
 from fastapi import HTTPException, status
-from passlib.context import CryptContext
 
+from course_web_service.apps.auth_app.hashing import needs_rehash, password_hasher, pwd_context
+from course_web_service.apps.auth_app.schemas import RefreshTokenRecord
+from course_web_service.core.metrics import record_timing
 from course_web_service.core.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -14,16 +19,25 @@ class AuthHandler:
     """Класс для обработки аутентификации: хэширование паролей, создание и валидация токенов."""
 
     secret = settings.auth_settings.secret_key.get_secret_value()
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    pwd_context = pwd_context
+    hasher = password_hasher
     algorithm = settings.auth_settings.algorithm
 
     async def get_password_hash(self, password: str) -> str:
         """Хэширует пароль."""
-        return self.pwd_context.hash(password)
+        return await self.hasher.hash(password)
 
     async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Проверяет, соответствует ли пароль хэшу."""
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return await self.hasher.verify(plain_password, hashed_password)
+
+    async def verify_dummy_password(self, plain_password: str) -> bool:
+        """Выполняет проверку пароля вхолостую, чтобы выровнять время ответа."""
+        return await self.hasher.verify_dummy(plain_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Проверяет, что хэш нужно пересчитать с текущими параметрами стоимости."""
+        return needs_rehash(hashed_password)
 
     async def create_access_token(self, data: dict, expires_delta: timedelta | None = None):
         """Создает access-токен."""
@@ -37,21 +51,24 @@ class AuthHandler:
 
     async def decode_token(self, token: str, token_type_for_logger: str) -> dict:
         """Декодирует access-токен."""
+        start = time.perf_counter()
         try:
             payload = jwt.decode(token, self.secret, algorithms=[self.algorithm])
             return payload
         except jwt.ExpiredSignatureError:
-            logger.warning(f"{token_type_for_logger} token has expired.")
+            logger.warning("%s token has expired.", token_type_for_logger)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Token has expired.",
             ) from None
         except jwt.InvalidTokenError:
-            logger.warning(f"Invalid {token_type_for_logger} token.")
+            logger.warning("Invalid %s token.", token_type_for_logger)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token.",
             ) from None
+        finally:
+            record_timing("jwt", time.perf_counter() - start)
 
     async def create_refresh_token(self, data: dict, expires_delta: timedelta | None = None) -> str:
         """Создает refresh-токен."""
@@ -63,6 +80,22 @@ class AuthHandler:
             )
         return await self._create_token(data=data, expire=expire)
 
+    async def issue_refresh_token(self, email: str) -> tuple[str, RefreshTokenRecord]:
+        """Создает refresh-токен с уникальным jti и запись для хранения в БД."""
+        jti = uuid.uuid4()
+        expire = datetime.now(UTC) + timedelta(
+            days=settings.auth_settings.refresh_token_expire_days
+        )
+        token = await self._create_token(data={"sub": email, "jti": str(jti)}, expire=expire)
+        return token, RefreshTokenRecord(
+            jti=jti, token_hash=self.hash_token(token), expires_at=expire
+        )
+
+    @staticmethod
+    def hash_token(token: str) -> str:
+        """Возвращает SHA-256 токена: в БД не хранится сам токен."""
+        return hashlib.sha256(token.encode()).hexdigest()
+
     async def _create_token(
         self,
         data: dict,
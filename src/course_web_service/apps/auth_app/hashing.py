@@ -0,0 +1,157 @@
+import asyncio
+import functools
+import logging
+import secrets
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from course_web_service.core.metrics import record_timing
+from course_web_service.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_SCHEMES = ("bcrypt", "argon2")
+
+
+def build_crypt_context(
+    scheme: str = settings.auth_settings.password_hash_scheme,
+    bcrypt_rounds: int = settings.auth_settings.password_bcrypt_rounds,
+    argon2_time_cost: int = settings.auth_settings.password_argon2_time_cost,
+    argon2_memory_cost: int = settings.auth_settings.password_argon2_memory_cost,
+    argon2_parallelism: int = settings.auth_settings.password_argon2_parallelism,
+) -> CryptContext:
+    """Собирает контекст: новые хэши в scheme, хэши других схем и параметров помечаются к замене."""
+    if scheme not in SUPPORTED_SCHEMES:
+        raise RuntimeError(f"Unsupported password hash scheme: {scheme}.")
+    schemes = ["bcrypt"]
+    if scheme == "argon2":
+        try:
+            import argon2  # noqa: F401
+        except ImportError as e:
+            raise RuntimeError("Argon2 password hashing requires the 'argon2-cffi' package.") from e
+        # Старые bcrypt-хэши продолжают проверяться и заменяются argon2 при входе.
+        schemes = ["argon2", "bcrypt"]
+    return CryptContext(
+        schemes=schemes,
+        deprecated="auto",
+        bcrypt__rounds=bcrypt_rounds,
+        bcrypt__min_rounds=bcrypt_rounds,
+        bcrypt__max_rounds=bcrypt_rounds,
+        argon2__time_cost=argon2_time_cost,
+        argon2__memory_cost=argon2_memory_cost,
+        argon2__parallelism=argon2_parallelism,
+    )
+
+
+# Единственный контекст хэширования в приложении; воркеры пула создают его при импорте.
+pwd_context = build_crypt_context()
+
+
+def _hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Проверяет, что хэш создан другой схемой или с другими параметрами стоимости."""
+    return pwd_context.needs_update(hashed_password)
+
+
+@functools.cache
+def _dummy_hash() -> str:
+    return pwd_context.hash(secrets.token_urlsafe(16))
+
+
+def _verify_dummy(plain_password: str) -> bool:
+    pwd_context.verify(plain_password, _dummy_hash())
+    return False
+
+
+class PasswordHasher:
+    """Выполняет хэширование паролей в ограниченном пуле воркеров вне event loop."""
+
+    def __init__(
+        self,
+        max_workers: int = settings.auth_settings.password_hash_workers,
+        use_processes: bool = settings.auth_settings.password_hash_use_processes,
+        queue_limit: int = settings.auth_settings.password_hash_queue_limit,
+    ) -> None:
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.queue_limit = queue_limit
+        self._executor: Executor | None = None
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    @property
+    def executor(self) -> Executor:
+        """Создает пул воркеров при первом обращении (после fork процесса)."""
+        if self._executor is None:
+            executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            self._executor = executor_class(max_workers=self.max_workers)
+        return self._executor
+
+    async def hash(self, password: str) -> str:
+        """Хэширует пароль в пуле воркеров."""
+        return await self._run(_hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Проверяет пароль в пуле воркеров."""
+        return await self._run(_verify_password, plain_password, hashed_password)
+
+    async def verify_dummy(self, plain_password: str) -> bool:
+        """Проверяет пароль по фиктивному хэшу той же стоимости; всегда False.
+
+        Ответ для несуществующего email занимает столько же времени, сколько для существующего.
+        """
+        return await self._run(_verify_dummy, plain_password)
+
+    async def _run(self, func, *args):
+        if self._pending >= self.queue_limit:
+            self._rejected += 1
+            logger.warning("Password hashing queue is full (%s pending).", self._pending)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, try again later.",
+            )
+        self._pending += 1
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            self._pending -= 1
+            elapsed = time.perf_counter() - start
+            record_timing("hash", elapsed)
+            self._completed += 1
+            self._latency_total += elapsed
+            self._latency_max = max(self._latency_max, elapsed)
+
+    def metrics(self) -> dict:
+        """Возвращает глубину очереди и задержку хэширования."""
+        return {
+            "pending": self._pending,
+            "queue_depth": max(0, self._pending - self.max_workers),
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "latency_avg": self._latency_total / self._completed if self._completed else 0.0,
+            "latency_max": self._latency_max,
+        }
+
+    def shutdown(self) -> None:
+        """Останавливает пул воркеров."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,135 @@
+import logging
+import uuid
+from datetime import datetime
+
+from fastapi import Depends
+from sqlalchemy import Row, delete, func, insert, literal, select, update
+
+from course_web_service.apps.auth_app.schemas import RefreshTokenRecord
+from course_web_service.core.core_dependecy.db_dependency import DBDependency, get_db
+from course_web_service.database.models.user import RefreshToken
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshTokenManager:
+    """Класс для хранения, ротации и отзыва refresh-токенов."""
+
+    def __init__(
+        self, model: type[RefreshToken] = RefreshToken, db: DBDependency = Depends(get_db)
+    ) -> None:
+        """Инициализирует менеджер refresh-токенов."""
+        self.db = db
+        self.model = model
+
+    async def create(self, user_id: uuid.UUID, record: RefreshTokenRecord) -> None:
+        """Сохраняет первый токен новой сессии (семейство токенов начинается с него)."""
+        async with self.db.db_session() as session:
+            await session.execute(
+                insert(self.model).values(
+                    id=record.jti,
+                    user_id=user_id,
+                    family_id=record.jti,
+                    refresh_token=record.token_hash,
+                    expires_at=record.expires_at,
+                )
+            )
+            await session.commit()
+
+    def rotate_query(self, jti: uuid.UUID, token_hash: str, new: RefreshTokenRecord):
+        """Отзывает действующий токен и выдает следующий в том же семействе одним запросом."""
+        rotated = (
+            update(self.model)
+            .where(
+                self.model.id == jti,
+                self.model.refresh_token == token_hash,
+                self.model.revoked_at.is_(None),
+                self.model.expires_at > func.now(),
+            )
+            .values(revoked_at=func.now())
+            .returning(self.model.user_id, self.model.family_id)
+            .cte("rotated")
+        )
+        return (
+            insert(self.model)
+            .from_select(
+                ["id", "user_id", "family_id", "refresh_token", "expires_at"],
+                select(
+                    literal(new.jti, self.model.id.type),
+                    rotated.c.user_id,
+                    rotated.c.family_id,
+                    literal(new.token_hash, self.model.refresh_token.type),
+                    literal(new.expires_at, self.model.expires_at.type),
+                ),
+            )
+            .returning(self.model.user_id)
+        )
+
+    async def rotate(self, jti: uuid.UUID, token_hash: str, new: RefreshTokenRecord) -> bool:
+        """Заменяет токен следующим; False, если токен уже отозван, истек или неизвестен."""
+        async with self.db.db_session() as session:
+            result = await session.execute(self.rotate_query(jti, token_hash, new))
+            rotated = result.first() is not None
+            await session.commit()
+            return rotated
+
+    async def get_token(self, jti: uuid.UUID) -> RefreshToken | None:
+        """Возвращает запись токена по jti."""
+        async with self.db.db_session() as session:
+            return await session.get(self.model, jti)
+
+    def revoke_family_query(self, jti: uuid.UUID):
+        """Отзывает все еще действующие токены семейства, к которому относится jti."""
+        family = select(self.model.family_id).where(self.model.id == jti).scalar_subquery()
+        return (
+            update(self.model)
+            .where(self.model.family_id == family, self.model.revoked_at.is_(None))
+            .values(revoked_at=func.now())
+            .returning(self.model.id, self.model.expires_at)
+        )
+
+    async def revoke_family(self, jti: uuid.UUID) -> list[Row]:
+        """Отзывает семейство токена; возвращает (jti, expires_at) отозванных записей."""
+        async with self.db.db_session() as session:
+            result = await session.execute(self.revoke_family_query(jti))
+            rows = result.all()
+            await session.commit()
+            return rows
+
+    def revoked_since_query(self, since: datetime | None):
+        """Строит запрос отозванных и еще не истекших токенов, начиная с since."""
+        query = select(self.model.id, self.model.expires_at, self.model.revoked_at).where(
+            self.model.revoked_at.is_not(None), self.model.expires_at > func.now()
+        )
+        if since is not None:
+            query = query.where(self.model.revoked_at >= since)
+        return query.order_by(self.model.revoked_at)
+
+    async def get_revoked_since(self, since: datetime | None) -> list[Row]:
+        """Возвращает (jti, expires_at, revoked_at) токенов, отозванных начиная с since."""
+        async with self.db.db_session() as session:
+            result = await session.execute(self.revoked_since_query(since))
+            return result.all()
+
+    def purge_expired_query(self, batch_size: int):
+        """Удаляет пачку истекших токенов, пропуская строки, заблокированные другими."""
+        expired = (
+            select(self.model.id)
+            .where(self.model.expires_at < func.now())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        return delete(self.model).where(self.model.id.in_(expired.scalar_subquery()))
+
+    async def purge_expired(self, batch_size: int) -> int:
+        """Удаляет истекшие токены пачками по batch_size, каждая в своей транзакции."""
+        total = 0
+        while True:
+            async with self.db.db_session() as session:
+                result = await session.execute(self.purge_expired_query(batch_size))
+                await session.commit()
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                break
+        logger.info("Purged %s expired refresh tokens", total)
+        return total
@@ -0,0 +1,204 @@
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from fastapi import HTTPException, status
+
+from course_web_service.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimit:
+    """Параметры token bucket: емкость и скорость пополнения в минуту."""
+
+    def __init__(self, burst: int, per_minute: float) -> None:
+        self.burst = burst
+        self.interval = 60.0 / per_minute
+
+    @property
+    def horizon(self) -> float:
+        """Через сколько секунд полностью восстанавливается пустое ведро."""
+        return self.burst * self.interval
+
+
+class RateLimiterBackend(ABC):
+    """Абстрактное хранилище состояния ведер.
+
+    Ведро хранится одним числом (GCRA): моментом, когда оно снова станет полным.
+    """
+
+    @abstractmethod
+    async def hit(self, key: str, limit: RateLimit) -> float:
+        """Списывает токен; возвращает 0 или число секунд до следующей разрешенной попытки."""
+
+
+class InMemoryRateLimiterBackend(RateLimiterBackend):
+    """Ведра в памяти процесса; полные ведра удаляются колесом таймеров с шагом в секунду.
+
+    При переполнении вытесняется ведро, к которому дольше всего не обращались.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = settings.auth_settings.login_rate_limit_maxsize,
+        wheel_size: int = 3600,
+    ) -> None:
+        self.maxsize = maxsize
+        self.evicted = 0
+        self._full_at: OrderedDict[str, float] = OrderedDict()
+        self._wheel: list[set[str]] = [set() for _ in range(wheel_size)]
+        self._cursor = int(time.monotonic())
+
+    async def hit(self, key: str, limit: RateLimit) -> float:
+        now = time.monotonic()
+        self._expire(now)
+        full_at = self._full_at.get(key)
+        if full_at is not None:
+            self._full_at.move_to_end(key)
+        full_at = max(full_at or now, now) + limit.interval
+        allowed_at = full_at - limit.horizon
+        if now < allowed_at:
+            return allowed_at - now
+        self._full_at[key] = full_at
+        self._schedule(key, full_at)
+        while len(self._full_at) > self.maxsize:
+            # Ключ вытесненного ведра остается в колесе; _expire его пропустит.
+            self._full_at.popitem(last=False)
+            self.evicted += 1
+        return 0.0
+
+    def _schedule(self, key: str, full_at: float) -> None:
+        slot = min(int(full_at), self._cursor + len(self._wheel) - 1)
+        self._wheel[slot % len(self._wheel)].add(key)
+
+    def _expire(self, now: float) -> None:
+        """Удаляет ведра, ставшие полными; ключ мог быть перепланирован в более поздний слот."""
+        current = int(now)
+        steps = min(current - self._cursor, len(self._wheel))
+        for step in range(steps):
+            index = (self._cursor + step) % len(self._wheel)
+            keys, self._wheel[index] = self._wheel[index], set()
+            for key in keys:
+                full_at = self._full_at.get(key)
+                if full_at is None:
+                    continue
+                if full_at <= now:
+                    del self._full_at[key]
+                else:
+                    self._schedule(key, full_at)
+        self._cursor = max(self._cursor, current)
+
+    def __len__(self) -> int:
+        return len(self._full_at)
+
+
+class RedisRateLimiterBackend(RateLimiterBackend):
+    """Общие для всех воркеров ведра в Redis; истекают через PX."""
+
+    key_prefix = "login_rate:"
+    script = """
+    local now = tonumber(ARGV[1])
+    local interval = tonumber(ARGV[2])
+    local horizon = tonumber(ARGV[3])
+    local full_at = math.max(tonumber(redis.call('GET', KEYS[1]) or now), now) + interval
+    local allowed_at = full_at - horizon
+    if now < allowed_at then
+        return tostring(allowed_at - now)
+    end
+    redis.call('SET', KEYS[1], tostring(full_at), 'PX', math.ceil((full_at - now) * 1000))
+    return '0'
+    """
+
+    def __init__(self, url: str):
+        try:
+            from redis import asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("Redis login rate limiter requires the 'redis' package.") from e
+        self._client = redis.from_url(url)
+        self._hit = self._client.register_script(self.script)
+
+    async def hit(self, key: str, limit: RateLimit) -> float:
+        retry_after = await self._hit(
+            keys=[self.key_prefix + key], args=[time.time(), limit.interval, limit.horizon]
+        )
+        return float(retry_after)
+
+
+class LoginRateLimiter:
+    """Ограничивает попытки входа по IP и по email до обращения к БД и bcrypt."""
+
+    def __init__(
+        self,
+        backend: RateLimiterBackend,
+        per_email: RateLimit,
+        per_ip: RateLimit,
+        enabled: bool = settings.auth_settings.login_rate_limit_enabled,
+    ) -> None:
+        self.backend = backend
+        self.per_email = per_email
+        self.per_ip = per_ip
+        self.enabled = enabled
+        self.allowed = 0
+        self.rejected = 0
+        self.backend_errors = 0
+
+    async def check(self, email: str, client_ip: str | None) -> None:
+        """Списывает попытку; при исчерпании лимита отвечает 429 с Retry-After."""
+        if not self.enabled:
+            return
+        checks = [(f"email:{email.strip().lower()}", self.per_email)]
+        if client_ip:
+            checks.insert(0, (f"ip:{client_ip}", self.per_ip))
+        for key, limit in checks:
+            try:
+                retry_after = await self.backend.hit(key, limit)
+            except Exception as e:
+                # Недоступность общего хранилища не должна закрывать вход.
+                self.backend_errors += 1
+                logger.error("Login rate limiter backend failed: %s", e)
+                return
+            if retry_after > 0:
+                self.rejected += 1
+                logger.warning("Login rate limit exceeded for %s", key)
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many login attempts, try again later.",
+                    headers={"Retry-After": str(math.ceil(retry_after))},
+                )
+        self.allowed += 1
+
+    def metrics(self) -> dict:
+        """Возвращает счетчики пропущенных и отклоненных попыток."""
+        metrics = {
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "backend_errors": self.backend_errors,
+        }
+        if isinstance(self.backend, InMemoryRateLimiterBackend):
+            metrics["tracked_keys"] = len(self.backend)
+            metrics["evicted"] = self.backend.evicted
+        return metrics
+
+
+def build_rate_limiter_backend() -> RateLimiterBackend:
+    """Выбирает хранилище лимитера по настройкам."""
+    if settings.auth_settings.login_rate_limit_redis_url:
+        logger.info("Using Redis login rate limiter backend.")
+        return RedisRateLimiterBackend(settings.auth_settings.login_rate_limit_redis_url)
+    return InMemoryRateLimiterBackend()
+
+
+login_rate_limiter = LoginRateLimiter(
+    backend=build_rate_limiter_backend(),
+    per_email=RateLimit(
+        burst=settings.auth_settings.login_rate_email_burst,
+        per_minute=settings.auth_settings.login_rate_email_per_minute,
+    ),
+    per_ip=RateLimit(
+        burst=settings.auth_settings.login_rate_ip_burst,
+        per_minute=settings.auth_settings.login_rate_ip_per_minute,
+    ),
+)
@@ -0,0 +1,98 @@
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from course_web_service.apps.auth_app.manager import RefreshTokenManager
+from course_web_service.core.core_dependecy.db_dependency import DBDependency
+from course_web_service.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Отзыв фиксируется с now() начала транзакции, а виден после коммита: перечитываем с запасом.
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+class RevokedTokens:
+    """Множество отозванных jti в памяти воркера, периодически дополняемое из БД."""
+
+    def __init__(self, interval_s: int = settings.auth_settings.refresh_revocation_sync_interval_s):
+        self.interval_s = interval_s
+        self.hits = 0
+        self.syncs = 0
+        self.failed_syncs = 0
+        self._jtis: dict[uuid.UUID, float] = {}
+        self._synced_until: datetime | None = None
+        self._db: DBDependency | None = None
+        self._task: asyncio.Task | None = None
+
+    def is_revoked(self, jti: uuid.UUID) -> bool:
+        """Проверяет jti без обращения к БД."""
+        if jti in self._jtis:
+            self.hits += 1
+            return True
+        return False
+
+    def add(self, jti: uuid.UUID, expires_at: datetime) -> None:
+        """Запоминает отозванный jti до истечения срока действия токена."""
+        self._jtis[jti] = expires_at.timestamp()
+
+    def prune(self) -> None:
+        """Забывает jti истекших токенов: их отвергнет проверка срока действия JWT."""
+        now = time.time()
+        self._jtis = {jti: exp for jti, exp in self._jtis.items() if exp > now}
+
+    async def sync(self) -> int:
+        """Дочитывает из БД токены, отозванные другими воркерами."""
+        if self._db is None:
+            return 0
+        since = self._synced_until - SYNC_OVERLAP if self._synced_until else None
+        try:
+            rows = await RefreshTokenManager(db=self._db).get_revoked_since(since)
+        except Exception as e:
+            self.failed_syncs += 1
+            logger.error("Failed to sync revoked refresh tokens: %s", e, exc_info=True)
+            return 0
+        for jti, expires_at, revoked_at in rows:
+            self.add(jti, expires_at)
+            if self._synced_until is None or revoked_at > self._synced_until:
+                self._synced_until = revoked_at
+        self.prune()
+        self.syncs += 1
+        return len(rows)
+
+    def start(self, db: DBDependency) -> None:
+        """Запускает периодическую синхронизацию."""
+        if self.interval_s <= 0 or self._task is not None:
+            return
+        self._db = db
+        self._task = asyncio.create_task(self._run(), name="refresh-revocation-sync")
+
+    async def stop(self) -> None:
+        """Останавливает фоновую синхронизацию."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def metrics(self) -> dict:
+        """Возвращает размер множества и счетчики синхронизаций."""
+        return {
+            "size": len(self._jtis),
+            "hits": self.hits,
+            "syncs": self.syncs,
+            "failed_syncs": self.failed_syncs,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await self.sync()
+            await asyncio.sleep(self.interval_s)
+
+
+revoked_tokens = RevokedTokens()
@@ -1,6 +1,6 @@
 import logging
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from course_web_service.apps.auth_app.schemas import Token
@@ -27,11 +27,16 @@ async def registration(
 
 @auth_router.post(path="/token", response_model=Token)
 async def login_for_access_token(
+    request: Request,
+    background_tasks: BackgroundTasks,
     form_data: OAuth2PasswordRequestForm = Depends(),
     service: AuthService = Depends(AuthService),
 ) -> dict:
-    """Создает access- и refresh-токены для пользователя."""
-    return await service.login_for_access_token(form_data=form_data)
+    """Создает access- и refresh-токены для пользователя (с ограничением частоты попыток)."""
+    client_ip = request.client.host if request.client else None
+    return await service.login_for_access_token(
+        form_data=form_data, client_ip=client_ip, background_tasks=background_tasks
+    )
 
 
 @auth_router.post("/refresh", response_model=Token)
@@ -39,5 +44,15 @@ async def refresh_access_token(
     refresh_token: str,
     service: AuthService = Depends(AuthService),
 ):
-    """Обновляет access-токен с помощью refresh-токена."""
+    """Выдает новую пару токенов; предъявленный refresh-токен больше не действителен."""
     return await service.refresh_access_token(refresh_token=refresh_token)
+
+
+@auth_router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    refresh_token: str,
+    service: AuthService = Depends(AuthService),
+):
+    """Завершает сессию, отзывая refresh-токен."""
+    await service.revoke_refresh_token(refresh_token=refresh_token)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,3 +1,6 @@
+import uuid
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
 
@@ -7,3 +10,11 @@ class Token(BaseModel):
     access_token: str = Field(..., description="JWT токен для аутентификации.")
     refresh_token: str = Field(..., description="Токен для обновления access-токена.")
     token_type: str = Field(..., description="Тип токена (обычно 'bearer').")
+
+
+class RefreshTokenRecord(BaseModel):
+    """Схема записи о выданном refresh-токене."""
+
+    jti: uuid.UUID
+    token_hash: str = Field(..., description="SHA-256 токена в hex.")
+    expires_at: datetime
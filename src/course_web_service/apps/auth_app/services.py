@@ -1,15 +1,24 @@
 import logging
+import uuid
+from datetime import UTC, datetime
 
-from fastapi import Depends, HTTPException, status
+from fastapi import BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 
+from course_web_service.apps.auth_app.cache import principal_cache
 from course_web_service.apps.auth_app.enums import JWTTokenTypeForLogging
 from course_web_service.apps.auth_app.handlers import AuthHandler
+from course_web_service.apps.auth_app.manager import RefreshTokenManager
+from course_web_service.apps.auth_app.ratelimit import login_rate_limiter
+from course_web_service.apps.auth_app.revocation import revoked_tokens
+from course_web_service.apps.user_app.enums import PRIVILEGED_ROLE_NAMES, DefaultUserRole
 from course_web_service.apps.user_app.manager import UserManager
+from course_web_service.apps.user_app.roles import role_registry
 from course_web_service.apps.user_app.schemas import (
     CreateUser,
     GetUserByEmail,
     RegisterUser,
+    UserInDB,
     UserReturnData,
 )
 
@@ -23,49 +32,89 @@ class AuthService:
         self,
         manager: UserManager = Depends(UserManager),
         auth: AuthHandler = Depends(AuthHandler),
+        tokens: RefreshTokenManager = Depends(RefreshTokenManager),
     ):
         """Инициализирует сервис аутентификации."""
         self.auth = auth
         self.manager = manager
+        self.tokens = tokens
 
     async def register_user(self, user: RegisterUser) -> UserReturnData:
         """Регистрирует нового пользователя."""
-        logger.info(f"Starting registration for user: {user.email}")
+        logger.info("Starting registration for user: %s", user.email)
         try:
             hashed_password = await self.auth.get_password_hash(user.password)
-            new_user = CreateUser(email=user.email, hashed_password=hashed_password)
+            new_user = CreateUser(
+                email=user.email,
+                hashed_password=hashed_password,
+                role_id=role_registry.id_by_name(DefaultUserRole.USER.value),
+            )
 
             return await self.manager.create_user(user=new_user)
         except Exception as e:
-            logger.error(f"Failed to register user {user.email}: {e}", exc_info=True)
+            logger.error("Failed to register user %s: %s", user.email, e, exc_info=True)
             raise
 
-    async def authenticate_user(self, auth_for_user: RegisterUser) -> UserReturnData:
-        """Аутентифицирует пользователя."""
-        logger.info(f"Authenticating user: {auth_for_user.email}")
+    async def authenticate_user(
+        self, auth_for_user: RegisterUser, background_tasks: BackgroundTasks | None = None
+    ) -> UserReturnData:
+        """Аутентифицирует пользователя; устаревший хэш пароля пересчитывается после ответа."""
+        logger.info("Authenticating user: %s", auth_for_user.email)
         try:
-            user = await self.manager.get_user_by_email(GetUserByEmail(email=auth_for_user.email))
-            if not user or not await self.auth.verify_password(
+            user = await self._find_user(auth_for_user.email)
+            if user is None:
+                await self.auth.verify_dummy_password(auth_for_user.password)
+            if user is None or not await self.auth.verify_password(
                 auth_for_user.password, user.hashed_password
             ):
-                logger.warning(f"Authentication failed for user: {auth_for_user.email}")
+                logger.warning("Authentication failed for user: %s", auth_for_user.email)
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Incorrect email or password.",
                 )
-            logger.info(f"User {auth_for_user.email} authenticated successfully.")
-
-            return UserReturnData(**user.model_dump())
+            logger.info("User %s authenticated successfully.", auth_for_user.email)
+            if self.auth.needs_rehash(user.hashed_password):
+                if background_tasks is None:
+                    await self._rehash_password(user, auth_for_user.password)
+                else:
+                    background_tasks.add_task(self._rehash_password, user, auth_for_user.password)
+
+            return user.to_return_data()
         except Exception as e:
             logger.error(
-                f"Error during authentication for user {auth_for_user.email}: {e}", exc_info=True
+                "Error during authentication for user %s: %s", auth_for_user.email, e, exc_info=True
             )
             raise
 
+    async def _rehash_password(self, user: UserInDB, password: str) -> None:
+        """Сохраняет хэш с текущими параметрами; ошибка не влияет на вход пользователя."""
+        try:
+            new_hash = await self.auth.get_password_hash(password)
+            if await self.manager.update_password_hash(user.id, user.hashed_password, new_hash):
+                logger.info("Password hash of user %s upgraded.", user.email)
+        except Exception as e:
+            logger.warning("Failed to rehash password of user %s: %s", user.email, e)
+
+    @staticmethod
+    def _is_privileged(
+        current_user: UserReturnData, allowed: frozenset[str] = PRIVILEGED_ROLE_NAMES
+    ) -> bool:
+        """Проверяет, что роль пользователя входит в allowed (по умолчанию admin или manager)."""
+        return bool(current_user.role) and current_user.role.name.lower() in allowed
+
+    async def _find_user(self, email: str) -> UserInDB | None:
+        """Возвращает пользователя по email или None, не раскрывая причину отказа клиенту."""
+        try:
+            return await self.manager.get_user_by_email(GetUserByEmail(email=email))
+        except HTTPException as e:
+            if e.status_code != status.HTTP_404_NOT_FOUND:
+                raise
+            return None
+
     async def get_current_user(self, token: str) -> UserReturnData:
         """Возвращает текущего пользователя по токену."""
         payload = await self.auth.decode_token(
-            token=token.access_token, token_type_for_logger=JWTTokenTypeForLogging.ACCESS.value
+            token=token, token_type_for_logger=JWTTokenTypeForLogging.ACCESS.value
         )
         email = payload.get("sub")
         if not email:
@@ -73,19 +122,29 @@ class AuthService:
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token.",
             )
-        user = await self.manager.get_user_by_email(GetUserByEmail(email=email))
+        current_user = await principal_cache.get(email)
+        if current_user is None:
+            user = await self.manager.get_user_by_email(GetUserByEmail(email=email))
+            current_user = user.to_return_data()
+            await principal_cache.set(email, current_user, expires_at=payload.get("exp"))
 
-        return UserReturnData(**user.model_dump())
+        return current_user
 
     async def login_for_access_token(
-        self, form_data: OAuth2PasswordRequestForm = Depends()
+        self,
+        form_data: OAuth2PasswordRequestForm = Depends(),
+        client_ip: str | None = None,
+        background_tasks: BackgroundTasks | None = None,
     ) -> dict:
-        """Создает access- и refresh-токены для пользователя."""
+        """Создает access- и refresh-токены; лимит попыток проверяется до БД и bcrypt."""
+        await login_rate_limiter.check(email=form_data.username, client_ip=client_ip)
         user = await self.authenticate_user(
-            RegisterUser(email=form_data.username, password=form_data.password)
+            RegisterUser(email=form_data.username, password=form_data.password),
+            background_tasks=background_tasks,
         )
         access_token = await self.auth.create_access_token(data={"sub": user.email})
-        refresh_token = await self.auth.create_refresh_token(data={"sub": user.email})
+        refresh_token, record = await self.auth.issue_refresh_token(user.email)
+        await self.tokens.create(user_id=user.id, record=record)
 
         return {
             "access_token": access_token,
@@ -94,21 +153,59 @@ class AuthService:
         }
 
     async def refresh_access_token(self, refresh_token: str):
-        """Обновляет access-токен с помощью refresh-токена."""
-        payload = await self.auth.decode_token(
-            refresh_token, token_type_for_logger=JWTTokenTypeForLogging.REFRESH.value
-        )
-        email = payload.get("sub")
-        if not email:
+        """Выдает новую пару токенов, отзывая предъявленный refresh-токен (ротация)."""
+        email, jti, payload = await self._decode_refresh_token(refresh_token)
+        if revoked_tokens.is_revoked(jti):
+            await self._handle_reuse(jti, email)
+
+        new_refresh_token, record = await self.auth.issue_refresh_token(email)
+        if not await self.tokens.rotate(jti, self.auth.hash_token(refresh_token), record):
+            stored = await self.tokens.get_token(jti)
+            if stored is not None and stored.revoked_at is not None:
+                await self._handle_reuse(jti, email)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token.",
             )
+        revoked_tokens.add(jti, datetime.fromtimestamp(payload["exp"], tz=UTC))
 
         access_token = await self.auth.create_access_token(data={"sub": email})
-
         return {
             "access_token": access_token,
-            "refresh_token": refresh_token,
+            "refresh_token": new_refresh_token,
             "token_type": "bearer",
         }
+
+    async def revoke_refresh_token(self, refresh_token: str) -> None:
+        """Завершает сессию: отзывает refresh-токен и все токены, выданные вместе с ним."""
+        _, jti, _ = await self._decode_refresh_token(refresh_token)
+        await self._revoke_family(jti)
+
+    async def _decode_refresh_token(self, refresh_token: str) -> tuple[str, uuid.UUID, dict]:
+        payload = await self.auth.decode_token(
+            refresh_token, token_type_for_logger=JWTTokenTypeForLogging.REFRESH.value
+        )
+        email = payload.get("sub")
+        try:
+            jti = uuid.UUID(payload.get("jti"))
+        except (TypeError, ValueError):
+            jti = None
+        if not email or jti is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token.",
+            )
+        return email, jti, payload
+
+    async def _revoke_family(self, jti: uuid.UUID) -> None:
+        for revoked_jti, expires_at in await self.tokens.revoke_family(jti):
+            revoked_tokens.add(revoked_jti, expires_at)
+
+    async def _handle_reuse(self, jti: uuid.UUID, email: str) -> None:
+        """Повторное предъявление отозванного токена: отзываем всю сессию."""
+        logger.warning("Refresh token reuse detected for user %s, revoking session.", email)
+        await self._revoke_family(jti)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token reuse detected.",
+        )
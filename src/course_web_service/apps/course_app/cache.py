@@ -0,0 +1,36 @@
+from collections import OrderedDict
+
+from course_web_service.core.settings import settings
+
+
+class OutlineCache:
+    """LRU-кэш сериализованных программ курсов, привязанный к ETag."""
+
+    def __init__(self, maxsize: int = settings.course_settings.outline_cache_maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[int, tuple[str, bytes]] = OrderedDict()
+
+    def get(self, course_id: int, etag: str) -> bytes | None:
+        """Возвращает тело ответа, только если оно соответствует текущей версии курса."""
+        item = self._data.get(course_id)
+        if item is None or item[0] != etag:
+            self.misses += 1
+            return None
+        self._data.move_to_end(course_id)
+        self.hits += 1
+        return item[1]
+
+    def set(self, course_id: int, etag: str, body: bytes) -> None:
+        self._data[course_id] = (etag, body)
+        self._data.move_to_end(course_id)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def metrics(self) -> dict:
+        """Возвращает размер кэша и счетчики попаданий."""
+        return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+outline_cache = OutlineCache()
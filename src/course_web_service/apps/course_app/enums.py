@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class CourseSort(Enum):
+    NEWEST = "newest"
+    PRICE_ASC = "price_asc"
+    PRICE_DESC = "price_desc"
+    RATING = "rating"
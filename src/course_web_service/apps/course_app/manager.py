@@ -0,0 +1,145 @@
+import logging
+
+from fastapi import Depends
+from sqlalchemy import Row, distinct, func, or_, select, tuple_
+from sqlalchemy.orm import joinedload
+
+from course_web_service.apps.course_app.enums import CourseSort
+from course_web_service.apps.course_app.schemas import CourseListItem, CourseSearchItem
+from course_web_service.core.core_dependecy.db_dependency import DBDependency, get_db
+from course_web_service.database.models.course import SEARCH_CONFIG, Course, Lesson, Topic
+
+logger = logging.getLogger(__name__)
+
+
+class CourseManager:
+    """Класс для чтения курсов из базы данных."""
+
+    def __init__(self, model: type[Course] = Course, db: DBDependency = Depends(get_db)) -> None:
+        """Инициализирует менеджер курсов."""
+        self.db = db
+        self.model = model
+
+    def keyset(self, sort: CourseSort) -> tuple[tuple, bool]:
+        """Возвращает колонки ключа пагинации и признак сортировки по убыванию."""
+        if sort is CourseSort.NEWEST:
+            return (self.model.created_at, self.model.id), True
+        if sort is CourseSort.RATING:
+            return (self.model.rating_avg, self.model.id), True
+        return (self.model.price, self.model.id), sort is CourseSort.PRICE_DESC
+
+    def card_columns(self) -> tuple:
+        """Колонки карточки курса; все они входят в индексы страниц каталога."""
+        return (
+            self.model.id,
+            self.model.title,
+            self.model.price,
+            self.model.curator_id,
+            self.model.created_at,
+            self.model.rating_avg,
+            self.model.rating_count,
+        )
+
+    def list_courses_query(self, sort: CourseSort, limit: int, after: tuple | None = None):
+        """Строит запрос страницы каталога, которую покрывает составной индекс по ключу."""
+        columns, descending = self.keyset(sort)
+        query = select(*self.card_columns())
+        if after is not None:
+            position = tuple_(*columns)
+            query = query.where(
+                position < tuple_(*after) if descending else position > tuple_(*after)
+            )
+        order_by = [column.desc() if descending else column.asc() for column in columns]
+        return query.order_by(*order_by).limit(limit)
+
+    async def list_courses(
+        self, sort: CourseSort, limit: int, after: tuple | None = None
+    ) -> list[CourseListItem]:
+        """Возвращает до limit карточек курсов, следующих за позицией after."""
+        async with self.db.db_session() as session:
+            result = await session.execute(self.list_courses_query(sort, limit, after))
+            return [CourseListItem.model_validate(row) for row in result.all()]
+
+    def search_courses_query(self, text: str, limit: int, after: tuple | None = None):
+        """Строит запрос поиска: tsvector курса и уроков по GIN, похожие названия по триграммам."""
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, text)
+        lesson_hits = (
+            select(
+                Topic.course_id.label("course_id"),
+                func.max(func.ts_rank(Lesson.search_vector, ts_query)).label("rank"),
+            )
+            .join(Lesson, Lesson.topic_id == Topic.id)
+            .where(Lesson.search_vector.bool_op("@@")(ts_query))
+            .group_by(Topic.course_id)
+            .subquery()
+        )
+        rank = func.greatest(
+            func.ts_rank(self.model.search_vector, ts_query),
+            func.coalesce(lesson_hits.c.rank, 0),
+            func.similarity(self.model.title, text),
+        )
+        query = (
+            select(*self.card_columns(), rank.label("rank"))
+            .outerjoin(lesson_hits, lesson_hits.c.course_id == self.model.id)
+            .where(
+                or_(
+                    self.model.search_vector.bool_op("@@")(ts_query),
+                    lesson_hits.c.course_id.is_not(None),
+                    self.model.title.bool_op("%")(text),
+                )
+            )
+        )
+        if after is not None:
+            query = query.where(tuple_(rank, self.model.id) < tuple_(*after))
+        return query.order_by(rank.desc(), self.model.id.desc()).limit(limit)
+
+    async def search_courses(
+        self, text: str, limit: int, after: tuple | None = None
+    ) -> list[CourseSearchItem]:
+        """Возвращает до limit найденных курсов по убыванию релевантности."""
+        async with self.db.db_session() as session:
+            result = await session.execute(self.search_courses_query(text, limit, after))
+            return [CourseSearchItem.model_validate(row) for row in result.all()]
+
+    def outline_version_query(self, course_id: int):
+        """Строит запрос версии программы курса: последние изменения и число тем и уроков."""
+        return (
+            select(
+                self.model.updated_at,
+                func.max(Topic.updated_at),
+                func.max(Lesson.updated_at),
+                func.count(distinct(Topic.id)),
+                func.count(Lesson.id),
+            )
+            .select_from(self.model)
+            .outerjoin(Topic, Topic.course_id == self.model.id)
+            .outerjoin(Lesson, Lesson.topic_id == Topic.id)
+            .where(self.model.id == course_id)
+            .group_by(self.model.id)
+        )
+
+    def outline_query(self, course_id: int):
+        """Строит запрос дерева курса: курс, темы и уроки одним запросом с двумя JOIN."""
+        return (
+            select(self.model)
+            .where(self.model.id == course_id)
+            .options(
+                joinedload(self.model.topics)
+                .joinedload(Topic.lessons)
+                .load_only(
+                    Lesson.id, Lesson.topic_id, Lesson.title, Lesson.order, Lesson.updated_at
+                )
+            )
+        )
+
+    async def get_outline_version(self, course_id: int) -> Row | None:
+        """Возвращает версию программы курса или None, если курса нет."""
+        async with self.db.db_session() as session:
+            result = await session.execute(self.outline_version_query(course_id))
+            return result.first()
+
+    async def get_outline(self, course_id: int) -> Course | None:
+        """Загружает курс с упорядоченными темами и уроками одним запросом."""
+        async with self.db.db_session() as session:
+            result = await session.execute(self.outline_query(course_id))
+            return result.unique().scalars().first()
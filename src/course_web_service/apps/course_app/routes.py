@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+
+from course_web_service.apps.course_app.enums import CourseSort
+from course_web_service.apps.course_app.schemas import (
+    CourseOutline,
+    CoursePage,
+    CourseSearchPage,
+)
+from course_web_service.apps.course_app.services import CourseService
+
+course_router = APIRouter(prefix="/courses", tags=["courses"])
+
+
+@course_router.get("", response_model=CoursePage)
+async def list_courses(
+    sort: CourseSort = CourseSort.NEWEST,
+    cursor: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    service: CourseService = Depends(CourseService),
+):
+    """Возвращает страницу каталога курсов (keyset-пагинация по курсору)."""
+    return await service.list_courses(sort=sort, cursor=cursor, limit=limit)
+
+
+@course_router.get("/search", response_model=CourseSearchPage)
+async def search_courses(
+    q: str = Query(..., min_length=2, max_length=200),
+    cursor: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    service: CourseService = Depends(CourseService),
+):
+    """Ищет курсы по названию, описанию и урокам; результаты упорядочены по релевантности."""
+    return await service.search_courses(text=q, cursor=cursor, limit=limit)
+
+
+@course_router.get(
+    "/{course_id}/outline",
+    response_model=CourseOutline,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Программа курса не изменилась."}},
+)
+async def read_course_outline(
+    course_id: int,
+    if_none_match: str | None = Header(None),
+    service: CourseService = Depends(CourseService),
+):
+    """Возвращает программу курса (темы и уроки по порядку) с ETag для условных запросов."""
+    etag, body = await service.get_outline(course_id=course_id, if_none_match=if_none_match)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if body is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
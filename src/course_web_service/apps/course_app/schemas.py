@@ -0,0 +1,81 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+
+class CourseListItem(BaseModel):
+    """Схема карточки курса в каталоге."""
+
+    id: int
+    title: str
+    price: Decimal
+    curator_id: int
+    created_at: datetime
+    rating_avg: Decimal = Field(Decimal(0), description="Средняя оценка курса.")
+    rating_count: int = Field(0, description="Количество отзывов.")
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_serializer("created_at")
+    def serialize_datetime(self, value: datetime) -> str:
+        return value.isoformat()
+
+
+class CoursePage(BaseModel):
+    """Схема страницы каталога курсов."""
+
+    items: list[CourseListItem]
+    next_cursor: str | None = Field(
+        None, description="Курсор следующей страницы; отсутствует на последней странице."
+    )
+
+
+class CourseSearchItem(CourseListItem):
+    """Схема найденного курса с оценкой релевантности."""
+
+    rank: float
+
+
+class CourseSearchPage(BaseModel):
+    """Схема страницы результатов поиска курсов."""
+
+    items: list[CourseSearchItem]
+    next_cursor: str | None = Field(
+        None, description="Курсор следующей страницы; отсутствует на последней странице."
+    )
+
+
+class LessonOutline(BaseModel):
+    """Схема урока в программе курса (без содержимого)."""
+
+    id: uuid.UUID
+    title: str
+    order: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TopicOutline(BaseModel):
+    """Схема темы в программе курса."""
+
+    id: int
+    title: str
+    order: int
+    lessons: list[LessonOutline]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CourseOutline(BaseModel):
+    """Схема программы курса: темы и уроки по порядку."""
+
+    id: int
+    title: str
+    description: str
+    price: Decimal
+    curator_id: int
+    topics: list[TopicOutline]
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,141 @@
+import hashlib
+import logging
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from fastapi import Depends, HTTPException, status
+
+from course_web_service.apps.course_app.cache import outline_cache
+from course_web_service.apps.course_app.enums import CourseSort
+from course_web_service.apps.course_app.manager import CourseManager
+from course_web_service.apps.course_app.schemas import (
+    CourseListItem,
+    CourseOutline,
+    CoursePage,
+    CourseSearchPage,
+)
+from course_web_service.core.pagination import decode_cursor, encode_cursor
+from course_web_service.database.models.course import Course
+
+logger = logging.getLogger(__name__)
+
+
+class CourseService:
+    """Класс для работы с каталогом курсов."""
+
+    def __init__(self, manager: CourseManager = Depends(CourseManager)) -> None:
+        """Инициализирует сервис курсов."""
+        self.manager = manager
+
+    async def list_courses(self, sort: CourseSort, cursor: str | None, limit: int) -> CoursePage:
+        """Возвращает страницу каталога и курсор следующей страницы."""
+        after = self._parse_cursor(sort, cursor) if cursor else None
+        items = await self.manager.list_courses(sort=sort, limit=limit + 1, after=after)
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(sort.value, self._cursor_values(sort, items[-1]))
+        return CoursePage(items=items, next_cursor=next_cursor)
+
+    async def search_courses(self, text: str, cursor: str | None, limit: int) -> CourseSearchPage:
+        """Возвращает страницу результатов поиска и курсор следующей страницы."""
+        cursor_scope = self._search_cursor_scope(text)
+        after = None
+        if cursor:
+            try:
+                rank, course_id = decode_cursor(cursor, cursor_scope)
+                after = float(rank), int(course_id)
+            except (ValueError, TypeError):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor."
+                ) from None
+
+        items = await self.manager.search_courses(text=text, limit=limit + 1, after=after)
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(cursor_scope, [items[-1].rank, items[-1].id])
+        return CourseSearchPage(items=items, next_cursor=next_cursor)
+
+    @staticmethod
+    def _search_cursor_scope(text: str) -> str:
+        """Привязывает курсор к тексту запроса, чтобы его нельзя было применить к другому."""
+        return "search:" + hashlib.sha256(text.encode()).hexdigest()[:16]
+
+    async def get_outline(
+        self, course_id: int, if_none_match: str | None = None
+    ) -> tuple[str, bytes | None]:
+        """Возвращает ETag и JSON программы курса; тело None, если у клиента актуальная версия."""
+        version = await self.manager.get_outline_version(course_id)
+        if version is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Course not found.")
+
+        etag = self._outline_etag(course_id, *version)
+        if if_none_match and self._etag_matches(if_none_match, etag):
+            return etag, None
+
+        body = outline_cache.get(course_id, etag)
+        if body is None:
+            course = await self.manager.get_outline(course_id)
+            if course is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Course not found."
+                )
+            etag = self._outline_etag(course_id, *self._tree_version(course))
+            body = CourseOutline.model_validate(course).model_dump_json().encode()
+            outline_cache.set(course_id, etag, body)
+        return etag, body
+
+    @staticmethod
+    def _tree_version(course: Course) -> tuple:
+        lessons = [lesson for topic in course.topics for lesson in topic.lessons]
+        return (
+            course.updated_at,
+            max((topic.updated_at for topic in course.topics), default=None),
+            max((lesson.updated_at for lesson in lessons), default=None),
+            len(course.topics),
+            len(lessons),
+        )
+
+    @staticmethod
+    def _outline_etag(
+        course_id: int,
+        course_updated_at: datetime,
+        topics_updated_at: datetime | None,
+        lessons_updated_at: datetime | None,
+        topics_count: int,
+        lessons_count: int,
+    ) -> str:
+        """ETag программы: последнее изменение в дереве и число тем и уроков (учет удалений)."""
+        updated_at = max(
+            value for value in (course_updated_at, topics_updated_at, lessons_updated_at) if value
+        )
+        version = f"{course_id}:{updated_at.isoformat()}:{topics_count}:{lessons_count}"
+        return f'"{hashlib.sha256(version.encode()).hexdigest()[:32]}"'
+
+    @staticmethod
+    def _etag_matches(if_none_match: str, etag: str) -> bool:
+        candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+        return "*" in candidates or etag in candidates
+
+    @staticmethod
+    def _cursor_values(sort: CourseSort, item: CourseListItem) -> list:
+        if sort is CourseSort.NEWEST:
+            return [item.created_at.isoformat(), item.id]
+        if sort is CourseSort.RATING:
+            return [str(item.rating_avg), item.id]
+        return [str(item.price), item.id]
+
+    @staticmethod
+    def _parse_cursor(sort: CourseSort, cursor: str) -> tuple:
+        values = decode_cursor(cursor, sort.value)
+        try:
+            key, course_id = values
+            if sort is CourseSort.NEWEST:
+                return datetime.fromisoformat(key), int(course_id)
+            return Decimal(key), int(course_id)
+        except (ValueError, TypeError, InvalidOperation):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor."
+            ) from None
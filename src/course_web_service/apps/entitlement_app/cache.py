@@ -0,0 +1,62 @@
+import time
+import uuid
+from collections import OrderedDict
+
+from course_web_service.core.settings import settings
+
+
+class EntitlementCache:
+    """LRU-кэш курсов, купленных пользователем, с TTL; отсутствие курса в наборе не кэшируется."""
+
+    def __init__(
+        self,
+        maxsize: int = settings.entitlement_settings.entitlement_cache_maxsize,
+        ttl: int = settings.entitlement_settings.entitlement_cache_ttl,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._data: OrderedDict[uuid.UUID, tuple[float, frozenset[int]]] = OrderedDict()
+
+    def get(self, user_id: uuid.UUID) -> frozenset[int] | None:
+        """Возвращает купленные курсы пользователя или None, если записи нет или она устарела."""
+        item = self._data.get(user_id)
+        if item is None or item[0] <= time.monotonic():
+            self._data.pop(user_id, None)
+            self.misses += 1
+            return None
+        self._data.move_to_end(user_id)
+        self.hits += 1
+        return item[1]
+
+    def version(self) -> int:
+        """Номер поколения: снимается до чтения из БД и передается в set."""
+        return self.invalidations
+
+    def set(self, user_id: uuid.UUID, course_ids: frozenset[int], version: int) -> None:
+        """Кладет набор в кэш, если за время чтения из БД не было новых покупок."""
+        if version != self.invalidations:
+            return
+        self._data[user_id] = (time.monotonic() + self.ttl, course_ids)
+        self._data.move_to_end(user_id)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        """Сбрасывает запись пользователя после новой покупки."""
+        self.invalidations += 1
+        self._data.pop(user_id, None)
+
+    def metrics(self) -> dict:
+        """Возвращает размер кэша и счетчики попаданий."""
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+entitlement_cache = EntitlementCache()
@@ -0,0 +1,31 @@
+import logging
+import uuid
+
+from fastapi import Depends
+from sqlalchemy import select
+
+from course_web_service.core.core_dependecy.db_dependency import DBDependency, get_db
+from course_web_service.database.models.payment import Purchase
+
+logger = logging.getLogger(__name__)
+
+
+class EntitlementManager:
+    """Класс для чтения покупок курсов из базы данных."""
+
+    def __init__(
+        self, model: type[Purchase] = Purchase, db: DBDependency = Depends(get_db)
+    ) -> None:
+        """Инициализирует менеджер прав доступа."""
+        self.db = db
+        self.model = model
+
+    def owned_courses_query(self, user_id: uuid.UUID):
+        """Строит запрос купленных курсов; его покрывает индекс (user_id, course_id)."""
+        return select(self.model.course_id).where(self.model.user_id == user_id).distinct()
+
+    async def get_owned_courses(self, user_id: uuid.UUID) -> frozenset[int]:
+        """Возвращает идентификаторы всех курсов, купленных пользователем."""
+        async with self.db.db_session() as session:
+            result = await session.execute(self.owned_courses_query(user_id))
+            return frozenset(result.scalars().all())
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends, Query
+
+from course_web_service.apps.auth_app.security import oauth2_scheme
+from course_web_service.apps.entitlement_app.schemas import EntitlementCheck
+from course_web_service.apps.entitlement_app.services import EntitlementService
+
+entitlement_router = APIRouter(prefix="/entitlements", tags=["entitlements"])
+
+
+@entitlement_router.get("", response_model=EntitlementCheck)
+async def check_entitlements(
+    course_id: list[int] = Query(..., min_length=1, max_length=100),
+    service: EntitlementService = Depends(EntitlementService),
+    token: str = Depends(oauth2_scheme),
+):
+    """Возвращает, какие из переданных курсов куплены текущим пользователем."""
+    return await service.check_many(token=token, course_ids=course_id)
@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+
+class EntitlementCheck(BaseModel):
+    """Схема ответа на проверку доступа к нескольким курсам."""
+
+    owned: list[int] = Field(..., description="Курсы из запроса, купленные пользователем.")
@@ -0,0 +1,62 @@
+import logging
+import uuid
+from collections.abc import Iterable
+
+from fastapi import Depends, HTTPException, status
+
+from course_web_service.apps.auth_app.handlers import AuthHandler
+from course_web_service.apps.auth_app.manager import RefreshTokenManager
+from course_web_service.apps.auth_app.services import AuthService
+from course_web_service.apps.entitlement_app.cache import entitlement_cache
+from course_web_service.apps.entitlement_app.manager import EntitlementManager
+from course_web_service.apps.entitlement_app.schemas import EntitlementCheck
+from course_web_service.apps.user_app.manager import UserManager
+
+logger = logging.getLogger(__name__)
+
+
+class EntitlementService(AuthService):
+    """Класс для проверки, купил ли пользователь курс."""
+
+    def __init__(
+        self,
+        entitlements: EntitlementManager = Depends(EntitlementManager),
+        manager: UserManager = Depends(UserManager),
+        auth: AuthHandler = Depends(AuthHandler),
+        tokens: RefreshTokenManager = Depends(RefreshTokenManager),
+    ):
+        """Инициализирует сервис прав доступа."""
+        super().__init__(manager=manager, auth=auth, tokens=tokens)
+        self.entitlements = entitlements
+
+    async def owned_courses(
+        self, user_id: uuid.UUID, required: Iterable[int] = ()
+    ) -> frozenset[int]:
+        """Возвращает купленные курсы пользователя; кэшу верит, только если в нем все required.
+
+        Кэш локален для воркера, а покупку сбрасывает только воркер, принявший webhook,
+        поэтому отсутствие курса в кэше перепроверяется в БД.
+        """
+        course_ids = entitlement_cache.get(user_id)
+        if course_ids is None or not course_ids.issuperset(required):
+            version = entitlement_cache.version()
+            course_ids = await self.entitlements.get_owned_courses(user_id)
+            entitlement_cache.set(user_id, course_ids, version)
+        return course_ids
+
+    async def has_access(self, user_id: uuid.UUID, course_id: int) -> bool:
+        """Проверяет, купил ли пользователь курс."""
+        return course_id in await self.owned_courses(user_id, required=(course_id,))
+
+    async def check_access(self, user_id: uuid.UUID, course_id: int) -> None:
+        """Запрещает доступ к материалам некупленного курса."""
+        if not await self.has_access(user_id, course_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Course is not purchased."
+            )
+
+    async def check_many(self, token: str, course_ids: list[int]) -> EntitlementCheck:
+        """Отвечает, какие из курсов куплены текущим пользователем, за одно обращение."""
+        current_user = await self.get_current_user(token=token)
+        owned = await self.owned_courses(current_user.id, required=course_ids)
+        return EntitlementCheck(owned=[course_id for course_id in course_ids if course_id in owned])
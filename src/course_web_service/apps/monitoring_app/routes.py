@@ -0,0 +1,40 @@
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.responses import PlainTextResponse
+
+from course_web_service.core.metrics import metrics_registry
+from course_web_service.core.settings import settings
+
+LOOPBACK_HOSTS = frozenset({"127.0.0.1", "::1", "localhost"})
+
+monitoring_router = APIRouter(tags=["monitoring"])
+
+
+def verify_metrics_access(request: Request, authorization: str | None = Header(None)) -> None:
+    """Пускает к метрикам по токену из настроек, а без токена только с локального адреса."""
+    token = settings.monitoring_settings.metrics_token
+    if token is None:
+        if request.client is None or request.client.host not in LOOPBACK_HOSTS:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden.")
+        return
+    expected = f"Bearer {token.get_secret_value()}"
+    if not authorization or not hmac.compare_digest(expected, authorization):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@monitoring_router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+    dependencies=[Depends(verify_metrics_access)],
+)
+async def metrics() -> PlainTextResponse:
+    """Возвращает метрики процесса в формате Prometheus."""
+    return PlainTextResponse(
+        metrics_registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
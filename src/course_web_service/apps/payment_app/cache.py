@@ -0,0 +1,34 @@
+from collections import OrderedDict
+
+from course_web_service.core.settings import settings
+
+
+class SeenTransactions:
+    """LRU недавно обработанных уведомлений (transaction_id, статус) для ответа без БД."""
+
+    def __init__(self, maxsize: int = settings.payment_settings.payment_seen_cache_size):
+        self.maxsize = maxsize
+        self.hits = 0
+        self._data: OrderedDict[tuple[str, str], None] = OrderedDict()
+
+    def seen(self, transaction_id: str, status: str) -> bool:
+        """Проверяет, обрабатывалось ли уже такое уведомление."""
+        key = (transaction_id, status)
+        if key not in self._data:
+            return False
+        self._data.move_to_end(key)
+        self.hits += 1
+        return True
+
+    def add(self, transaction_id: str, status: str) -> None:
+        self._data[(transaction_id, status)] = None
+        self._data.move_to_end((transaction_id, status))
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def metrics(self) -> dict:
+        """Возвращает размер кэша и число ответов без обращения к БД."""
+        return {"size": len(self._data), "hits": self.hits}
+
+
+seen_transactions = SeenTransactions()
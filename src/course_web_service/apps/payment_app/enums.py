@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class PaymentStatus(Enum):
+    PENDING = "ожидание"
+    PAID = "оплачено"
+    FAILED = "отклонено"
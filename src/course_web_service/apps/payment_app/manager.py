@@ -0,0 +1,87 @@
+import logging
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+
+from course_web_service.apps.entitlement_app.cache import entitlement_cache
+from course_web_service.apps.payment_app.enums import PaymentStatus
+from course_web_service.apps.payment_app.schemas import PaymentWebhook
+from course_web_service.core.core_dependecy.db_dependency import DBDependency, get_db
+from course_web_service.database.models.payment import Payment, Purchase
+
+logger = logging.getLogger(__name__)
+
+
+class PaymentManager:
+    """Класс для записи платежей и покупок."""
+
+    def __init__(self, model: type[Payment] = Payment, db: DBDependency = Depends(get_db)) -> None:
+        """Инициализирует менеджер платежей."""
+        self.db = db
+        self.model = model
+
+    def insert_payment_query(self, event: PaymentWebhook):
+        """Создает платеж, если transaction_id еще не встречался; иначе не возвращает строк."""
+        return (
+            pg_insert(self.model)
+            .values(
+                user_id=event.user_id,
+                course_id=event.course_id,
+                amount=event.amount,
+                payment_method=event.payment_method,
+                transaction_id=event.transaction_id,
+                status=event.status.value,
+            )
+            .on_conflict_do_nothing(index_elements=[self.model.transaction_id])
+            .returning(self.model.id)
+        )
+
+    def settle_payment_query(self, event: PaymentWebhook):
+        """Переводит ожидающий платеж в итоговый статус; повторный перевод не находит строк."""
+        return (
+            update(self.model)
+            .where(
+                self.model.transaction_id == event.transaction_id,
+                self.model.status == PaymentStatus.PENDING.value,
+            )
+            .values(status=event.status.value)
+            .returning(self.model.user_id, self.model.course_id, self.model.amount)
+        )
+
+    async def record_webhook(self, event: PaymentWebhook) -> bool:
+        """Применяет уведомление (False — повтор); оплата создает покупку в той же транзакции."""
+        async with self.db.db_session() as session:
+            try:
+                purchase = None
+                inserted = (await session.execute(self.insert_payment_query(event))).scalar()
+                if inserted is not None:
+                    changed = True
+                    if event.status is PaymentStatus.PAID:
+                        purchase = (event.user_id, event.course_id, event.amount)
+                elif event.status is not PaymentStatus.PENDING:
+                    settled = (await session.execute(self.settle_payment_query(event))).first()
+                    changed = settled is not None
+                    if changed and event.status is PaymentStatus.PAID:
+                        purchase = tuple(settled)
+                else:
+                    changed = False
+
+                if purchase is not None:
+                    user_id, course_id, price = purchase
+                    await session.execute(
+                        insert(Purchase).values(user_id=user_id, course_id=course_id, price=price)
+                    )
+                await session.commit()
+            except IntegrityError:
+                logger.error("Payment %s references unknown user or course", event.transaction_id)
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail="Unknown user or course.",
+                ) from None
+
+        if purchase is not None:
+            entitlement_cache.invalidate(purchase[0])
+            logger.info("Purchase created for payment %s", event.transaction_id)
+        return changed
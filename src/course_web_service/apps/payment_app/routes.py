@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, Header, Request
+
+from course_web_service.apps.payment_app.schemas import PaymentWebhook, WebhookAck
+from course_web_service.apps.payment_app.services import PaymentService
+
+payment_router = APIRouter(prefix="/payments", tags=["payments"])
+
+
+@payment_router.post(
+    "/webhook",
+    response_model=WebhookAck,
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": PaymentWebhook.model_json_schema()}}
+        }
+    },
+)
+async def payment_webhook(
+    request: Request,
+    x_signature: str | None = Header(None),
+    service: PaymentService = Depends(PaymentService),
+):
+    """Принимает уведомление провайдера о платеже (идемпотентно по transaction_id)."""
+    return await service.handle_webhook(body=await request.body(), signature=x_signature)
@@ -0,0 +1,24 @@
+import uuid
+from decimal import Decimal
+
+from pydantic import BaseModel, Field
+
+from course_web_service.apps.payment_app.enums import PaymentStatus
+
+
+class PaymentWebhook(BaseModel):
+    """Схема уведомления платежного провайдера о платеже."""
+
+    transaction_id: str = Field(..., min_length=1, max_length=255)
+    user_id: uuid.UUID
+    course_id: int
+    amount: Decimal = Field(..., ge=0, max_digits=10, decimal_places=2)
+    payment_method: str = Field(..., min_length=1, max_length=50)
+    status: PaymentStatus
+
+
+class WebhookAck(BaseModel):
+    """Схема подтверждения приема уведомления."""
+
+    transaction_id: str
+    duplicate: bool = Field(..., description="Уведомление уже было обработано ранее.")
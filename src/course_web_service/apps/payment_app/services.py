@@ -0,0 +1,55 @@
+import hashlib
+import hmac
+import logging
+
+from fastapi import Depends, HTTPException, status
+from pydantic import ValidationError
+
+from course_web_service.apps.payment_app.cache import seen_transactions
+from course_web_service.apps.payment_app.manager import PaymentManager
+from course_web_service.apps.payment_app.schemas import PaymentWebhook, WebhookAck
+from course_web_service.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def sign_payload(body: bytes, secret: str) -> str:
+    """Подпись уведомления: HMAC-SHA256 тела запроса в hex."""
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+class PaymentService:
+    """Класс для приема уведомлений платежного провайдера."""
+
+    def __init__(self, manager: PaymentManager = Depends(PaymentManager)) -> None:
+        """Инициализирует сервис платежей."""
+        self.manager = manager
+
+    async def handle_webhook(self, body: bytes, signature: str | None) -> WebhookAck:
+        """Проверяет подпись и применяет уведомление; повторы подтверждаются без БД."""
+        self._verify_signature(body, signature)
+        try:
+            event = PaymentWebhook.model_validate_json(body)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.errors()
+            ) from None
+
+        if seen_transactions.seen(event.transaction_id, event.status.value):
+            return WebhookAck(transaction_id=event.transaction_id, duplicate=True)
+
+        changed = await self.manager.record_webhook(event)
+        seen_transactions.add(event.transaction_id, event.status.value)
+        return WebhookAck(transaction_id=event.transaction_id, duplicate=not changed)
+
+    @staticmethod
+    def _verify_signature(body: bytes, signature: str | None) -> None:
+        secret = settings.payment_settings.payment_webhook_secret
+        if secret is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Payment webhooks are not configured.",
+            )
+        expected = sign_payload(body, secret.get_secret_value())
+        if not signature or not hmac.compare_digest(expected, signature):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Bad signature.")
@@ -0,0 +1,215 @@
+import logging
+import uuid
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import Text, cast, delete, distinct, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.orm import aliased
+
+from course_web_service.apps.progress_app.schemas import CourseProgressItem
+from course_web_service.core.core_dependecy.db_dependency import DBDependency, get_db
+from course_web_service.database.models.content import CourseProgress, UserProgress
+from course_web_service.database.models.course import Course, Lesson, Topic
+
+logger = logging.getLogger(__name__)
+
+# serialization_failure и deadlock_detected: транзакцию можно безопасно повторить.
+RETRYABLE_SQLSTATES = frozenset({"40001", "40P01"})
+UPSERT_PROGRESS_ATTEMPTS = 3
+
+
+class ProgressManager:
+    """Класс для записи прогресса пользователей."""
+
+    def __init__(
+        self, model: type[UserProgress] = UserProgress, db: DBDependency = Depends(get_db)
+    ) -> None:
+        """Инициализирует менеджер прогресса."""
+        self.db = db
+        self.model = model
+
+    def upsert_query(self):
+        """INSERT ... ON CONFLICT DO UPDATE, который применяет только более новые события."""
+        query = insert(self.model)
+        excluded = query.excluded
+        return query.on_conflict_do_update(
+            constraint="uq_userprogress_user_id_assignment_id",
+            set_={
+                "lesson_id": excluded.lesson_id,
+                "status": excluded.status,
+                "score": excluded.score,
+                "feedback": excluded.feedback,
+                "completed_at": excluded.completed_at,
+                "event_at": excluded.event_at,
+                "updated_at": func.now(),
+            },
+            where=self.model.event_at < excluded.event_at,
+        ).returning(self.model.user_id, self.model.lesson_id)
+
+    def rollup_lock_query(self, user_ids: list[uuid.UUID], lesson_ids: list[uuid.UUID]):
+        """Берет advisory-блокировки пар (пользователь, курс) в одном порядке до пересчета."""
+        pairs = (
+            select(self.model.user_id, Topic.course_id)
+            .join(Lesson, Lesson.id == self.model.lesson_id)
+            .join(Topic, Topic.id == Lesson.topic_id)
+            .where(self.model.user_id.in_(user_ids), Lesson.id.in_(lesson_ids))
+            .distinct()
+            .subquery()
+        )
+        user_key = func.hashtext(cast(pairs.c.user_id, Text))
+        return select(func.pg_advisory_xact_lock(user_key, pairs.c.course_id)).order_by(
+            user_key, pairs.c.course_id
+        )
+
+    def rollup_query(
+        self,
+        user_ids: list[uuid.UUID] | None = None,
+        lesson_ids: list[uuid.UUID] | None = None,
+    ):
+        """INSERT ... SELECT сводок по курсам (с фильтром — только для затронутых пар)."""
+        lesson, topic = aliased(Lesson), aliased(Topic)
+        total_lessons = (
+            select(func.count(Lesson.id))
+            .join(Topic, Topic.id == Lesson.topic_id)
+            .where(Topic.course_id == topic.course_id)
+            .scalar_subquery()
+        )
+        summary = (
+            select(
+                self.model.user_id,
+                topic.course_id,
+                func.count(distinct(self.model.lesson_id)).filter(
+                    self.model.completed_at.is_not(None)
+                ),
+                total_lessons,
+                func.avg(self.model.score),
+                func.max(self.model.event_at),
+            )
+            .join(lesson, lesson.id == self.model.lesson_id)
+            .join(topic, topic.id == lesson.topic_id)
+            .group_by(self.model.user_id, topic.course_id)
+        )
+        if user_ids is not None:
+            affected_courses = (
+                select(Topic.course_id)
+                .join(Lesson, Lesson.topic_id == Topic.id)
+                .where(Lesson.id.in_(lesson_ids))
+            )
+            summary = summary.where(
+                self.model.user_id.in_(user_ids), topic.course_id.in_(affected_courses)
+            )
+
+        query = insert(CourseProgress).from_select(
+            [
+                CourseProgress.user_id,
+                CourseProgress.course_id,
+                CourseProgress.completed_lessons,
+                CourseProgress.total_lessons,
+                CourseProgress.average_score,
+                CourseProgress.last_activity_at,
+            ],
+            summary,
+        )
+        return query.on_conflict_do_update(
+            index_elements=[CourseProgress.user_id, CourseProgress.course_id],
+            set_={
+                "completed_lessons": query.excluded.completed_lessons,
+                "total_lessons": query.excluded.total_lessons,
+                "average_score": query.excluded.average_score,
+                "last_activity_at": query.excluded.last_activity_at,
+                "updated_at": func.now(),
+            },
+        )
+
+    async def upsert_progress(self, rows: list[dict]) -> int:
+        """Записывает строки прогресса и обновляет сводки; повторяет пачку при deadlock."""
+        # Одинаковый порядок ключей конфликта, чтобы пачки брали блокировки строк в одном порядке.
+        rows = sorted(rows, key=lambda row: (row["user_id"], row["assignment_id"]))
+        for attempt in range(1, UPSERT_PROGRESS_ATTEMPTS + 1):
+            try:
+                return await self._apply_progress(rows)
+            except DBAPIError as e:
+                if getattr(e.orig, "sqlstate", None) not in RETRYABLE_SQLSTATES:
+                    raise
+                logger.warning("Progress batch conflicted (attempt %s): %s", attempt, e.orig)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Progress batch conflicted with concurrent updates, retry later.",
+        )
+
+    async def _apply_progress(self, rows: list[dict]) -> int:
+        """Один многострочный INSERT прогресса и пересчет сводок в одной транзакции."""
+        async with self.db.db_session() as session:
+            try:
+                # С RETURNING executemany собирается в многострочный VALUES (insertmanyvalues).
+                result = await session.execute(self.upsert_query(), rows)
+            except IntegrityError:
+                logger.error("Progress batch references unknown users or assignments")
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail="Unknown user, lesson or assignment.",
+                ) from None
+            changed = result.all()
+            if changed:
+                user_ids = list({row.user_id for row in changed})
+                lesson_ids = list({row.lesson_id for row in changed})
+                # Пересчет берет снимок после ожидания блокировки и видит строки соседних пачек.
+                await session.execute(self.rollup_lock_query(user_ids, lesson_ids))
+                await session.execute(self.rollup_query(user_ids=user_ids, lesson_ids=lesson_ids))
+            await session.commit()
+        return len(changed)
+
+    async def rebuild_rollups(self) -> int:
+        """Полностью пересчитывает сводки прогресса по курсам; возвращает число сводок."""
+        async with self.db.db_session() as session:
+            await session.execute(delete(CourseProgress))
+            result = await session.execute(self.rollup_query())
+            await session.commit()
+        logger.info("Course progress rollups rebuilt: %s rows", result.rowcount)
+        return result.rowcount
+
+    @staticmethod
+    def refresh_total_lessons_query(course_ids: list[int] | None = None):
+        """UPDATE числа уроков в сводках по текущей программе курсов (только для изменившихся)."""
+        total_lessons = (
+            select(func.count(Lesson.id))
+            .join(Topic, Topic.id == Lesson.topic_id)
+            .where(Topic.course_id == CourseProgress.course_id)
+            .scalar_subquery()
+        )
+        query = (
+            update(CourseProgress)
+            .where(CourseProgress.total_lessons != total_lessons)
+            .values(total_lessons=total_lessons, updated_at=func.now())
+        )
+        if course_ids is not None:
+            query = query.where(CourseProgress.course_id.in_(course_ids))
+        return query
+
+    async def refresh_total_lessons(self, course_ids: list[int] | None = None) -> int:
+        """Обновляет число уроков в сводках после изменения программы курсов."""
+        async with self.db.db_session() as session:
+            result = await session.execute(self.refresh_total_lessons_query(course_ids))
+            await session.commit()
+        logger.info("Course progress totals refreshed: %s rows", result.rowcount)
+        return result.rowcount
+
+    async def get_dashboard(self, user_id: uuid.UUID) -> list[CourseProgressItem]:
+        """Возвращает сводки пользователя по курсам, начиная с последней активности."""
+        query = (
+            select(
+                CourseProgress.course_id,
+                Course.title.label("course_title"),
+                CourseProgress.completed_lessons,
+                CourseProgress.total_lessons,
+                CourseProgress.average_score,
+                CourseProgress.last_activity_at,
+            )
+            .join(Course, Course.id == CourseProgress.course_id)
+            .where(CourseProgress.user_id == user_id)
+            .order_by(CourseProgress.last_activity_at.desc().nulls_last())
+        )
+        async with self.db.db_session() as session:
+            result = await session.execute(query)
+            return [CourseProgressItem.model_validate(row) for row in result.all()]
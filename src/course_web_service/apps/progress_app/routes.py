@@ -0,0 +1,34 @@
+import uuid
+
+from fastapi import APIRouter, Depends
+
+from course_web_service.apps.auth_app.security import oauth2_scheme
+from course_web_service.apps.progress_app.schemas import (
+    Dashboard,
+    ProgressBatch,
+    ProgressBatchResult,
+)
+from course_web_service.apps.progress_app.services import ProgressService
+
+progress_router = APIRouter(prefix="/progress", tags=["progress"])
+dashboard_router = APIRouter(prefix="/users", tags=["progress"])
+
+
+@progress_router.post("/batch", response_model=ProgressBatchResult)
+async def ingest_progress(
+    batch: ProgressBatch,
+    service: ProgressService = Depends(ProgressService),
+    token: str = Depends(oauth2_scheme),
+):
+    """Принимает пакет событий прогресса; устаревшие события не перезаписывают новые."""
+    return await service.ingest(token=token, batch=batch)
+
+
+@dashboard_router.get("/{user_id}/dashboard", response_model=Dashboard)
+async def read_dashboard(
+    user_id: uuid.UUID,
+    service: ProgressService = Depends(ProgressService),
+    token: str = Depends(oauth2_scheme),
+):
+    """Возвращает прогресс пользователя по курсам из заранее посчитанных сводок."""
+    return await service.get_dashboard(token=token, user_id=user_id)
@@ -0,0 +1,84 @@
+import uuid
+from datetime import UTC, datetime
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    computed_field,
+    field_serializer,
+    field_validator,
+)
+
+MAX_PROGRESS_BATCH = 1000
+
+
+class ProgressEvent(BaseModel):
+    """Схема события прогресса пользователя по заданию."""
+
+    assignment_id: uuid.UUID
+    lesson_id: uuid.UUID
+    user_id: uuid.UUID | None = Field(
+        None, description="Пользователь; по умолчанию — текущий (другие — только admin/manager)."
+    )
+    status: str = Field(..., min_length=1, max_length=50)
+    score: float | None = Field(None, ge=0)
+    feedback: str | None = None
+    completed_at: datetime | None = None
+    occurred_at: datetime = Field(..., description="Время события на стороне клиента.")
+
+    @field_validator("occurred_at", "completed_at")
+    @classmethod
+    def normalize_to_utc(cls, value: datetime | None) -> datetime | None:
+        """Приводит время к UTC; время без часового пояса считается UTC."""
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=UTC)
+        return value.astimezone(UTC)
+
+
+class ProgressBatch(BaseModel):
+    """Схема пакета событий прогресса."""
+
+    events: list[ProgressEvent] = Field(..., min_length=1, max_length=MAX_PROGRESS_BATCH)
+
+
+class ProgressBatchResult(BaseModel):
+    """Схема результата приема пакета событий."""
+
+    received: int = Field(..., description="Количество событий в пакете.")
+    applied: int = Field(..., description="Количество записей прогресса, которые изменились.")
+    stale: int = Field(..., description="События, устаревшие относительно уже сохраненных.")
+
+
+class CourseProgressItem(BaseModel):
+    """Схема сводки прогресса пользователя по курсу."""
+
+    course_id: int
+    course_title: str
+    completed_lessons: int
+    total_lessons: int
+    average_score: float | None
+    last_activity_at: datetime | None
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @computed_field
+    @property
+    def completion_percent(self) -> float:
+        """Доля пройденных уроков курса в процентах."""
+        if not self.total_lessons:
+            return 0.0
+        return round(self.completed_lessons * 100 / self.total_lessons, 1)
+
+    @field_serializer("last_activity_at")
+    def serialize_datetime(self, value: datetime | None) -> str | None:
+        return value.isoformat() if value else None
+
+
+class Dashboard(BaseModel):
+    """Схема панели пользователя с прогрессом по курсам."""
+
+    user_id: uuid.UUID
+    courses: list[CourseProgressItem]
@@ -0,0 +1,91 @@
+import logging
+import uuid
+
+from fastapi import Depends, HTTPException, status
+
+from course_web_service.apps.auth_app.handlers import AuthHandler
+from course_web_service.apps.auth_app.manager import RefreshTokenManager
+from course_web_service.apps.auth_app.services import AuthService
+from course_web_service.apps.progress_app.manager import ProgressManager
+from course_web_service.apps.progress_app.schemas import (
+    Dashboard,
+    ProgressBatch,
+    ProgressBatchResult,
+    ProgressEvent,
+)
+from course_web_service.apps.user_app.manager import UserManager
+from course_web_service.apps.user_app.schemas import UserReturnData
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressService(AuthService):
+    """Класс для приема событий прогресса пользователей."""
+
+    def __init__(
+        self,
+        progress: ProgressManager = Depends(ProgressManager),
+        manager: UserManager = Depends(UserManager),
+        auth: AuthHandler = Depends(AuthHandler),
+        tokens: RefreshTokenManager = Depends(RefreshTokenManager),
+    ):
+        """Инициализирует сервис прогресса."""
+        super().__init__(manager=manager, auth=auth, tokens=tokens)
+        self.progress = progress
+
+    async def ingest(self, token: str, batch: ProgressBatch) -> ProgressBatchResult:
+        """Принимает пакет событий и записывает последнее состояние по каждому заданию."""
+        current_user = await self.get_current_user(token=token)
+        self._check_can_report(current_user, batch.events)
+
+        rows = self.collapse_events(batch.events, default_user_id=current_user.id)
+        applied = await self.progress.upsert_progress(rows)
+        logger.info("Progress batch: %s events, %s applied", len(batch.events), applied)
+        return ProgressBatchResult(
+            received=len(batch.events), applied=applied, stale=len(batch.events) - applied
+        )
+
+    async def get_dashboard(self, token: str, user_id: uuid.UUID) -> Dashboard:
+        """Возвращает прогресс пользователя по курсам (ему самому или admin/manager)."""
+        current_user = await self.get_current_user(token=token)
+        if current_user.id != user_id and not self._is_privileged(current_user):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Permission denied.",
+            )
+        return Dashboard(user_id=user_id, courses=await self.progress.get_dashboard(user_id))
+
+    @staticmethod
+    def collapse_events(events: list[ProgressEvent], default_user_id) -> list[dict]:
+        """Оставляет в пакете самое позднее событие по каждому (user_id, assignment_id)."""
+        # ON CONFLICT DO UPDATE не может изменить одну строку дважды в одном запросе.
+        latest: dict[tuple, ProgressEvent] = {}
+        for event in events:
+            key = (event.user_id or default_user_id, event.assignment_id)
+            current = latest.get(key)
+            if current is None or current.occurred_at < event.occurred_at:
+                latest[key] = event
+        return [
+            {
+                "user_id": user_id,
+                "assignment_id": assignment_id,
+                "lesson_id": event.lesson_id,
+                "status": event.status,
+                "score": event.score,
+                "feedback": event.feedback,
+                "completed_at": event.completed_at,
+                "event_at": event.occurred_at,
+            }
+            for (user_id, assignment_id), event in latest.items()
+        ]
+
+    @classmethod
+    def _check_can_report(cls, current_user: UserReturnData, events: list[ProgressEvent]) -> None:
+        """Прогресс других пользователей могут передавать только admin/manager."""
+        if all(event.user_id in (None, current_user.id) for event in events):
+            return
+        if not cls._is_privileged(current_user):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Permission denied.",
+            )
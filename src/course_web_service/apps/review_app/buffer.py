@@ -0,0 +1,116 @@
+import asyncio
+import logging
+
+from sqlalchemy import Integer, column, update, values
+
+from course_web_service.core.core_dependecy.db_dependency import DBDependency
+from course_web_service.core.settings import settings
+from course_web_service.database.models.course import Course
+
+logger = logging.getLogger(__name__)
+
+
+class RatingBuffer:
+    """Накапливает изменения агрегатов оценок и сбрасывает их в БД одним UPDATE раз в N мс."""
+
+    def __init__(self, interval_ms: int = settings.review_settings.rating_flush_interval_ms):
+        self.interval_ms = interval_ms
+        self.flushes = 0
+        self.failed_flushes = 0
+        self._pending: dict[int, list[int]] = {}
+        self._db: DBDependency | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Буфер работает, только если задан интервал и запущена фоновая задача."""
+        return self.interval_ms > 0 and self._task is not None
+
+    def add(self, course_id: int, sum_delta: int, count_delta: int) -> None:
+        """Добавляет изменение суммы и числа оценок курса."""
+        delta = self._pending.setdefault(course_id, [0, 0])
+        delta[0] += sum_delta
+        delta[1] += count_delta
+
+    def start(self, db: DBDependency) -> None:
+        """Запускает периодический сброс буфера."""
+        if self.interval_ms <= 0 or self._task is not None:
+            return
+        self._db = db
+        self._task = asyncio.create_task(self._run(), name="rating-buffer-flush")
+        logger.warning(
+            "Rating buffer is enabled: course ratings are eventually consistent, "
+            "run reconcile-ratings after an unclean shutdown."
+        )
+
+    async def stop(self) -> None:
+        """Останавливает фоновую задачу и сбрасывает накопленные изменения."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Применяет накопленные изменения одним запросом; при ошибке или отмене возвращает их."""
+        pending = {course_id: delta for course_id, delta in self._pending.items() if any(delta)}
+        self._pending = {}
+        if not pending or self._db is None:
+            return 0
+        try:
+            async with self._db.db_session() as session:
+                await session.execute(self.flush_query(pending))
+                await session.commit()
+        except asyncio.CancelledError:
+            self._restore(pending)
+            raise
+        except Exception as e:
+            self.failed_flushes += 1
+            logger.error("Failed to flush rating buffer: %s", e, exc_info=True)
+            self._restore(pending)
+            return 0
+        self.flushes += 1
+        return len(pending)
+
+    def _restore(self, pending: dict[int, list[int]]) -> None:
+        for course_id, (sum_delta, count_delta) in pending.items():
+            self.add(course_id, sum_delta, count_delta)
+
+    @staticmethod
+    def flush_query(pending: dict[int, list[int]]):
+        """UPDATE ... FROM (VALUES ...) по курсам в порядке ID, чтобы воркеры не ловили deadlock."""
+        deltas = values(
+            column("course_id", Integer),
+            column("sum_delta", Integer),
+            column("count_delta", Integer),
+            name="deltas",
+        ).data([(course_id, *pending[course_id]) for course_id in sorted(pending)])
+        return (
+            update(Course)
+            .where(Course.id == deltas.c.course_id)
+            .values(
+                rating_sum=Course.rating_sum + deltas.c.sum_delta,
+                rating_count=Course.rating_count + deltas.c.count_delta,
+                updated_at=Course.updated_at,
+            )
+        )
+
+    def metrics(self) -> dict:
+        """Возвращает число курсов в буфере и счетчики сбросов."""
+        return {
+            "pending_courses": len(self._pending),
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_ms / 1000)
+            await self.flush()
+
+
+rating_buffer = RatingBuffer()
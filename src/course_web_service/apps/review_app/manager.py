@@ -0,0 +1,241 @@
+import logging
+import uuid
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import (
+    Boolean,
+    delete,
+    exists,
+    func,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from course_web_service.apps.review_app.buffer import rating_buffer
+from course_web_service.apps.review_app.schemas import (
+    CreateReview,
+    ReviewReturnData,
+    UpdateReview,
+)
+from course_web_service.core.core_dependecy.db_dependency import DBDependency, get_db
+from course_web_service.database.models.course import Course
+from course_web_service.database.models.review import Review
+
+logger = logging.getLogger(__name__)
+
+SUBMIT_REVIEW_ATTEMPTS = 3
+
+
+class ReviewManager:
+    """Класс для управления отзывами и агрегатами оценок курсов."""
+
+    def __init__(self, model: type[Review] = Review, db: DBDependency = Depends(get_db)) -> None:
+        """Инициализирует менеджер отзывов."""
+        self.db = db
+        self.model = model
+        self.rating_buffer = rating_buffer
+
+    @staticmethod
+    def rating_delta_query(course_id: int, sum_delta: int, count_delta: int):
+        """Сдвигает сумму и число оценок курса, не меняя updated_at (программа курса та же)."""
+        return (
+            update(Course)
+            .where(Course.id == course_id)
+            .values(
+                rating_sum=Course.rating_sum + sum_delta,
+                rating_count=Course.rating_count + count_delta,
+                updated_at=Course.updated_at,
+            )
+        )
+
+    def lock_previous_rating_query(self, user_id: uuid.UUID, course_id: int):
+        """Берет прежнюю оценку пользователя с блокировкой строки до конца транзакции."""
+        return (
+            select(self.model.rating)
+            .where(self.model.user_id == user_id, self.model.course_id == course_id)
+            .with_for_update()
+        )
+
+    def submit_review_query(self, user_id: uuid.UUID, review: CreateReview):
+        """INSERT ... ON CONFLICT DO UPDATE; признак вставки берется из xmax новой версии строки."""
+        query = insert(self.model).values(user_id=user_id, **review.model_dump())
+        return query.on_conflict_do_update(
+            constraint="uq_review_user_id_course_id",
+            set_={
+                "rating": query.excluded.rating,
+                "comment": query.excluded.comment,
+                "updated_at": func.now(),
+            },
+        ).returning(
+            *self.model.__table__.columns,
+            literal_column("(xmax = 0)", Boolean).label("inserted"),
+        )
+
+    async def submit_review(
+        self, user_id: uuid.UUID, review: CreateReview
+    ) -> tuple[ReviewReturnData, bool]:
+        """Создает или заменяет отзыв пользователя на курс; возвращает отзыв и признак создания."""
+        async with self.db.db_session() as session:
+            for _ in range(SUBMIT_REVIEW_ATTEMPTS):
+                previous_rating = await session.scalar(
+                    self.lock_previous_rating_query(user_id, review.course_id)
+                )
+                try:
+                    result = await session.execute(self.submit_review_query(user_id, review))
+                except IntegrityError:
+                    logger.error("Review for missing course: %s", review.course_id)
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND, detail="Course not found."
+                    ) from None
+                row = result.mappings().one()
+                if row["inserted"] or previous_rating is not None:
+                    break
+                # Параллельный запрос успел создать отзыв: прежняя оценка неизвестна, повторяем.
+                await session.rollback()
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT, detail="Review is being changed."
+                )
+            if row["inserted"]:
+                sum_delta, count_delta = row["rating"], 1
+            else:
+                sum_delta, count_delta = row["rating"] - previous_rating, 0
+            await self._commit_with_rating_delta(session, row["course_id"], sum_delta, count_delta)
+        return ReviewReturnData(**row), row["inserted"]
+
+    def list_reviews_query(self, course_id: int, limit: int, after: tuple | None = None):
+        """Строит запрос страницы отзывов курса по индексу (course_id, created_at, id)."""
+        query = select(*self.model.__table__.columns).where(self.model.course_id == course_id)
+        if after is not None:
+            query = query.where(tuple_(self.model.created_at, self.model.id) < tuple_(*after))
+        return query.order_by(self.model.created_at.desc(), self.model.id.desc()).limit(limit)
+
+    async def list_reviews(
+        self, course_id: int, limit: int, after: tuple | None = None
+    ) -> list[ReviewReturnData]:
+        """Возвращает до limit отзывов курса, начиная с самых новых."""
+        async with self.db.db_session() as session:
+            result = await session.execute(self.list_reviews_query(course_id, limit, after))
+            return [ReviewReturnData(**row) for row in result.mappings().all()]
+
+    async def update_review(
+        self, review_id: int, course_id: int, user_id: uuid.UUID, update_data: UpdateReview
+    ) -> ReviewReturnData:
+        """Изменяет отзыв автора и переносит разницу оценок в агрегаты курса."""
+        values = update_data.model_dump(exclude_unset=True, exclude_none=True)
+        if not values:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Nothing to update."
+            )
+        async with self.db.db_session() as session:
+            old_rating = await self._lock_own_review(session, review_id, course_id, user_id)
+            query = (
+                update(self.model)
+                .where(self.model.id == review_id)
+                .values(**values)
+                .returning(*self.model.__table__.columns)
+            )
+            row = (await session.execute(query)).mappings().one()
+            await self._commit_with_rating_delta(
+                session, row["course_id"], row["rating"] - old_rating, 0
+            )
+        return ReviewReturnData(**row)
+
+    async def delete_review(self, review_id: int, course_id: int, user_id: uuid.UUID) -> None:
+        """Удаляет отзыв автора и вычитает его оценку из агрегатов курса."""
+        async with self.db.db_session() as session:
+            query = (
+                delete(self.model)
+                .where(
+                    self.model.id == review_id,
+                    self.model.course_id == course_id,
+                    self.model.user_id == user_id,
+                )
+                .returning(self.model.course_id, self.model.rating)
+            )
+            row = (await session.execute(query)).first()
+            if row is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Review not found."
+                )
+            await self._commit_with_rating_delta(session, row.course_id, -row.rating, -1)
+
+    async def reconcile_ratings(self) -> int:
+        """Пересчитывает агрегаты оценок всех курсов по отзывам и возвращает число исправлений.
+
+        Обязателен после аварийной остановки, если включен буфер оценок: его изменения теряются.
+        """
+        totals = (
+            select(
+                self.model.course_id,
+                func.sum(self.model.rating).label("rating_sum"),
+                func.count().label("rating_count"),
+            )
+            .group_by(self.model.course_id)
+            .subquery()
+        )
+        fix_reviewed = (
+            update(Course)
+            .where(
+                Course.id == totals.c.course_id,
+                or_(
+                    Course.rating_sum != totals.c.rating_sum,
+                    Course.rating_count != totals.c.rating_count,
+                ),
+            )
+            .values(
+                rating_sum=totals.c.rating_sum,
+                rating_count=totals.c.rating_count,
+                updated_at=Course.updated_at,
+            )
+        )
+        reset_unreviewed = (
+            update(Course)
+            .where(
+                or_(Course.rating_sum != 0, Course.rating_count != 0),
+                ~exists().where(self.model.course_id == Course.id),
+            )
+            .values(rating_sum=0, rating_count=0, updated_at=Course.updated_at)
+        )
+        async with self.db.db_session() as session:
+            fixed = (await session.execute(fix_reviewed)).rowcount
+            fixed += (await session.execute(reset_unreviewed)).rowcount
+            await session.commit()
+        logger.info("Course ratings reconciled: %s courses fixed", fixed)
+        return fixed
+
+    async def _commit_with_rating_delta(
+        self, session: AsyncSession, course_id: int, sum_delta: int, count_delta: int
+    ) -> None:
+        """Фиксирует изменение отзыва и агрегатов: через буфер или в той же транзакции."""
+        if not (sum_delta or count_delta):
+            await session.commit()
+        elif self.rating_buffer.enabled:
+            await session.commit()
+            self.rating_buffer.add(course_id, sum_delta, count_delta)
+        else:
+            await session.execute(self.rating_delta_query(course_id, sum_delta, count_delta))
+            await session.commit()
+
+    async def _lock_own_review(
+        self, session: AsyncSession, review_id: int, course_id: int, user_id: uuid.UUID
+    ) -> int:
+        """Блокирует отзыв автора до конца транзакции и возвращает его текущую оценку."""
+        rating = await session.scalar(
+            select(self.model.rating)
+            .where(
+                self.model.id == review_id,
+                self.model.course_id == course_id,
+                self.model.user_id == user_id,
+            )
+            .with_for_update()
+        )
+        if rating is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review not found.")
+        return rating
@@ -0,0 +1,70 @@
+from fastapi import APIRouter, Depends, Query, Response, status
+
+from course_web_service.apps.auth_app.security import oauth2_scheme
+from course_web_service.apps.review_app.schemas import (
+    ReviewPage,
+    ReviewReturnData,
+    SubmitReview,
+    UpdateReview,
+)
+from course_web_service.apps.review_app.services import ReviewService
+
+review_router = APIRouter(prefix="/courses/{course_id}/reviews", tags=["reviews"])
+
+
+@review_router.get("", response_model=ReviewPage)
+async def list_reviews(
+    course_id: int,
+    cursor: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    service: ReviewService = Depends(ReviewService),
+):
+    """Возвращает отзывы курса, начиная с самых новых (keyset-пагинация по курсору)."""
+    return await service.list_reviews(course_id=course_id, cursor=cursor, limit=limit)
+
+
+@review_router.post(
+    "",
+    response_model=ReviewReturnData,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_200_OK: {"description": "Прежний отзыв пользователя заменен."}},
+)
+async def submit_review(
+    course_id: int,
+    review: SubmitReview,
+    response: Response,
+    service: ReviewService = Depends(ReviewService),
+    token: str = Depends(oauth2_scheme),
+):
+    """Оставляет отзыв на курс; повторная отправка заменяет отзыв пользователя."""
+    review_data, created = await service.submit_review(
+        token=token, course_id=course_id, review=review
+    )
+    if not created:
+        response.status_code = status.HTTP_200_OK
+    return review_data
+
+
+@review_router.patch("/{review_id}", response_model=ReviewReturnData)
+async def update_review(
+    course_id: int,
+    review_id: int,
+    update_data: UpdateReview,
+    service: ReviewService = Depends(ReviewService),
+    token: str = Depends(oauth2_scheme),
+):
+    """Изменяет оценку или текст своего отзыва."""
+    return await service.update_review(
+        token=token, course_id=course_id, review_id=review_id, update_data=update_data
+    )
+
+
+@review_router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_review(
+    course_id: int,
+    review_id: int,
+    service: ReviewService = Depends(ReviewService),
+    token: str = Depends(oauth2_scheme),
+):
+    """Удаляет свой отзыв."""
+    await service.delete_review(token=token, course_id=course_id, review_id=review_id)
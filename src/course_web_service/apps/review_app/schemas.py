@@ -0,0 +1,51 @@
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+
+class SubmitReview(BaseModel):
+    """Схема отзыва, отправляемого пользователем."""
+
+    rating: int = Field(..., ge=1, le=5, description="Оценка курса от 1 до 5.")
+    comment: str = Field(..., min_length=1, max_length=5000)
+
+
+class CreateReview(SubmitReview):
+    """Схема для записи отзыва на курс в базу данных."""
+
+    course_id: int
+
+
+class UpdateReview(BaseModel):
+    """Схема для изменения отзыва."""
+
+    rating: int | None = Field(None, ge=1, le=5, description="Оценка курса от 1 до 5.")
+    comment: str | None = Field(None, min_length=1, max_length=5000)
+
+
+class ReviewReturnData(BaseModel):
+    """Схема для возврата отзыва."""
+
+    id: int
+    user_id: uuid.UUID
+    course_id: int
+    rating: int
+    comment: str
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_serializer("created_at", "updated_at")
+    def serialize_datetime(self, value: datetime) -> str:
+        return value.isoformat()
+
+
+class ReviewPage(BaseModel):
+    """Схема страницы отзывов курса."""
+
+    items: list[ReviewReturnData]
+    next_cursor: str | None = Field(
+        None, description="Курсор следующей страницы; отсутствует на последней странице."
+    )
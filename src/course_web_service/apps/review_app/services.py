@@ -0,0 +1,84 @@
+import logging
+from datetime import datetime
+
+from fastapi import Depends, HTTPException, status
+
+from course_web_service.apps.auth_app.handlers import AuthHandler
+from course_web_service.apps.auth_app.manager import RefreshTokenManager
+from course_web_service.apps.auth_app.services import AuthService
+from course_web_service.apps.review_app.manager import ReviewManager
+from course_web_service.apps.review_app.schemas import (
+    CreateReview,
+    ReviewPage,
+    ReviewReturnData,
+    SubmitReview,
+    UpdateReview,
+)
+from course_web_service.apps.user_app.manager import UserManager
+from course_web_service.core.pagination import decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+
+class ReviewService(AuthService):
+    """Класс для работы с отзывами на курсы."""
+
+    def __init__(
+        self,
+        reviews: ReviewManager = Depends(ReviewManager),
+        manager: UserManager = Depends(UserManager),
+        auth: AuthHandler = Depends(AuthHandler),
+        tokens: RefreshTokenManager = Depends(RefreshTokenManager),
+    ):
+        """Инициализирует сервис отзывов."""
+        super().__init__(manager=manager, auth=auth, tokens=tokens)
+        self.reviews = reviews
+
+    async def submit_review(
+        self, token: str, course_id: int, review: SubmitReview
+    ) -> tuple[ReviewReturnData, bool]:
+        """Создает отзыв текущего пользователя или заменяет его прежний отзыв на курс."""
+        current_user = await self.get_current_user(token=token)
+        return await self.reviews.submit_review(
+            user_id=current_user.id,
+            review=CreateReview(course_id=course_id, **review.model_dump()),
+        )
+
+    async def update_review(
+        self, token: str, course_id: int, review_id: int, update_data: UpdateReview
+    ) -> ReviewReturnData:
+        """Изменяет отзыв текущего пользователя на курс."""
+        current_user = await self.get_current_user(token=token)
+        return await self.reviews.update_review(
+            review_id=review_id,
+            course_id=course_id,
+            user_id=current_user.id,
+            update_data=update_data,
+        )
+
+    async def delete_review(self, token: str, course_id: int, review_id: int) -> None:
+        """Удаляет отзыв текущего пользователя на курс."""
+        current_user = await self.get_current_user(token=token)
+        await self.reviews.delete_review(
+            review_id=review_id, course_id=course_id, user_id=current_user.id
+        )
+
+    async def list_reviews(self, course_id: int, cursor: str | None, limit: int) -> ReviewPage:
+        """Возвращает страницу отзывов курса и курсор следующей страницы."""
+        scope = f"reviews:{course_id}"
+        after = None
+        if cursor:
+            try:
+                created_at, review_id = decode_cursor(cursor, scope)
+                after = datetime.fromisoformat(created_at), int(review_id)
+            except (ValueError, TypeError):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor."
+                ) from None
+
+        items = await self.reviews.list_reviews(course_id=course_id, limit=limit + 1, after=after)
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(scope, [items[-1].created_at.isoformat(), items[-1].id])
+        return ReviewPage(items=items, next_cursor=next_cursor)
@@ -4,3 +4,11 @@ from enum import Enum
 class PermissionsUserChange(Enum):
     ADMIN = "admin"
     MANAGER = "manager"
+
+
+PRIVILEGED_ROLE_NAMES = frozenset(permission.value for permission in PermissionsUserChange)
+ADMIN_ROLE_NAMES = frozenset({PermissionsUserChange.ADMIN.value})
+
+
+class DefaultUserRole(Enum):
+    USER = "user"
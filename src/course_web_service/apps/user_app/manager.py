@@ -1,20 +1,27 @@
 import logging
+import uuid
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import Exists, Row, delete, insert, or_, select, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from course_web_service.apps.auth_app.cache import principal_cache
+from course_web_service.apps.user_app.enums import PRIVILEGED_ROLE_NAMES
+from course_web_service.apps.user_app.roles import role_registry
 from course_web_service.apps.user_app.schemas import (
     CreateUser,
     DeleteUserResponse,
     GetUserByEmail,
     GetUserByID,
+    RoleSchema,
     UpdateUserToDB,
     UserInDB,
     UserReturnData,
 )
-from course_web_service.core.core_dependecy.db_dependency import DBDependency
-from course_web_service.database.models.user import User
+from course_web_service.core.core_dependecy.db_dependency import DBDependency, get_db
+from course_web_service.database.models.user import Role, User
 
 logger = logging.getLogger(__name__)
 
@@ -22,44 +29,42 @@ logger = logging.getLogger(__name__)
 class UserManager:
     """Класс для управления пользователями: CRUD."""
 
-    def __init__(self, model: type[User] = User, db: DBDependency = Depends(DBDependency)) -> None:
+    def __init__(self, model: type[User] = User, db: DBDependency = Depends(get_db)) -> None:
         """Инициализирует менеджер пользователей."""
         self.db = db
         self.model = model
 
     async def create_user(self, user: CreateUser) -> UserReturnData:
         """Создает нового пользователя."""
-        logger.info(f"Starting writing new user to DB: {user.email}")
+        logger.info("Starting writing new user to DB: %s", user.email)
         async with self.db.db_session() as session:
-            query = insert(self.model).values(**user.model_dump()).returning(self.model)
+            query = insert(self.model).values(**user.model_dump()).returning(*self.columns())
 
             try:
                 result = await session.execute(query)
                 await session.commit()
             except IntegrityError:
-                logger.error(f"User already exists: {user.email}")
+                logger.error("User already exists: %s", user.email)
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT, detail="User already exists."
                 ) from None
 
-            user_data = result.scalars().first()
-            logger.info(f"User {user.email} created successfully.")
-            return UserReturnData(**user_data.__dict__)
+            user_data = result.first()
+            logger.info("User %s created successfully.", user.email)
+            return self._to_user_in_db(user_data).to_return_data()
 
     async def get_user_by_email(self, user: GetUserByEmail) -> UserInDB:
         """Возвращает пользователя по email."""
         async with self.db.db_session() as session:
-            query = select(self.model).filter(self.model.email == user.email)
-
             try:
-                result = await session.execute(query)
+                result = await session.execute(self.user_by_email_query(user.email))
             except Exception as e:
-                logger.error(f"Error fetching user by email: {e}", exc_info=True)
+                logger.error("Error fetching user by email: %s", e, exc_info=True)
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
                 ) from None
 
-            user_data = result.scalars().first()
+            user_data = result.first()
 
             if not user_data:
                 raise HTTPException(
@@ -67,23 +72,21 @@ class UserManager:
                     detail="User not found.",
                 )
 
-            return UserInDB(**user_data.__dict__)
+            return self._to_user_in_db(user_data)
 
     async def get_user_by_id(self, user: GetUserByID) -> UserInDB:
         """Возвращает пользователя по ID."""
 
         async with self.db.db_session() as session:
-            query = select(self.model).filter(self.model.id == user.id)
-
             try:
-                result = await session.execute(query)
+                result = await session.execute(self.user_by_id_query(user.id))
             except Exception as e:
-                logger.error(f"Error fetching user by email: {e}", exc_info=True)
+                logger.error("Error fetching user by email: %s", e, exc_info=True)
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
                 ) from None
 
-            user_data = result.scalars().first()
+            user_data = result.first()
 
             if not user_data:
                 raise HTTPException(
@@ -91,40 +94,136 @@ class UserManager:
                     detail="User not found.",
                 )
 
-            return UserInDB(**user_data.__dict__)
+            return self._to_user_in_db(user_data)
+
+    async def update_password_hash(self, user_id: uuid.UUID, old_hash: str, new_hash: str) -> bool:
+        """Заменяет хэш пароля, только если он не изменился с момента проверки."""
+        async with self.db.db_session() as session:
+            result = await session.execute(
+                update(self.model)
+                .where(self.model.id == user_id, self.model.hashed_password == old_hash)
+                .values(hashed_password=new_hash)
+            )
+            await session.commit()
+            return result.rowcount > 0
+
+    async def get_target_and_caller(
+        self, target: GetUserByID, caller: GetUserByEmail
+    ) -> tuple[UserInDB, UserInDB]:
+        """Возвращает запрашиваемого и текущего пользователя одним запросом."""
+        async with self.db.db_session() as session:
+            result = await session.execute(self.target_and_caller_query(target.id, caller.email))
+            users = result.all()
+
+        target_data = next((user for user in users if user.id == target.id), None)
+        caller_data = next((user for user in users if user.email == caller.email), None)
+        if not target_data or not caller_data:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found.",
+            )
+        return self._to_user_in_db(target_data), self._to_user_in_db(caller_data)
+
+    async def get_roles(self) -> list[RoleSchema]:
+        """Возвращает все роли из базы данных."""
+        async with self.db.db_session() as session:
+            result = await session.execute(select(Role).order_by(Role.id))
+            return [RoleSchema.model_validate(role) for role in result.scalars().all()]
+
+    def columns(self) -> tuple:
+        """Колонки пользователя: строки вместо ORM-объектов, без ленивой загрузки связей."""
+        return tuple(self.model.__table__.columns)
+
+    def user_by_email_query(self, email: str):
+        """Строит запрос пользователя по email."""
+        return select(*self.columns()).filter(self.model.email == email)
+
+    def user_by_id_query(self, user_id: uuid.UUID):
+        """Строит запрос пользователя по ID."""
+        return select(*self.columns()).filter(self.model.id == user_id)
+
+    def target_and_caller_query(self, target_id: uuid.UUID, caller_email: str):
+        """Строит запрос запрашиваемого и текущего пользователя."""
+        return select(*self.columns()).filter(
+            or_(self.model.id == target_id, self.model.email == caller_email)
+        )
+
+    def hot_queries(self) -> list:
+        """Запросы каждого аутентифицированного запроса; компилируются при старте приложения."""
+        placeholder_id = uuid.UUID(int=0)
+        return [
+            self.user_by_email_query(""),
+            self.user_by_id_query(placeholder_id),
+            self.target_and_caller_query(placeholder_id, ""),
+        ]
+
+    def _to_user_in_db(self, user_data: Row) -> UserInDB:
+        """Валидирует строку один раз и подставляет роль из справочника ролей."""
+        user = UserInDB.model_validate(user_data, from_attributes=True)
+        user.role = role_registry.get(user_data.role_id)
+        return user
+
+    def _caller_can_change(self, target_id: uuid.UUID, caller_email: str) -> Exists:
+        """Условие: текущий пользователь — сам пользователь или имеет роль admin/manager."""
+        caller = aliased(self.model)
+        privileged_role_ids = role_registry.ids_by_names(PRIVILEGED_ROLE_NAMES)
+        return (
+            select(caller.id)
+            .where(
+                caller.email == caller_email,
+                or_(caller.id == target_id, caller.role_id.in_(privileged_role_ids)),
+            )
+            .exists()
+        )
+
+    async def _not_found_or_forbidden(self, session: AsyncSession, target_id: uuid.UUID):
+        """Определяет причину, по которой условное изменение не затронуло строк."""
+        exists = await session.scalar(select(self.model.id).where(self.model.id == target_id))
+        if not exists:
+            return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
+        return HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Permission denied.")
 
     async def update_user_info(
-        self, user_email: str, update_data: UpdateUserToDB
+        self, target: GetUserByID, caller_email: str, update_data: UpdateUserToDB
     ) -> UserReturnData:
-        """Обновляет данные пользователя в базе данных."""
-        logger.info(f"Updating user with email: {user_email}")
+        """Обновляет данные пользователя, проверяя права текущего пользователя в том же запросе."""
+        logger.info("Updating user with id: %s", target.id)
         async with self.db.db_session() as session:
             query = (
                 update(self.model)
-                .where(self.model.email == user_email)
+                .where(
+                    self.model.id == target.id,
+                    self._caller_can_change(target.id, caller_email),
+                )
                 .values(**update_data.model_dump(exclude_unset=True))
-                .returning(self.model)
+                .returning(*self.columns())
             )
             result = await session.execute(query)
+            row = result.first()
+            if not row:
+                raise await self._not_found_or_forbidden(session, target.id)
             await session.commit()
-            user_data = result.scalars().first()
-            if not user_data:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="User not found.",
-                )
-            return UserReturnData(**user_data.__dict__)
 
-    async def delete_user(self, user_email: str) -> DeleteUserResponse:
-        """Удаляет пользователя из базы данных."""
-        logger.info(f"Deleting user with email: {user_email}")
+        await principal_cache.invalidate(row.email)
+        return self._to_user_in_db(row).to_return_data()
+
+    async def delete_user(self, target: GetUserByID, caller_email: str) -> DeleteUserResponse:
+        """Удаляет пользователя, проверяя права текущего пользователя в том же запросе."""
+        logger.info("Deleting user with id: %s", target.id)
         async with self.db.db_session() as session:
-            query = delete(self.model).where(self.model.email == user_email)
+            query = (
+                delete(self.model)
+                .where(
+                    self.model.id == target.id,
+                    self._caller_can_change(target.id, caller_email),
+                )
+                .returning(self.model.email)
+            )
             result = await session.execute(query)
+            email = result.scalar()
+            if not email:
+                raise await self._not_found_or_forbidden(session, target.id)
             await session.commit()
-            if result.rowcount == 0:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="User not found.",
-                )
-            return DeleteUserResponse(message="User deleted successfully.")
+
+        await principal_cache.invalidate(email)
+        return DeleteUserResponse(message="User deleted successfully.")
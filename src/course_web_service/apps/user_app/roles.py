@@ -0,0 +1,94 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from types import MappingProxyType
+
+from course_web_service.apps.user_app.schemas import RoleSchema
+from course_web_service.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RoleRegistry:
+    """Неизменяемый справочник ролей, загружаемый при старте и периодически перечитываемый."""
+
+    def __init__(self, interval_s: int = settings.auth_settings.role_refresh_interval_s) -> None:
+        self.interval_s = interval_s
+        self.refreshes = 0
+        self.failed_refreshes = 0
+        self._by_id: MappingProxyType[int, RoleSchema] = MappingProxyType({})
+        self._id_by_name: MappingProxyType[str, int] = MappingProxyType({})
+        self._loader: Callable[[], Awaitable[list[RoleSchema]]] | None = None
+        self._task: asyncio.Task | None = None
+
+    def load(self, roles: Iterable[RoleSchema]) -> None:
+        """Атомарно заменяет справочник новым набором ролей."""
+        by_id = {role.id: role for role in roles}
+        id_by_name = {role.name.lower(): role.id for role in by_id.values()}
+        changed = by_id != dict(self._by_id)
+        self._by_id, self._id_by_name = MappingProxyType(by_id), MappingProxyType(id_by_name)
+        if changed:
+            logger.info("Role registry loaded: %s roles", len(by_id))
+
+    async def refresh(self) -> None:
+        """Перечитывает роли из БД, чтобы изменения дошли до всех воркеров."""
+        if self._loader is None:
+            return
+        try:
+            self.load(await self._loader())
+        except Exception as e:
+            self.failed_refreshes += 1
+            logger.error("Failed to refresh role registry: %s", e, exc_info=True)
+            return
+        self.refreshes += 1
+
+    def start(self, loader: Callable[[], Awaitable[list[RoleSchema]]]) -> None:
+        """Запускает периодическое перечитывание справочника."""
+        if self.interval_s <= 0 or self._task is not None:
+            return
+        self._loader = loader
+        self._task = asyncio.create_task(self._run(), name="role-registry-refresh")
+
+    async def stop(self) -> None:
+        """Останавливает фоновое перечитывание."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def get(self, role_id: int | None) -> RoleSchema | None:
+        """Возвращает роль по ID."""
+        return self._by_id.get(role_id)
+
+    def id_by_name(self, name: str) -> int | None:
+        """Возвращает ID роли по имени (без учета регистра)."""
+        return self._id_by_name.get(name.lower())
+
+    def ids_by_names(self, names: Iterable[str]) -> list[int]:
+        """Возвращает ID известных ролей по списку имен."""
+        return [role_id for name in names if (role_id := self.id_by_name(name)) is not None]
+
+    @property
+    def roles(self) -> list[RoleSchema]:
+        """Возвращает все роли."""
+        return list(self._by_id.values())
+
+    def metrics(self) -> dict:
+        """Возвращает число ролей и счетчики перечитываний."""
+        return {
+            "size": len(self._by_id),
+            "refreshes": self.refreshes,
+            "failed_refreshes": self.failed_refreshes,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_s)
+            await self.refresh()
+
+
+role_registry = RoleRegistry()
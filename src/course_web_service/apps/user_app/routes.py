@@ -6,14 +6,17 @@ from fastapi import APIRouter, Depends, status
 from course_web_service.apps.auth_app.security import oauth2_scheme
 from course_web_service.apps.user_app.schemas import (
     DeleteUserResponse,
+    RoleSchema,
     UpdateUser,
     UserReturnData,
 )
 from course_web_service.apps.user_app.services import UserService
+from course_web_service.core.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
 user_router = APIRouter(prefix="/users", tags=["users"])
+role_router = APIRouter(prefix="/roles", tags=["roles"])
 
 
 @user_router.get("/{user_id}", response_model=UserReturnData, status_code=status.HTTP_200_OK)
@@ -22,9 +25,8 @@ async def read_user_info(
     token: str = Depends(oauth2_scheme),
     service: UserService = Depends(UserService),
 ):
-    """Возвращает данные пользователя."""
-
-    return await service.get_user_or_403(token=token, user_id=user_id)
+    """Возвращает данные пользователя (модель уже проверена, повторной валидации нет)."""
+    return ORJSONResponse(await service.get_user_or_403(token=token, user_id=user_id))
 
 
 @user_router.patch("/{user_id}", response_model=UserReturnData)
@@ -35,7 +37,9 @@ async def update_current_user(
     token: str = Depends(oauth2_scheme),
 ):
     """Обновляет данные текущего пользователя."""
-    return await service.update_user(token=token, user_id=user_id, update_data=update_data)
+    return ORJSONResponse(
+        await service.update_user(token=token, user_id=user_id, update_data=update_data)
+    )
 
 
 @user_router.delete("/{user_id}", response_model=DeleteUserResponse)
@@ -46,3 +50,12 @@ async def delete_current_user(
 ):
     """Удаляет текущего пользователя."""
     return await service.delete_user(token=token, user_id=user_id)
+
+
+@role_router.post("/reload", response_model=list[RoleSchema])
+async def reload_roles(
+    service: UserService = Depends(UserService),
+    token: str = Depends(oauth2_scheme),
+):
+    """Перечитывает справочник ролей после изменения таблицы ролей."""
+    return await service.reload_roles(token=token)
@@ -40,6 +40,7 @@ class CreateUser(GetUserByEmail):
     """Схема для создания пользователя в базе данных."""
 
     hashed_password: str
+    role_id: int | None = None
 
 
 class UserBase(BaseModel):
@@ -84,11 +85,18 @@ class UserInDB(UserBase):
     """Схема для хранения пользователя в базе данных."""
 
     hashed_password: str
+    role: RoleSchema | None = Field(None, description="Роль пользователя.")
 
     @field_serializer("id")
     def serialize_uuid(self, value: uuid.UUID) -> str:
         return str(value)
 
+    def to_return_data(self) -> UserReturnData:
+        """Возвращает публичные данные пользователя без повторной валидации полей."""
+        return UserReturnData.model_construct(
+            self.model_fields_set - {"hashed_password"}, **self.__dict__
+        )
+
 
 class BaseUpdateUser(BaseModel):
     first_name: str | None = Field(
@@ -118,7 +126,7 @@ class UpdateUser(BaseUpdateUser):
 class UpdateUserToDB(BaseUpdateUser):
     """Схема для сохранения обновленных данных пользователя в базу данных."""
 
-    hashed_password: str
+    hashed_password: str | None = None
 
 
 class DeleteUserResponse(BaseModel):
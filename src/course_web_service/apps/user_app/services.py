@@ -3,13 +3,19 @@ import uuid
 
 from fastapi import HTTPException, status
 
+from course_web_service.apps.auth_app.cache import principal_cache
+from course_web_service.apps.auth_app.enums import JWTTokenTypeForLogging
 from course_web_service.apps.auth_app.services import AuthService
-from course_web_service.apps.user_app.enums import PermissionsUserChange
+from course_web_service.apps.user_app.enums import ADMIN_ROLE_NAMES
+from course_web_service.apps.user_app.roles import role_registry
 from course_web_service.apps.user_app.schemas import (
     DeleteUserResponse,
+    GetUserByEmail,
     GetUserByID,
+    RoleSchema,
     UpdateUser,
     UpdateUserToDB,
+    UserInDB,
     UserReturnData,
 )
 
@@ -20,18 +26,30 @@ class UserService(AuthService):
     """Класс для управления пользователями: регистрация, обновление, удаление."""
 
     async def get_user_or_403(self, token: str, user_id: uuid.UUID | str):
-        current_user = await self.get_current_user(token=token)
-        user_what_you_wanna = await self.manager.get_user_by_id(user=GetUserByID(user_id))
-        if (
-            current_user.role not in PermissionsUserChange._value2member_map_.keys()
-            or current_user.email != user_what_you_wanna.email
-        ):
+        """Возвращает пользователя, если текущий пользователь — он сам или admin/manager."""
+        payload = await self.auth.decode_token(
+            token=token, token_type_for_logger=JWTTokenTypeForLogging.ACCESS.value
+        )
+        email = await self._get_email_from_payload(payload)
+        target = GetUserByID(id=user_id)
+
+        current_user = await principal_cache.get(email)
+        if current_user is None:
+            user_what_you_wanna, caller = await self.manager.get_target_and_caller(
+                target=target, caller=GetUserByEmail(email=email)
+            )
+            current_user = caller.to_return_data()
+            await principal_cache.set(email, current_user, expires_at=payload.get("exp"))
+        else:
+            user_what_you_wanna = await self.manager.get_user_by_id(user=target)
+
+        if not self._can_change(current_user, user_what_you_wanna):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Permission denied.",
             )
 
-        return UserReturnData(**user_what_you_wanna.model_dump())
+        return user_what_you_wanna.to_return_data()
 
     async def update_user(
         self,
@@ -40,30 +58,51 @@ class UserService(AuthService):
         update_data: UpdateUser,
     ) -> UserReturnData:
         """Обновляет данные пользователя."""
-        user_what_you_wanna = await self.manager.get_user_by_id(user=GetUserByID(user_id))
-        current_user = await self.get_current_user(token=token)
-        if current_user.role not in PermissionsUserChange._value2member_map_.keys():
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Permission denied.",
-            )
-        logger.info(f"Updating user with email: {user_what_you_wanna.email}")
-        update_user = UpdateUserToDB(email=user_what_you_wanna.email)
+        email = await self._get_email_from_token(token)
+        update_user = UpdateUserToDB(**update_data.model_dump(exclude_unset=True))
         if update_data.password:
             update_user.hashed_password = await self.auth.get_password_hash(update_data.password)
         return await self.manager.update_user_info(
-            user_email=user_what_you_wanna.email,
+            target=GetUserByID(id=user_id),
+            caller_email=email,
             update_data=update_user,
         )
 
     async def delete_user(self, token: str, user_id: uuid.UUID | str) -> DeleteUserResponse:
         """Удаляет пользователя."""
-        user_what_you_wanna = await self.manager.get_user_by_id(user=GetUserByID(user_id))
+        email = await self._get_email_from_token(token)
+        return await self.manager.delete_user(target=GetUserByID(id=user_id), caller_email=email)
+
+    async def reload_roles(self, token: str) -> list[RoleSchema]:
+        """Перечитывает справочник ролей сразу (только для администратора).
+
+        Остальные воркеры подхватят изменения при периодическом обновлении справочника.
+        """
         current_user = await self.get_current_user(token=token)
-        if current_user.role not in PermissionsUserChange._value2member_map_.keys():
+        if not self._is_privileged(current_user, allowed=ADMIN_ROLE_NAMES):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Permission denied.",
             )
-        logger.info(f"Deleting user with email: {user_what_you_wanna.email}")
-        return await self.manager.delete_user(user_email=user_what_you_wanna.email)
+        role_registry.load(await self.manager.get_roles())
+        return role_registry.roles
+
+    async def _get_email_from_token(self, token: str) -> str:
+        payload = await self.auth.decode_token(
+            token=token, token_type_for_logger=JWTTokenTypeForLogging.ACCESS.value
+        )
+        return await self._get_email_from_payload(payload)
+
+    async def _get_email_from_payload(self, payload: dict) -> str:
+        email = payload.get("sub")
+        if not email:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token.",
+            )
+        return email
+
+    @classmethod
+    def _can_change(cls, current_user: UserReturnData, user: UserInDB) -> bool:
+        """Проверяет, что текущий пользователь — сам пользователь или admin/manager."""
+        return current_user.id == user.id or cls._is_privileged(current_user)
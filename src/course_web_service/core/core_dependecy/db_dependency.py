@@ -1,27 +1,202 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Sequence
 
-from course_web_service.core.settings import settings
+from fastapi import Request
+from sqlalchemy import Executable
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from course_web_service.core.settings import DBSettings, settings
+
+logger = logging.getLogger(__name__)
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4().hex}__"
+
+
+def statement_options(db_settings: DBSettings) -> dict:
+    """Параметры движка для подготовленных выражений: прямое подключение или через PgBouncer.
+
+    В режиме pooler имена выражений уникальны, а кэш на соединение по умолчанию выключен:
+    PgBouncer в режиме transaction меняет серверное соединение между транзакциями. Кэш можно
+    включить (db_pooler_statement_cache_size), если в PgBouncer >= 1.21 задан
+    max_prepared_statements.
+    """
+    mode = db_settings.db_statement_mode
+    if mode == "direct":
+        connect_args = {"prepared_statement_cache_size": db_settings.db_statement_cache_size}
+    elif mode == "pooler":
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": db_settings.db_pooler_statement_cache_size,
+            "prepared_statement_name_func": _unique_statement_name,
+        }
+    else:
+        raise RuntimeError(f"Unsupported DB statement mode: {mode}.")
+    return {"connect_args": connect_args, "query_cache_size": db_settings.db_compiled_cache_size}
+
+
+class PoolMetrics:
+    """Счетчики ожидания и выдачи соединений из пула."""
+
+    def __init__(self) -> None:
+        self.waiters = 0
+        self.acquired = 0
+        self.acquire_time_total = 0.0
+        self.acquire_time_max = 0.0
+
+    def observe_acquire(self, elapsed: float) -> None:
+        """Учитывает время получения соединения из пула."""
+        self.acquired += 1
+        self.acquire_time_total += elapsed
+        self.acquire_time_max = max(self.acquire_time_max, elapsed)
+
+    @property
+    def acquire_time_avg(self) -> float:
+        """Среднее время получения соединения в секундах."""
+        return self.acquire_time_total / self.acquired if self.acquired else 0.0
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """Асинхронный пул соединений, собирающий метрики ожидания."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        self.metrics.waiters += 1
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.metrics.waiters -= 1
+            self.metrics.observe_acquire(time.perf_counter() - start)
+
+    def recreate(self) -> "InstrumentedAsyncPool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
 
 
 class DBDependency:
     """Класс для управления зависимостями базы данных."""
 
     def __init__(self) -> None:
-        """Инициализирует асинхронный движок и фабрику сессий."""
+        """Инициализирует асинхронный движок с общим пулом соединений и фабрику сессий."""
+        db_settings = settings.db_settings
         self._engine = create_async_engine(
-            url=settings.db_settings.db_url, echo=settings.db_settings.db_echo
+            url=db_settings.db_url,
+            echo=db_settings.db_echo,
+            poolclass=InstrumentedAsyncPool,
+            pool_size=db_settings.db_pool_size,
+            max_overflow=db_settings.db_max_overflow,
+            pool_timeout=db_settings.db_pool_timeout,
+            pool_pre_ping=db_settings.db_pool_pre_ping,
+            pool_recycle=db_settings.db_pool_recycle,
+            **statement_options(db_settings),
         )
         self._session_factory = async_sessionmaker(
             bind=self._engine,
             expire_on_commit=False,
             autocommit=False,
         )
+        self._replica_engine: AsyncEngine | None = None
+        self._read_session_factory = self._session_factory
+        if db_settings.db_replica_url:
+            self._replica_engine = create_async_engine(
+                url=db_settings.db_replica_url,
+                echo=db_settings.db_echo,
+                pool_size=db_settings.db_replica_pool_size,
+                max_overflow=0,
+                pool_timeout=db_settings.db_pool_timeout,
+                pool_pre_ping=db_settings.db_pool_pre_ping,
+                pool_recycle=db_settings.db_pool_recycle,
+                **statement_options(db_settings),
+            )
+            self._read_session_factory = async_sessionmaker(
+                bind=self._replica_engine,
+                expire_on_commit=False,
+                autocommit=False,
+            )
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """Возвращает общий асинхронный движок."""
+        return self._engine
 
     @property
     def db_session(self) -> async_sessionmaker[AsyncSession]:
         """Возвращает фабрику асинхронных сессий."""
         return self._session_factory
 
+    @property
+    def read_session(self) -> async_sessionmaker[AsyncSession]:
+        """Фабрика сессий для отчетных запросов: реплика, если настроена, иначе основная БД."""
+        return self._read_session_factory
+
+    @property
+    def has_replica(self) -> bool:
+        """Настроена ли отдельная реплика для чтения."""
+        return self._replica_engine is not None
+
+    def pool_metrics(self) -> dict:
+        """Возвращает текущее состояние пула соединений."""
+        pool: InstrumentedAsyncPool = self._engine.sync_engine.pool
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "waiters": pool.metrics.waiters,
+            "acquired_total": pool.metrics.acquired,
+            "acquire_time_avg": pool.metrics.acquire_time_avg,
+            "acquire_time_max": pool.metrics.acquire_time_max,
+        }
+
+    async def warm_up(self, statements: Sequence[Executable]) -> None:
+        """Компилирует горячие запросы и готовит их на соединениях пула до первого запроса.
+
+        В режиме direct выражения готовятся на каждом соединении пула; в режиме pooler
+        соединение с сервером не закреплено, поэтому заполняется только кэш компиляции.
+        """
+        db_settings = settings.db_settings
+        connections = db_settings.db_pool_size if db_settings.db_statement_mode == "direct" else 1
+
+        async def prepare() -> None:
+            async with self._engine.connect() as connection:
+                for statement in statements:
+                    await connection.execute(statement)
+
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(*(prepare() for _ in range(connections)))
+        except Exception as e:
+            logger.warning("Statement warm-up failed: %s", e)
+            return
+        logger.info(
+            "Warmed up %s statements on %s connections in %.3f s.",
+            len(statements),
+            connections,
+            time.perf_counter() - start,
+        )
+
     async def close(self):
-        """Закрывает асинхронный движок."""
+        """Закрывает асинхронные движки."""
+        if self._replica_engine is not None:
+            await self._replica_engine.dispose()
         await self._engine.dispose()
+
+
+async def get_db(request: Request) -> DBDependency:
+    """Возвращает общий для процесса DBDependency, созданный в lifespan приложения."""
+    return request.app.state.db
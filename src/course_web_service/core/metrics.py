@@ -0,0 +1,166 @@
+import time
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+MAX_TRACKED_STATEMENTS = 50
+
+
+class RequestTimings:
+    """Время, потраченное запросом на БД и отдельные этапы обработки."""
+
+    __slots__ = ("queries", "db_time", "segments", "statements")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.db_time = 0.0
+        self.segments: dict[str, float] = {}
+        self.statements: list[tuple[str, float]] = []
+
+    def add_query(self, statement: str, elapsed: float) -> None:
+        """Учитывает выполненный SQL-запрос."""
+        self.queries += 1
+        self.db_time += elapsed
+        if len(self.statements) < MAX_TRACKED_STATEMENTS:
+            self.statements.append((statement, elapsed))
+
+    def add_segment(self, name: str, elapsed: float) -> None:
+        """Учитывает время этапа обработки (хэширование, JWT и т.д.)."""
+        self.segments[name] = self.segments.get(name, 0.0) + elapsed
+
+
+_current_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def start_request_timings() -> RequestTimings:
+    """Начинает сбор таймингов для текущего запроса."""
+    timings = RequestTimings()
+    _current_timings.set(timings)
+    return timings
+
+
+def record_timing(name: str, elapsed: float) -> None:
+    """Добавляет время этапа к текущему запросу, если он отслеживается."""
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add_segment(name, elapsed)
+
+
+class Histogram:
+    """Кумулятивная гистограмма в формате Prometheus."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+
+
+class MetricsRegistry:
+    """Хранилище метрик запросов процесса и их вывод для /metrics."""
+
+    def __init__(self) -> None:
+        self.request_latency: dict[tuple[str, str, str], Histogram] = {}
+        self.request_db_time: dict[tuple[str, str], Histogram] = {}
+        self.request_db_queries: dict[tuple[str, str], int] = {}
+        self._collectors: dict[str, tuple[Callable[[], dict], frozenset[str]]] = {}
+
+    def register_collector(
+        self, name: str, collector: Callable[[], dict], counters: Iterable[str] = ()
+    ) -> None:
+        """Регистрирует источник числовых метрик; ключи из counters выводятся как counter."""
+        self._collectors[name] = (collector, frozenset(counters))
+
+    def observe_request(
+        self, method: str, route: str, status_code: int, elapsed: float, timings: RequestTimings
+    ) -> None:
+        """Учитывает завершенный HTTP-запрос."""
+        latency_key = (method, route, str(status_code))
+        if latency_key not in self.request_latency:
+            self.request_latency[latency_key] = Histogram()
+        self.request_latency[latency_key].observe(elapsed)
+
+        db_key = (method, route)
+        if db_key not in self.request_db_time:
+            self.request_db_time[db_key] = Histogram()
+        self.request_db_time[db_key].observe(timings.db_time)
+        self.request_db_queries[db_key] = self.request_db_queries.get(db_key, 0) + timings.queries
+
+    def render(self) -> str:
+        """Возвращает метрики в текстовом формате Prometheus."""
+        lines = [
+            "# TYPE http_request_duration_seconds histogram",
+            *self._render_histograms(
+                "http_request_duration_seconds",
+                self.request_latency,
+                ("method", "route", "status"),
+            ),
+            "# TYPE http_request_db_duration_seconds histogram",
+            *self._render_histograms(
+                "http_request_db_duration_seconds", self.request_db_time, ("method", "route")
+            ),
+            "# TYPE http_request_db_queries_total counter",
+        ]
+        for (method, route), value in self.request_db_queries.items():
+            labels = self._labels(("method", "route"), (method, route))
+            lines.append(f"http_request_db_queries_total{{{labels}}} {value}")
+
+        for name, (collector, counters) in self._collectors.items():
+            for key, value in collector().items():
+                if isinstance(value, bool) or not isinstance(value, int | float):
+                    continue
+                metric_type = "counter" if key in counters else "gauge"
+                lines.append(f"# TYPE {name}_{key} {metric_type}")
+                lines.append(f"{name}_{key} {value}")
+        return "\n".join(lines) + "\n"
+
+    def _render_histograms(
+        self, name: str, histograms: dict[tuple, Histogram], label_names: tuple[str, ...]
+    ) -> list[str]:
+        lines = []
+        for label_values, histogram in histograms.items():
+            labels = self._labels(label_names, label_values)
+            for bound, count in zip(histogram.buckets, histogram.counts, strict=True):
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return lines
+
+    @staticmethod
+    def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+        return ",".join(f'{name}="{value}"' for name, value in zip(names, values, strict=True))
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Подписывается на события движка, чтобы считать запросы и время БД на запрос."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.add_query(statement, elapsed)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start_time"):
+            conn.info["query_start_time"].pop()
+
+
+metrics_registry = MetricsRegistry()
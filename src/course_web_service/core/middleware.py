@@ -0,0 +1,88 @@
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from course_web_service.core.metrics import (
+    MetricsRegistry,
+    RequestTimings,
+    metrics_registry,
+    start_request_timings,
+)
+from course_web_service.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TimingMiddleware:
+    """ASGI middleware: гистограммы задержек по маршрутам, время БД и заголовок Server-Timing."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        registry: MetricsRegistry = metrics_registry,
+        slow_request_threshold_ms: float = settings.monitoring_settings.slow_request_threshold_ms,
+        server_timing_enabled: bool = settings.monitoring_settings.server_timing_enabled,
+    ) -> None:
+        self.app = app
+        self.registry = registry
+        self.slow_request_threshold = slow_request_threshold_ms / 1000
+        self.server_timing_enabled = server_timing_enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = start_request_timings()
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing_enabled:
+                    elapsed = time.perf_counter() - start
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", self._server_timing(timings, elapsed)))
+                    message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            self.registry.observe_request(
+                scope["method"], route_path, status_code, elapsed, timings
+            )
+            if elapsed >= self.slow_request_threshold:
+                self._log_slow_request(scope["method"], route_path, elapsed, timings)
+
+    @staticmethod
+    def _server_timing(timings: RequestTimings, elapsed: float) -> bytes:
+        parts = [
+            f"app;dur={elapsed * 1000:.2f}",
+            f'db;dur={timings.db_time * 1000:.2f};desc="{timings.queries} queries"',
+        ]
+        parts.extend(f"{name};dur={value * 1000:.2f}" for name, value in timings.segments.items())
+        return ", ".join(parts).encode("latin-1")
+
+    @staticmethod
+    def _log_slow_request(method: str, route: str, elapsed: float, timings: RequestTimings) -> None:
+        breakdown = "; ".join(
+            f"{statement.split(chr(10))[0][:120]} ({query_time * 1000:.1f} ms)"
+            for statement, query_time in timings.statements
+        )
+        logger.warning(
+            "Slow request %s %s: %.1f ms, %s queries, db %.1f ms, segments %s. Queries: %s",
+            method,
+            route,
+            elapsed * 1000,
+            timings.queries,
+            timings.db_time * 1000,
+            timings.segments,
+            breakdown,
+        )
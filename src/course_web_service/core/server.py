@@ -0,0 +1,108 @@
+import logging
+
+import uvicorn
+
+from course_web_service.core.settings import AuthSettings, ServerSettings, settings
+
+logger = logging.getLogger(__name__)
+
+APP_PATH = "course_web_service.main:app"
+
+
+def run_dev_server(server: ServerSettings) -> None:
+    """Запускает один процесс с автоперезагрузкой для разработки."""
+    uvicorn.run(
+        app=APP_PATH,
+        host=server.server_host,
+        port=server.server_port,
+        reload=True,
+        log_config=None,
+    )
+
+
+def run_uvicorn_server(server: ServerSettings) -> None:
+    """Запускает несколько процессов uvicorn под управлением его супервизора."""
+    uvicorn.run(
+        app=APP_PATH,
+        host=server.server_host,
+        port=server.server_port,
+        workers=server.server_workers,
+        loop=server.server_loop,
+        http=server.server_http,
+        timeout_keep_alive=server.server_keep_alive,
+        timeout_graceful_shutdown=server.server_graceful_timeout,
+        backlog=server.server_backlog,
+        log_config=None,
+    )
+
+
+def run_gunicorn_server(server: ServerSettings) -> bool:
+    """Запускает gunicorn с воркерами uvicorn и загрузкой приложения до fork.
+
+    Возвращает False, если gunicorn не установлен.
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+        from uvicorn.workers import UvicornWorker
+    except ImportError:
+        return False
+
+    from course_web_service.main import app
+
+    class TunedUvicornWorker(UvicornWorker):
+        CONFIG_KWARGS = {
+            "loop": server.server_loop,
+            "http": server.server_http,
+            "log_config": None,
+        }
+
+    class PreloadedApplication(BaseApplication):
+        def load_config(self):
+            options = {
+                "bind": f"{server.server_host}:{server.server_port}",
+                "workers": server.server_workers,
+                "worker_class": TunedUvicornWorker,
+                "preload_app": True,
+                "keepalive": server.server_keep_alive,
+                "backlog": server.server_backlog,
+                "graceful_timeout": server.server_graceful_timeout,
+            }
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    PreloadedApplication().run()
+    return True
+
+
+def check_multi_worker_settings(server: ServerSettings, auth: AuthSettings) -> None:
+    """Запрещает локальный кэш пользователей при нескольких воркерах.
+
+    Сброс записи после изменения или удаления пользователя виден только одному воркеру,
+    остальные отдавали бы прежние права до истечения TTL.
+    """
+    if (
+        server.server_workers > 1
+        and auth.principal_cache_ttl > 0
+        and not auth.principal_cache_redis_url
+    ):
+        raise RuntimeError(
+            "In-memory principal cache is unsafe with several workers: set "
+            "PRINCIPAL_CACHE_REDIS_URL, PRINCIPAL_CACHE_TTL=0 or SERVER_WORKERS=1."
+        )
+
+
+def run_server(server: ServerSettings = settings.server_settings) -> None:
+    """Запускает сервер в режиме разработки или в многопроцессном режиме."""
+    if server.server_reload:
+        logger.info("Starting development server with reload.")
+        run_dev_server(server)
+        return
+
+    check_multi_worker_settings(server, settings.auth_settings)
+    logger.info("Starting server with %s workers.", server.server_workers)
+    if server.server_preload and run_gunicorn_server(server):
+        return
+    run_uvicorn_server(server)
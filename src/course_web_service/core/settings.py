@@ -1,4 +1,6 @@
-from pydantic import EmailStr, SecretStr
+import os
+
+from pydantic import EmailStr, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,6 +13,18 @@ class DBSettings(BaseSettings):
     db_host: str
     db_port: int
     db_echo: bool
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_pre_ping: bool = True
+    db_pool_recycle: int = 1800
+    db_statement_mode: str = "direct"
+    db_statement_cache_size: int = 100
+    db_pooler_statement_cache_size: int = 0
+    db_compiled_cache_size: int = 1000
+    db_replica_host: str | None = None
+    db_replica_port: int | None = None
+    db_replica_pool_size: int = 5
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf8", extra="ignore")
 
@@ -19,6 +33,14 @@ class DBSettings(BaseSettings):
         """Возвращает URL для подключения к базе данных."""
         return f"postgresql+asyncpg://{self.db_user}:{self.db_password.get_secret_value()}@{self.db_host}:{self.db_port}/{self.db_name}"
 
+    @property
+    def db_replica_url(self) -> str | None:
+        """Возвращает URL реплики для чтения или None, если реплика не настроена."""
+        if not self.db_replica_host:
+            return None
+        port = self.db_replica_port or self.db_port
+        return f"postgresql+asyncpg://{self.db_user}:{self.db_password.get_secret_value()}@{self.db_replica_host}:{port}/{self.db_name}"
+
 
 class AuthSettings(BaseSettings):
     """Настройки для аутентификации и JWT."""
@@ -27,6 +49,28 @@ class AuthSettings(BaseSettings):
     algorithm: str
     access_token_expire_minutes: int
     refresh_token_expire_days: int
+    password_hash_workers: int = 4
+    password_hash_use_processes: bool = False
+    password_hash_queue_limit: int = 64
+    password_hash_scheme: str = "bcrypt"  # noqa: S105
+    password_bcrypt_rounds: int = 12
+    password_argon2_time_cost: int = 3
+    password_argon2_memory_cost: int = 65536
+    password_argon2_parallelism: int = 1
+    password_hash_target_ms: int = 250
+    principal_cache_ttl: int = 60
+    principal_cache_maxsize: int = 10_000
+    principal_cache_redis_url: str | None = None
+    refresh_revocation_sync_interval_s: int = 5
+    role_refresh_interval_s: int = 30
+    refresh_token_purge_batch_size: int = 1000
+    login_rate_limit_enabled: bool = True
+    login_rate_email_burst: int = 5
+    login_rate_email_per_minute: float = 5
+    login_rate_ip_burst: int = 30
+    login_rate_ip_per_minute: float = 120
+    login_rate_limit_maxsize: int = 200_000
+    login_rate_limit_redis_url: str | None = None
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf8", extra="ignore")
 
@@ -50,6 +94,84 @@ class LoggerSettings(BaseSettings):
     log_format: str
     max_log_size: int
     backup_count: int
+    log_queue_size: int = 10_000
+    log_queue_block: bool = False
+    log_json: bool = False
+
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf8", extra="ignore")
+
+
+class ServerSettings(BaseSettings):
+    """Настройки для запуска сервера."""
+
+    server_host: str = "localhost"
+    server_port: int = 8000
+    server_workers: int = Field(default_factory=lambda: os.cpu_count() or 1)
+    server_reload: bool = False
+    server_loop: str = "uvloop"
+    server_http: str = "httptools"
+    server_keep_alive: int = 5
+    server_backlog: int = 2048
+    server_graceful_timeout: int = 30
+    server_preload: bool = True
+
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf8", extra="ignore")
+
+
+class MonitoringSettings(BaseSettings):
+    """Настройки для метрик и трассировки запросов."""
+
+    slow_request_threshold_ms: float = 500.0
+    server_timing_enabled: bool = True
+    metrics_token: SecretStr | None = None
+
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf8", extra="ignore")
+
+
+class CourseSettings(BaseSettings):
+    """Настройки каталога и страниц курсов."""
+
+    outline_cache_maxsize: int = 1024
+
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf8", extra="ignore")
+
+
+class ReviewSettings(BaseSettings):
+    """Настройки отзывов и агрегатов оценок."""
+
+    # 0 — агрегаты меняются в транзакции отзыва. Больше 0 — изменения копятся в памяти и
+    # теряются при аварийной остановке: после нее нужен reconcile-ratings.
+    rating_flush_interval_ms: int = 0
+
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf8", extra="ignore")
+
+
+class PaymentSettings(BaseSettings):
+    """Настройки приема уведомлений платежного провайдера."""
+
+    payment_webhook_secret: SecretStr | None = None
+    payment_seen_cache_size: int = 100_000
+
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf8", extra="ignore")
+
+
+class EntitlementSettings(BaseSettings):
+    """Настройки кэша прав доступа к курсам."""
+
+    entitlement_cache_ttl: int = 60
+    entitlement_cache_maxsize: int = 50_000
+
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf8", extra="ignore")
+
+
+class AnalyticsSettings(BaseSettings):
+    """Настройки дневной статистики курсов."""
+
+    analytics_refresh_interval_s: int = 300
+    analytics_watermark_lag_s: int = 120
+    # Полный пересчет итогов отзывов: только он учитывает удаленные отзывы. 0 — отключен.
+    analytics_review_rebuild_interval_s: int = 3600
+    analytics_max_range_days: int = 366
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf8", extra="ignore")
 
@@ -62,6 +184,13 @@ class Settings(BaseSettings):
     auth_settings: AuthSettings = AuthSettings()
     init_app_settings: InitialAppSettings = InitialAppSettings()
     logger_settings: LoggerSettings = LoggerSettings()
+    server_settings: ServerSettings = ServerSettings()
+    monitoring_settings: MonitoringSettings = MonitoringSettings()
+    course_settings: CourseSettings = CourseSettings()
+    review_settings: ReviewSettings = ReviewSettings()
+    payment_settings: PaymentSettings = PaymentSettings()
+    entitlement_settings: EntitlementSettings = EntitlementSettings()
+    analytics_settings: AnalyticsSettings = AnalyticsSettings()
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf8", extra="ignore")
 
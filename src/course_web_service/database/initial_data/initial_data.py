@@ -1,43 +1,63 @@
+import argparse
+import asyncio
+import hashlib
 import logging
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import yaml
-from passlib.context import CryptContext
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from course_web_service.apps.user_app.schemas import RoleSchema, UserInDB
+from course_web_service.apps.auth_app.hashing import password_hasher
+from course_web_service.apps.user_app.schemas import RoleSchema
+from course_web_service.core.core_dependecy.db_dependency import DBDependency
 from course_web_service.core.settings import settings
-from course_web_service.database.models.user import Role, User
+from course_web_service.database.models.course import Course, Lesson, Topic
+from course_web_service.database.models.seed import SeedMarker
+from course_web_service.database.models.user import Curator, Role, User
 
 logger = logging.getLogger(__name__)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+SEED_MARKER_NAME = "initial_data"
 
 
 class InitialDataLoader:
     def __init__(self, data_dir: Path = Path("src/course_web_service/database/initial_data")):
         self.data_dir = data_dir
+        self._data: dict | None = None
+        self._checksum: str | None = None
+
+    def read_seed(self) -> dict:
+        """Читает YAML-файлы один раз и считает их контрольную сумму."""
+        if self._data is None:
+            digest = hashlib.sha256()
+            self._data = {}
+            for name in ("roles", "users"):
+                raw = (self.data_dir / f"{name}.yaml").read_bytes()
+                digest.update(raw)
+                self._data.update(yaml.safe_load(raw))
+            digest.update(settings.init_app_settings.admin_email.encode())
+            digest.update(settings.init_app_settings.manager_email.encode())
+            self._checksum = digest.hexdigest()
+        return self._data
+
+    @property
+    def checksum(self) -> str:
+        """Контрольная сумма начальных данных."""
+        self.read_seed()
+        return self._checksum
 
     async def load_roles(self, session: AsyncSession) -> None:
-        """Загружает роли из YAML в базу, если их нет."""
-        file_path = self.data_dir / "roles.yaml"
-        data = yaml.safe_load(file_path.read_text())
-
-        for role_data in data["roles"]:
-            role = RoleSchema(**role_data)
-
-            exists = await session.execute(select(Role).where(Role.name == role.name))
-            if not exists.scalar():
-                session.add(Role(**role.model_dump()))
-                logger.info(f"Добавлена роль: {role.name}")
-
-        await session.commit()
+        """Загружает роли из YAML одним INSERT ... ON CONFLICT DO NOTHING."""
+        roles = [RoleSchema(**role_data).model_dump() for role_data in self.read_seed()["roles"]]
+        query = pg_insert(Role).values(roles).on_conflict_do_nothing(index_elements=[Role.name])
+        result = await session.execute(query)
+        logger.info("Добавлено ролей: %s", result.rowcount)
 
     async def load_users(self, session: AsyncSession) -> None:
-        """Загружает пользователей из YAML, хешируя пароли."""
-        file_path = self.data_dir / "users.yaml"
-        data = yaml.safe_load(file_path.read_text())
-
+        """Загружает пользователей из YAML, хешируя пароли только для новых пользователей."""
         users_credentials = [
             settings.init_app_settings.admin_email,
             settings.init_app_settings.admin_password.get_secret_value(),
@@ -45,20 +65,132 @@ class InitialDataLoader:
             settings.init_app_settings.manager_password.get_secret_value(),
         ]
 
-        for user_data in data["users"]:
+        users_data = []
+        for user_data in self.read_seed()["users"]:
+            user_data = dict(user_data)
             user_data["email"] = users_credentials.pop(0)
-            user_data["hashed_password"] = pwd_context.hash(users_credentials.pop(0))
-
-            user = UserInDB(**user_data)
-
-            exists = await session.execute(select(User).where(User.email == user.email))
-            if not exists.scalar():
-                session.add(User(**user.model_dump()))
-                logger.info(f"Добавлен пользователь: {user.email}")
+            user_data["password"] = users_credentials.pop(0)
+            users_data.append(user_data)
+
+        existing = await session.scalars(
+            select(User.email).where(User.email.in_([user["email"] for user in users_data]))
+        )
+        existing_emails = set(existing.all())
+        new_users = [user for user in users_data if user["email"] not in existing_emails]
+        if not new_users:
+            return
+
+        hashed_passwords = await asyncio.gather(
+            *(password_hasher.hash(user.pop("password")) for user in new_users)
+        )
+        rows = [
+            {**user_data, "hashed_password": hashed_password}
+            for user_data, hashed_password in zip(new_users, hashed_passwords, strict=True)
+        ]
 
-        await session.commit()
+        query = pg_insert(User).values(rows).on_conflict_do_nothing(index_elements=[User.email])
+        result = await session.execute(query)
+        logger.info("Добавлено пользователей: %s", result.rowcount)
 
     async def load_all(self, session: AsyncSession) -> None:
-        """Загружает все начальные данные."""
+        """Загружает все начальные данные, если их версия изменилась."""
+        checksum = self.checksum
+        stored = await session.scalar(
+            select(SeedMarker.checksum).where(SeedMarker.name == SEED_MARKER_NAME)
+        )
+        if stored == checksum:
+            logger.info("Initial data is up to date, skipping seeding.")
+            return
+
         await self.load_roles(session)
         await self.load_users(session)
+        await session.execute(
+            pg_insert(SeedMarker)
+            .values(name=SEED_MARKER_NAME, checksum=checksum)
+            .on_conflict_do_update(
+                index_elements=[SeedMarker.name],
+                set_={"checksum": checksum, "updated_at": func.now()},
+            )
+        )
+        await session.commit()
+
+    async def load_demo_courses(
+        self,
+        session: AsyncSession,
+        courses: int,
+        topics_per_course: int,
+        lessons_per_topic: int,
+        chunk_size: int = 1000,
+    ) -> None:
+        """Создает демонстрационные курсы, темы и уроки для нагрузочного тестирования."""
+        curator_id = await self._get_demo_curator_id(session)
+        now = datetime.now(UTC)
+
+        for offset in range(0, courses, chunk_size):
+            course_rows = [
+                {
+                    "title": f"Demo course {number}",
+                    "description": f"Demo course {number} description",
+                    "price": (number % 100) * 10 + 9.99,
+                    "curator_id": curator_id,
+                    "created_at": now - timedelta(seconds=number),
+                }
+                for number in range(offset, min(offset + chunk_size, courses))
+            ]
+            course_ids = await session.scalars(
+                insert(Course).returning(Course.id, sort_by_parameter_order=True), course_rows
+            )
+            topic_rows = [
+                {"course_id": course_id, "title": f"Topic {order}", "order": order}
+                for course_id in course_ids.all()
+                for order in range(1, topics_per_course + 1)
+            ]
+            topic_ids = await session.scalars(
+                insert(Topic).returning(Topic.id, sort_by_parameter_order=True), topic_rows
+            )
+            lesson_rows = [
+                {
+                    "topic_id": topic_id,
+                    "title": f"Lesson {order}",
+                    "content": f"Lesson {order} content",
+                    "order": order,
+                }
+                for topic_id in topic_ids.all()
+                for order in range(1, lessons_per_topic + 1)
+            ]
+            await session.execute(insert(Lesson), lesson_rows)
+            await session.commit()
+            logger.info("Seeded demo courses: %s/%s", min(offset + chunk_size, courses), courses)
+
+    async def _get_demo_curator_id(self, session: AsyncSession) -> int:
+        """Возвращает куратора для демо-курсов, создавая его для администратора."""
+        admin_id = await session.scalar(
+            select(User.id).where(User.email == settings.init_app_settings.admin_email)
+        )
+        curator_id = await session.scalar(select(Curator.id).where(Curator.user_id == admin_id))
+        if curator_id is None:
+            curator_id = await session.scalar(
+                insert(Curator).values(user_id=admin_id, bio="Demo curator").returning(Curator.id)
+            )
+        return curator_id
+
+
+def seed_demo_data():
+    """Заполняет базу демонстрационными курсами для нагрузочного тестирования."""
+    parser = argparse.ArgumentParser(description="Seed demo courses, topics and lessons.")
+    parser.add_argument("--courses", type=int, default=1000)
+    parser.add_argument("--topics", type=int, default=5)
+    parser.add_argument("--lessons", type=int, default=8)
+    args = parser.parse_args()
+
+    async def run():
+        db = DBDependency()
+        try:
+            async with db.db_session() as session:
+                loader = InitialDataLoader()
+                await loader.load_all(session)
+                await loader.load_demo_courses(session, args.courses, args.topics, args.lessons)
+        finally:
+            await db.close()
+
+    asyncio.run(run())
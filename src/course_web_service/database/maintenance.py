@@ -0,0 +1,98 @@
+import asyncio
+import logging
+from datetime import timedelta
+
+from course_web_service.apps.analytics_app.manager import AnalyticsManager
+from course_web_service.apps.auth_app.manager import RefreshTokenManager
+from course_web_service.apps.progress_app.manager import ProgressManager
+from course_web_service.apps.review_app.manager import ReviewManager
+from course_web_service.core.core_dependecy.db_dependency import DBDependency
+from course_web_service.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def reconcile_ratings():
+    """Пересчитывает агрегаты оценок курсов по таблице отзывов.
+
+    Без буфера оценок агрегаты точны. С буфером (RATING_FLUSH_INTERVAL_MS > 0) они сходятся
+    только после сброса, а несброшенные изменения теряются при аварийной остановке процесса,
+    поэтому после нее команду нужно запустить.
+    """
+
+    async def run():
+        db = DBDependency()
+        try:
+            await ReviewManager(db=db).reconcile_ratings()
+        finally:
+            await db.close()
+
+    asyncio.run(run())
+
+
+def rebuild_progress_rollups():
+    """Заново строит сводки прогресса пользователей по курсам."""
+
+    async def run():
+        db = DBDependency()
+        try:
+            await ProgressManager(db=db).rebuild_rollups()
+        finally:
+            await db.close()
+
+    asyncio.run(run())
+
+
+def refresh_progress_totals():
+    """Обновляет число уроков в сводках прогресса после изменения программы курсов."""
+
+    async def run():
+        db = DBDependency()
+        try:
+            await ProgressManager(db=db).refresh_total_lessons()
+        finally:
+            await db.close()
+
+    asyncio.run(run())
+
+
+def refresh_course_stats():
+    """Дополняет дневную статистику курсов строками новее отметки."""
+
+    async def run():
+        db = DBDependency()
+        lag = timedelta(seconds=settings.analytics_settings.analytics_watermark_lag_s)
+        try:
+            await AnalyticsManager(db=db).refresh_daily_stats(lag)
+        finally:
+            await db.close()
+
+    asyncio.run(run())
+
+
+def rebuild_review_stats():
+    """Пересчитывает итоги отзывов в дневной статистике, в том числе после удалений."""
+
+    async def run():
+        db = DBDependency()
+        try:
+            await AnalyticsManager(db=db).rebuild_review_stats()
+        finally:
+            await db.close()
+
+    asyncio.run(run())
+
+
+def purge_refresh_tokens():
+    """Удаляет истекшие refresh-токены пачками."""
+
+    async def run():
+        db = DBDependency()
+        try:
+            await RefreshTokenManager(db=db).purge_expired(
+                settings.auth_settings.refresh_token_purge_batch_size
+            )
+        finally:
+            await db.close()
+
+    asyncio.run(run())
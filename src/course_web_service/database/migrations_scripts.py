@@ -14,7 +14,7 @@ def run_migrations():
         command.upgrade(alembic_cfg, "head")
         logger.info("Migrations applied successfully.")
     except Exception as e:
-        logger.error(f"Failed to apply migrations: {e}")
+        logger.error("Failed to apply migrations: %s", e)
         raise
 
 
@@ -24,10 +24,10 @@ def make_migrations(message: str | None = None):
         message = "New migration"
 
     try:
-        logger.info(f"Creating migration with message: {message}")
+        logger.info("Creating migration with message: %s", message)
         alembic_cfg = Config("alembic.ini")
         command.revision(alembic_cfg, autogenerate=True, message=message)
         logger.info("Migration created successfully.")
     except Exception as e:
-        logger.error(f"Failed to create migration: {e}")
+        logger.error("Failed to create migration: %s", e)
         raise
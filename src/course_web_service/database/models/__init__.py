@@ -1,3 +1,27 @@
-from course_web_service.database.models.user import Base, User
+from course_web_service.database.models.analytics import AnalyticsWatermark, CourseDailyStats
+from course_web_service.database.models.content import Assignment, CourseProgress, UserProgress
+from course_web_service.database.models.course import Course, Lesson, Topic
+from course_web_service.database.models.payment import Payment, Purchase
+from course_web_service.database.models.review import Review
+from course_web_service.database.models.seed import SeedMarker
+from course_web_service.database.models.user import Base, Curator, RefreshToken, Role, User
 
-__all__ = (Base, User)
+__all__ = (
+    AnalyticsWatermark,
+    Assignment,
+    Base,
+    Course,
+    CourseDailyStats,
+    CourseProgress,
+    Curator,
+    Lesson,
+    Payment,
+    Purchase,
+    RefreshToken,
+    Review,
+    Role,
+    SeedMarker,
+    Topic,
+    User,
+    UserProgress,
+)
@@ -0,0 +1,41 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from course_web_service.database.mixins.timestamp_mixins import TimestampsMixin
+from course_web_service.database.models.base import Base
+
+if TYPE_CHECKING:
+    from course_web_service.database.models.course import Course
+
+
+class CourseDailyStats(Base, TimestampsMixin):
+    """Дневные продажи и оценки курса, накапливаемые фоновой задачей."""
+
+    __tablename_override__ = "course_daily_stats"
+    __table_args__ = (Index("ix_course_daily_stats_day", "day"),)
+
+    course_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("course.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    purchases_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    revenue: Mapped[Decimal] = mapped_column(
+        Numeric(precision=12, scale=2), default=0, server_default="0"
+    )
+    reviews_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    rating_sum: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
+    course: Mapped["Course"] = relationship("Course")
+
+
+class AnalyticsWatermark(Base, TimestampsMixin):
+    """Отметка, до которой исходные строки уже учтены в агрегатах."""
+
+    __tablename_override__ = "analytics_watermark"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    processed_until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
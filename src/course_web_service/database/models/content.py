@@ -2,7 +2,17 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, Text, Uuid
+from sqlalchemy import (
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    Uuid,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from course_web_service.database.mixins.id_mixins import IDMixinUUID
@@ -10,16 +20,14 @@ from course_web_service.database.mixins.timestamp_mixins import TimestampsMixin
 from course_web_service.database.models.base import Base
 
 if TYPE_CHECKING:
-    from course_web_service.database.models.course import Lesson
+    from course_web_service.database.models.course import Course, Lesson
     from course_web_service.database.models.user import User
 
 
 class Assignment(Base, TimestampsMixin, IDMixinUUID):
     """Модель задания для урока."""
 
-    lesson_id: Mapped[uuid.UUID] = mapped_column(
-        uuid.UUID, ForeignKey("lesson.id", ondelete="CASCADE")
-    )
+    lesson_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("lesson.id", ondelete="CASCADE"))
     title: Mapped[str] = mapped_column(String(255))
     description: Mapped[str] = mapped_column(Text)
     deadline: Mapped[datetime] = mapped_column(DateTime(timezone=True))
@@ -33,16 +41,41 @@ class Assignment(Base, TimestampsMixin, IDMixinUUID):
 class UserProgress(Base, TimestampsMixin, IDMixinUUID):
     """Модель прогресса пользователя по уроку."""
 
+    __table_args__ = (
+        UniqueConstraint("user_id", "assignment_id", name="uq_userprogress_user_id_assignment_id"),
+    )
+
     user_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("user.id", ondelete="CASCADE"))
     lesson_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("lesson.id", ondelete="CASCADE"))
-    assignment_id: Mapped[int] = mapped_column(
-        uuid.UUID, ForeignKey("assignment.id", ondelete="CASCADE")
+    assignment_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("assignment.id", ondelete="CASCADE")
     )
     status: Mapped[str] = mapped_column(String, default="начато")
     score: Mapped[float] = mapped_column(Float, nullable=True)
     feedback: Mapped[str] = mapped_column(Text, nullable=True)
     completed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    event_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     user: Mapped["User"] = relationship("User", back_populates="progress")
     lesson: Mapped["Lesson"] = relationship("Lesson", back_populates="progress")
     assignment: Mapped["Assignment"] = relationship("Assignment", back_populates="progress")
+
+
+class CourseProgress(Base, TimestampsMixin):
+    """Сводка прогресса пользователя по курсу, поддерживаемая при записи прогресса."""
+
+    __tablename_override__ = "course_progress"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+    course_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("course.id", ondelete="CASCADE"), primary_key=True
+    )
+    completed_lessons: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    total_lessons: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    average_score: Mapped[float] = mapped_column(Float, nullable=True)
+    last_activity_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    user: Mapped["User"] = relationship("User")
+    course: Mapped["Course"] = relationship("Course")
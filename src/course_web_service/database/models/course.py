@@ -1,6 +1,17 @@
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import (
+    CheckConstraint,
+    Computed,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from course_web_service.database.mixins.id_mixins import IDMixin, IDMixinUUID
@@ -9,43 +20,107 @@ from course_web_service.database.models.base import Base
 
 if TYPE_CHECKING:
     from course_web_service.database.models.content import Assignment, UserProgress
-    from course_web_service.database.models.payment import Purchase
+    from course_web_service.database.models.payment import Payment, Purchase
     from course_web_service.database.models.review import Review
     from course_web_service.database.models.user import Curator
 
+SEARCH_CONFIG = "russian"
+
+
+def search_vector_expression(title_column: str, body_column: str) -> str:
+    """Выражение взвешенного tsvector: заголовок важнее текста."""
+    return (
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({title_column}, '')), 'A') || "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({body_column}, '')), 'B')"
+    )
+
+
+CARD_COLUMNS = ("title", "price", "curator_id", "created_at", "rating_avg", "rating_count")
+
+
+def card_index(name: str, *keys: str) -> Index:
+    """Индекс страницы каталога: ключ пагинации плюс колонки карточки для index-only scan."""
+    include = [column for column in CARD_COLUMNS if column not in keys]
+    return Index(name, *keys, "id", postgresql_include=include)
+
 
 class Course(Base, TimestampsMixin, IDMixin):
     """Модель курса."""
 
+    __table_args__ = (
+        card_index("ix_course_created_at_id", "created_at"),
+        card_index("ix_course_price_id", "price"),
+        card_index("ix_course_rating_avg_id", "rating_avg"),
+        Index("ix_course_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_course_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
+
     title: Mapped[str] = mapped_column(String(255), index=True)
     description: Mapped[str] = mapped_column(Text)
     price: Mapped[float] = mapped_column(Numeric(precision=10, scale=2))
     curator_id: Mapped[int] = mapped_column(Integer, ForeignKey("curator.id", ondelete="CASCADE"))
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(search_vector_expression("title", "description"), persisted=True),
+        deferred=True,
+    )
+    rating_sum: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    rating_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    rating_avg: Mapped[Decimal] = mapped_column(
+        Numeric(precision=3, scale=2),
+        Computed(
+            "CASE WHEN rating_count > 0 "
+            "THEN round(rating_sum::numeric / rating_count, 2) ELSE 0 END",
+            persisted=True,
+        ),
+    )
 
     curator: Mapped["Curator"] = relationship("Curator", back_populates="courses")
-    topics: Mapped[list["Topic"]] = relationship("Topic", back_populates="course")
+    topics: Mapped[list["Topic"]] = relationship(
+        "Topic", back_populates="course", order_by="Topic.order"
+    )
     purchases: Mapped[list["Purchase"]] = relationship("Purchase", back_populates="course")
+    payments: Mapped[list["Payment"]] = relationship("Payment", back_populates="course")
     reviews: Mapped[list["Review"]] = relationship("Review", back_populates="course")
 
 
 class Topic(Base, TimestampsMixin, IDMixin):
     """Модель темы курса."""
 
+    __table_args__ = (Index("ix_topic_course_id_order", "course_id", "order"),)
+
     course_id: Mapped[int] = mapped_column(Integer, ForeignKey("course.id", ondelete="CASCADE"))
     title: Mapped[str] = mapped_column(String(255))
-    order: Mapped[int] = mapped_column(Integer, CheckConstraint("order > 0"))
+    order: Mapped[int] = mapped_column(Integer, CheckConstraint('"order" > 0'))
 
     course: Mapped["Course"] = relationship("Course", back_populates="topics")
-    lessons: Mapped[list["Lesson"]] = relationship("Lesson", back_populates="topic")
+    lessons: Mapped[list["Lesson"]] = relationship(
+        "Lesson", back_populates="topic", order_by="Lesson.order"
+    )
 
 
 class Lesson(Base, TimestampsMixin, IDMixinUUID):
     """Модель урока."""
 
+    __table_args__ = (
+        Index("ix_lesson_topic_id_order", "topic_id", "order"),
+        Index("ix_lesson_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
     topic_id: Mapped[int] = mapped_column(Integer, ForeignKey("topic.id", ondelete="CASCADE"))
     title: Mapped[str] = mapped_column(String(255))
-    content: Mapped[str] = mapped_column(Text)
-    order: Mapped[int] = mapped_column(Integer, CheckConstraint("order > 0"))
+    content: Mapped[str] = mapped_column(Text, deferred=True)
+    order: Mapped[int] = mapped_column(Integer, CheckConstraint('"order" > 0'))
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(search_vector_expression("title", "content"), persisted=True),
+        deferred=True,
+    )
 
     topic: Mapped["Topic"] = relationship("Topic", back_populates="lessons")
     assignments: Mapped[list["Assignment"]] = relationship("Assignment", back_populates="lesson")
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, String, Uuid, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, String, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from course_web_service.database.mixins import id_mixins, timestamp_mixins
@@ -16,6 +16,11 @@ if TYPE_CHECKING:
 class Purchase(Base, timestamp_mixins.TimestampsMixin, id_mixins.IDMixinUUID):
     """Модель покупки курса."""
 
+    __table_args__ = (
+        Index("ix_purchase_user_id_course_id", "user_id", "course_id"),
+        Index("ix_purchase_created_at", "created_at"),
+    )
+
     user_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("user.id", ondelete="CASCADE"))
     course_id: Mapped[int] = mapped_column(Integer, ForeignKey("course.id", ondelete="CASCADE"))
     purchase_date: Mapped[datetime] = mapped_column(
@@ -1,7 +1,7 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, ForeignKey, Integer, Text, Uuid
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer, Text, UniqueConstraint, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from course_web_service.database.mixins.id_mixins import IDMixin
@@ -16,6 +16,13 @@ if TYPE_CHECKING:
 class Review(Base, TimestampsMixin, IDMixin):
     """Модель отзыва пользователя на курс."""
 
+    __table_args__ = (
+        UniqueConstraint("user_id", "course_id", name="uq_review_user_id_course_id"),
+        Index("ix_review_course_id_created_at_id", "course_id", "created_at", "id"),
+        Index("ix_review_created_at", "created_at"),
+        Index("ix_review_updated_at", "updated_at"),
+    )
+
     user_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("user.id", ondelete="CASCADE"))
     course_id: Mapped[int] = mapped_column(Integer, ForeignKey("course.id", ondelete="CASCADE"))
     rating: Mapped[int] = mapped_column(
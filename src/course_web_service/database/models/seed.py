@@ -0,0 +1,15 @@
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from course_web_service.database.mixins.id_mixins import IDMixin
+from course_web_service.database.mixins.timestamp_mixins import TimestampsMixin
+from course_web_service.database.models.base import Base
+
+
+class SeedMarker(Base, TimestampsMixin, IDMixin):
+    """Модель отметки о загруженной версии начальных данных."""
+
+    __tablename_override__ = "seed_marker"
+
+    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    checksum: Mapped[str] = mapped_column(String(64), nullable=False)
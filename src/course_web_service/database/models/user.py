@@ -1,7 +1,8 @@
 import uuid
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String, Text, Uuid
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from course_web_service.database.mixins.id_mixins import IDMixin, IDMixinUUID
@@ -11,7 +12,7 @@ from course_web_service.database.models.base import Base
 if TYPE_CHECKING:
     from course_web_service.database.models.content import UserProgress
     from course_web_service.database.models.course import Course
-    from course_web_service.database.models.payment import Purchase
+    from course_web_service.database.models.payment import Payment, Purchase
     from course_web_service.database.models.review import Review
 
 
@@ -19,15 +20,16 @@ class User(Base, TimestampsMixin, IDMixinUUID):
     """Модель пользователя."""
 
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
-    first_name: Mapped[str] = mapped_column(String(150))
-    last_name: Mapped[str] = mapped_column(String(255))
+    first_name: Mapped[str | None] = mapped_column(String(150))
+    last_name: Mapped[str | None] = mapped_column(String(255))
     hashed_password: Mapped[str] = mapped_column(String(255), unique=False, nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    role_id: Mapped[int] = mapped_column(Integer, ForeignKey("role.id", ondelete="CASCADE"))
+    role_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("role.id", ondelete="CASCADE"))
 
     role: Mapped["Role"] = relationship("Role", back_populates="users")
     purchases: Mapped[list["Purchase"]] = relationship("Purchase", back_populates="user")
+    payments: Mapped[list["Payment"]] = relationship("Payment", back_populates="user")
     reviews: Mapped[list["Review"]] = relationship("Review", back_populates="user")
     progress: Mapped[list["UserProgress"]] = relationship("UserProgress", back_populates="user")
 
@@ -42,10 +44,22 @@ class Role(Base, TimestampsMixin, IDMixin):
 
 
 class RefreshToken(Base, IDMixinUUID, TimestampsMixin):
-    """Модель refresh-tokens для пользователей."""
+    """Модель refresh-tokens для пользователей.
+
+    ID записи совпадает с jti токена; в refresh_token хранится SHA-256 токена, а не он сам.
+    """
+
+    __table_args__ = (
+        Index("ix_refreshtoken_family_id", "family_id"),
+        Index("ix_refreshtoken_expires_at", "expires_at"),
+        Index("ix_refreshtoken_revoked_at", "revoked_at"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("user.id", ondelete="CASCADE"))
     refresh_token: Mapped[str] = mapped_column(String(512), nullable=False, unique=True)
+    family_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
 class Curator(Base, TimestampsMixin, IDMixin):
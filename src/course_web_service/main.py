@@ -1,11 +1,26 @@
 import logging
 
-import uvicorn
 from fastapi import FastAPI
 from fastapi.concurrency import asynccontextmanager
 
 from course_web_service.apps import apps_router
+from course_web_service.apps.analytics_app.job import daily_stats_job
+from course_web_service.apps.auth_app.cache import principal_cache
+from course_web_service.apps.auth_app.hashing import password_hasher
+from course_web_service.apps.auth_app.ratelimit import login_rate_limiter
+from course_web_service.apps.auth_app.revocation import revoked_tokens
+from course_web_service.apps.course_app.cache import outline_cache
+from course_web_service.apps.entitlement_app.cache import entitlement_cache
+from course_web_service.apps.monitoring_app.routes import monitoring_router
+from course_web_service.apps.payment_app.cache import seen_transactions
+from course_web_service.apps.review_app.buffer import rating_buffer
+from course_web_service.apps.user_app.manager import UserManager
+from course_web_service.apps.user_app.roles import role_registry
 from course_web_service.core.core_dependecy.db_dependency import DBDependency
+from course_web_service.core.metrics import instrument_engine, metrics_registry
+from course_web_service.core.middleware import TimingMiddleware
+from course_web_service.core.responses import ORJSONResponse
+from course_web_service.core.server import run_server
 from course_web_service.database.initial_data.initial_data import InitialDataLoader
 from course_web_service.utils.logger import AppLogger, LoggerConfig
 
@@ -19,32 +34,81 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Управление жизненным циклом приложения."""
     db = DBDependency()
+    app.state.db = db
+    instrument_engine(db.engine)
+    metrics_registry.register_collector("db_pool", db.pool_metrics, counters=("acquired_total",))
+    metrics_registry.register_collector(
+        "password_hasher", password_hasher.metrics, counters=("completed", "rejected")
+    )
+    metrics_registry.register_collector(
+        "principal_cache", principal_cache.metrics, counters=("hits", "misses")
+    )
+    metrics_registry.register_collector(
+        "revoked_refresh_tokens", revoked_tokens.metrics, counters=("hits", "syncs", "failed_syncs")
+    )
+    metrics_registry.register_collector(
+        "login_rate_limiter",
+        login_rate_limiter.metrics,
+        counters=("allowed", "rejected", "backend_errors", "evicted"),
+    )
+    metrics_registry.register_collector(
+        "course_outline_cache", outline_cache.metrics, counters=("hits", "misses")
+    )
+    metrics_registry.register_collector(
+        "rating_buffer", rating_buffer.metrics, counters=("flushes", "failed_flushes")
+    )
+    metrics_registry.register_collector(
+        "payment_seen_transactions", seen_transactions.metrics, counters=("hits",)
+    )
+    metrics_registry.register_collector(
+        "entitlement_cache", entitlement_cache.metrics, counters=("hits", "misses", "invalidations")
+    )
+    metrics_registry.register_collector(
+        "daily_stats_job",
+        daily_stats_job.metrics,
+        counters=("runs", "failed_runs", "rows_total", "rebuilds"),
+    )
+    metrics_registry.register_collector(
+        "role_registry", role_registry.metrics, counters=("refreshes", "failed_refreshes")
+    )
+    metrics_registry.register_collector(
+        "logger", lambda: {"dropped": app_logger.dropped}, counters=("dropped",)
+    )
     try:
         async with db.db_session() as session:
             await InitialDataLoader().load_all(session)
             logger.info("Initial data loaded")
+        user_manager = UserManager(db=db)
+        role_registry.load(await user_manager.get_roles())
+        role_registry.start(user_manager.get_roles)
+        await db.warm_up(user_manager.hot_queries())
+        revoked_tokens.start(db)
+        rating_buffer.start(db)
+        daily_stats_job.start(db)
 
         yield
 
     except Exception as e:
-        logger.error(f"Startup failed: {e}")
+        logger.error("Startup failed: %s", e)
         raise
 
     finally:
+        await rating_buffer.stop()
+        await role_registry.stop()
+        await daily_stats_job.stop()
+        await revoked_tokens.stop()
+        logger.info("DB pool state on shutdown: %s", db.pool_metrics())
         await db.close()
+        password_hasher.shutdown()
         logger.info("Shutdown complete")
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+app.add_middleware(TimingMiddleware)
 app.include_router(router=apps_router)
+app.include_router(router=monitoring_router)
 
 
 def start():
     """Запускает сервер с настройками из конфигурации."""
-    uvicorn.run(
-        app="course_web_service.main:app",
-        host="localhost",
-        port=8000,
-        reload=True,
-        log_config=None,
-    )
+    run_server()
@@ -1,7 +1,18 @@
+import atexit
+import json
 import logging
+import os
+import queue
 import sys
 from abc import ABC, abstractmethod
-from logging.handlers import TimedRotatingFileHandler
+from datetime import UTC, datetime
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+    WatchedFileHandler,
+)
 from pathlib import Path
 
 from course_web_service.core.settings import settings
@@ -32,6 +43,51 @@ class ConsoleFormatter(LogFormatter):
         return logging.Formatter("%(levelname)s - %(message)s")
 
 
+class JsonLinesFormatter(logging.Formatter):
+    """Форматирует запись в компактную JSON-строку."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+class JsonFileFormatter(LogFormatter):
+    """Форматтер для файловых логов в формате JSON lines."""
+
+    def create_formatter(self) -> logging.Formatter:
+        return JsonLinesFormatter()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Обработчик, складывающий записи в ограниченную очередь без форматирования."""
+
+    def __init__(self, log_queue: queue.Queue, block: bool = False):
+        super().__init__(log_queue)
+        self.block = block
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Форматирование выполняется в потоке QueueListener, а не в вызывающем коде."""
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Кладет запись в очередь, ожидая или отбрасывая ее при переполнении."""
+        if self.block:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
 class LoggerConfig:
     """Класс конфигурации логгера."""
 
@@ -45,6 +101,10 @@ class LoggerConfig:
         max_log_size: int = settings.logger_settings.max_log_size,
         when: str = "midnight",
         encoding: str = "utf-8",
+        queue_size: int = settings.logger_settings.log_queue_size,
+        queue_block: bool = settings.logger_settings.log_queue_block,
+        json_format: bool = settings.logger_settings.log_json,
+        multi_process: bool = settings.server_settings.server_workers > 1,
     ):
         self.name = name
         self.log_dir = Path(log_dir)
@@ -54,6 +114,10 @@ class LoggerConfig:
         self.max_log_size = max_log_size
         self.when = when
         self.encoding = encoding
+        self.queue_size = queue_size
+        self.queue_block = queue_block
+        self.json_format = json_format
+        self.multi_process = multi_process
 
 
 class AppLogger:
@@ -62,6 +126,8 @@ class AppLogger:
     def __init__(self, config: LoggerConfig):
         self.config = config
         self._logger: logging.Logger | None = None
+        self._queue_handler: BoundedQueueHandler | None = None
+        self._listener: QueueListener | None = None
         self._setup_done = False
 
     @property
@@ -70,8 +136,13 @@ class AppLogger:
             raise RuntimeError("Logger not initialized. Call setup() first.")
         return self._logger
 
+    @property
+    def dropped(self) -> int:
+        """Количество записей, отброшенных из-за переполнения очереди."""
+        return self._queue_handler.dropped if self._queue_handler else 0
+
     def setup(self) -> None:
-        """Настройка логгера с обработчиками."""
+        """Настройка логгера: записи уходят в очередь, обработчики работают в отдельном потоке."""
         if self._setup_done:
             return
         try:
@@ -80,14 +151,25 @@ class AppLogger:
             self._logger = logging.getLogger(self.config.name)
             self._logger.setLevel(self.config.level)
 
-            self._add_console_handler()
-            self._add_file_handler()
+            self._queue_handler = BoundedQueueHandler(
+                queue.Queue(maxsize=self.config.queue_size), block=self.config.queue_block
+            )
+            self._listener = QueueListener(
+                self._queue_handler.queue,
+                self._create_console_handler(),
+                self._create_file_handler(),
+                respect_handler_level=True,
+            )
+            self._listener.start()
+            atexit.register(self.shutdown)
+            os.register_at_fork(after_in_child=self._restart_listener)
+            self._logger.addHandler(self._queue_handler)
 
             self._setup_done = True
             self._logger.info("Logger initialized successfully")
 
         except Exception as e:
-            logging.critical(f"Failed to initialize logger: {e}")
+            logging.critical("Failed to initialize logger: %s", e)
             raise
 
     def _validate_config(self) -> None:
@@ -102,20 +184,52 @@ class AppLogger:
         except PermissionError as e:
             raise PermissionError(f"Can't create log directory: {e}") from e
 
-    def _add_console_handler(self) -> None:
-        """Добавление обработчика для консоли."""
+    def shutdown(self) -> None:
+        """Останавливает поток обработки очереди, дописывая оставшиеся записи."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def _restart_listener(self) -> None:
+        """Пересоздает очередь и поток обработки в дочернем процессе после fork."""
+        if self._listener is None:
+            return
+        log_queue = queue.Queue(maxsize=self.config.queue_size)
+        self._queue_handler.queue = log_queue
+        self._listener = QueueListener(
+            log_queue, *self._listener.handlers, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def _create_console_handler(self) -> logging.Handler:
+        """Создание обработчика для консоли."""
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(ConsoleFormatter().create_formatter())
-        self._logger.addHandler(console_handler)
+        return console_handler
 
-    def _add_file_handler(self) -> None:
-        """Добавление обработчика для файла."""
+    def _create_file_handler(self) -> logging.Handler:
+        """Создание обработчика для файла с ротацией по размеру или по времени.
+
+        При нескольких воркерах файл пишут все процессы, поэтому встроенная ротация
+        отключается: WatchedFileHandler переоткрывает файл после внешней ротации (logrotate).
+        """
         file_path = self.config.log_dir / self.config.log_file
-        file_handler = TimedRotatingFileHandler(
-            filename=file_path,
-            when=self.config.when,
-            backupCount=self.config.backup_count,
-            encoding=self.config.encoding,
-        )
-        file_handler.setFormatter(DefaultFileFormatter().create_formatter())
-        self._logger.addHandler(file_handler)
+        if self.config.multi_process:
+            file_handler = WatchedFileHandler(filename=file_path, encoding=self.config.encoding)
+        elif self.config.max_log_size > 0:
+            file_handler = RotatingFileHandler(
+                filename=file_path,
+                maxBytes=self.config.max_log_size,
+                backupCount=self.config.backup_count,
+                encoding=self.config.encoding,
+            )
+        else:
+            file_handler = TimedRotatingFileHandler(
+                filename=file_path,
+                when=self.config.when,
+                backupCount=self.config.backup_count,
+                encoding=self.config.encoding,
+            )
+        formatter = JsonFileFormatter() if self.config.json_format else DefaultFileFormatter()
+        file_handler.setFormatter(formatter.create_formatter())
+        return file_handler
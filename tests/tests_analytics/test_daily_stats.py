@@ -0,0 +1,199 @@
+import uuid
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from course_web_service.apps.analytics_app.job import DailyStatsJob
+from course_web_service.apps.analytics_app.manager import AnalyticsManager
+from course_web_service.apps.analytics_app.services import AnalyticsService
+from course_web_service.apps.user_app.schemas import RoleSchema, UserReturnData
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def compile_sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def make_user(role_name: str) -> UserReturnData:
+    return UserReturnData(
+        id=uuid.uuid4(),
+        email="curator@example.com",
+        is_active=True,
+        is_verified=True,
+        created_at=NOW,
+        updated_at=NOW,
+        role=RoleSchema(id=1, name=role_name, description=None),
+    )
+
+
+class FakeAnalyticsManager:
+    def __init__(self, curator_user_id, rows):
+        self.curator_user_id = curator_user_id
+        self.rows = rows
+
+    async def get_curator_user_id(self, curator_id):
+        return self.curator_user_id
+
+    async def get_curator_stats(self, curator_id, date_from, date_to, course_id=None):
+        return self.rows
+
+
+def make_service(current_user, curator_user_id, rows=()) -> AnalyticsService:
+    service = AnalyticsService(
+        analytics=FakeAnalyticsManager(curator_user_id, list(rows)), manager=None, auth=None
+    )
+
+    async def get_current_user(token):
+        return current_user
+
+    service.get_current_user = get_current_user
+    return service
+
+
+def test_source_rows_only_read_window_after_watermark():
+    sql = compile_sql(AnalyticsManager.source_rows_query(NOW, NOW))
+
+    assert "purchase.created_at > %(created_at_1)s AND purchase.created_at <= " in sql
+    assert "review" not in sql
+
+
+def test_upsert_adds_increments_to_existing_day():
+    row = {
+        "course_id": 1,
+        "day": date(2026, 1, 1),
+        "purchases_count": 2,
+        "revenue": Decimal("20.00"),
+    }
+    sql = compile_sql(AnalyticsManager(db=None).upsert_query([row]))
+
+    assert "ON CONFLICT (course_id, day) DO UPDATE" in sql
+    assert (
+        "purchases_count = (course_daily_stats.purchases_count + excluded.purchases_count)" in sql
+    )
+    assert "reviews_count" not in sql.split("DO UPDATE")[1]
+
+
+def test_review_rows_recount_days_with_reviews_changed_in_window():
+    sql = compile_sql(AnalyticsManager.review_rows_query(NOW, NOW))
+
+    assert "review.updated_at > %(updated_at_1)s AND review.updated_at <= " in sql
+    assert "JOIN (SELECT DISTINCT review.course_id" in sql
+    assert "changed.course_id = review.course_id" in sql
+    # Итоги дня считаются по всем его отзывам, а не только по измененным.
+    assert sql.count("review.updated_at") == 2
+
+
+def test_review_rows_without_window_cover_all_days():
+    sql = compile_sql(AnalyticsManager.review_rows_query())
+
+    assert "updated_at" not in sql
+    assert "GROUP BY review.course_id" in sql
+
+
+def test_review_upsert_replaces_day_totals():
+    row = {"course_id": 1, "day": date(2026, 1, 1), "reviews_count": 1, "rating_sum": 4}
+    sql = compile_sql(AnalyticsManager(db=None).review_upsert_query([row]))
+
+    assert "reviews_count = excluded.reviews_count" in sql
+    assert "rating_sum = excluded.rating_sum" in sql
+    assert "purchases_count" not in sql.split("DO UPDATE")[1]
+
+
+def test_deleted_reviews_reset_days_without_reviews():
+    sql = compile_sql(AnalyticsManager(db=None).reset_deleted_reviews_query())
+
+    assert "SET reviews_count=%(reviews_count)s, rating_sum=%(rating_sum)s" in sql
+    assert "NOT (EXISTS (SELECT * \nFROM review" in sql
+
+
+def test_watermark_moves_only_from_expected_value():
+    sql = compile_sql(AnalyticsManager.advance_watermark_query(NOW, NOW))
+
+    assert "analytics_watermark.processed_until = %(processed_until_1)s" in sql
+    assert "RETURNING analytics_watermark.name" in sql
+
+
+@pytest.mark.asyncio
+async def test_curator_sees_own_stats_with_totals():
+    user = make_user("user")
+    rows = [
+        {
+            "course_id": course_id,
+            "course_title": "Course",
+            "day": date(2026, 1, day),
+            "purchases_count": 2,
+            "revenue": Decimal("10.50"),
+            "reviews_count": 2,
+            "rating_sum": 9,
+        }
+        for course_id, day in ((1, 1), (2, 2))
+    ]
+    service = make_service(user, curator_user_id=user.id, rows=rows)
+
+    stats = await service.get_curator_stats("token", 1, date(2026, 1, 1), date(2026, 1, 31))
+
+    assert stats.purchases_count == 4
+    assert stats.revenue == Decimal("21.00")
+    assert stats.days[0].rating_avg == 4.5
+
+
+@pytest.mark.asyncio
+async def test_other_curators_stats_are_forbidden():
+    service = make_service(make_user("user"), curator_user_id=uuid.uuid4())
+
+    with pytest.raises(HTTPException) as exc:
+        await service.get_curator_stats("token", 1, date(2026, 1, 1), date(2026, 1, 31))
+
+    assert exc.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_admin_can_read_any_curator_but_range_is_bounded():
+    service = make_service(make_user("admin"), curator_user_id=uuid.uuid4())
+
+    stats = await service.get_curator_stats("token", 1, date(2026, 1, 1), date(2026, 1, 1))
+    assert stats.days == []
+
+    with pytest.raises(HTTPException) as exc:
+        await service.get_curator_stats("token", 1, date(2020, 1, 1), date(2026, 1, 1))
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_is_counted_and_retried(monkeypatch):
+    async def refresh_daily_stats(self, lag):
+        raise RuntimeError("replica unavailable")
+
+    monkeypatch.setattr(AnalyticsManager, "refresh_daily_stats", refresh_daily_stats)
+    job = DailyStatsJob(interval_s=0)
+    job._db = object()
+
+    assert await job.run_once() == 0
+    assert job.metrics() == {"runs": 0, "failed_runs": 1, "rows_total": 0, "rebuilds": 0}
+
+
+@pytest.mark.asyncio
+async def test_review_rebuild_runs_once_per_interval(monkeypatch):
+    calls = []
+
+    async def refresh_daily_stats(self, lag):
+        return 3
+
+    async def rebuild_review_stats(self):
+        calls.append(1)
+        return 0
+
+    monkeypatch.setattr(AnalyticsManager, "refresh_daily_stats", refresh_daily_stats)
+    monkeypatch.setattr(AnalyticsManager, "rebuild_review_stats", rebuild_review_stats)
+    job = DailyStatsJob(interval_s=0, rebuild_interval_s=3600)
+    job._db = object()
+
+    await job.run_once()
+    await job.run_once()
+
+    assert len(calls) == 1
+    assert job.metrics()["rebuilds"] == 1
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException, status
+
+from course_web_service.apps.auth_app.hashing import PasswordHasher
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(max_workers=1, use_processes=False, queue_limit=1)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_in_executor(hasher: PasswordHasher):
+    hashed_password = await hasher.hash("test_password_123")
+
+    assert await hasher.verify("test_password_123", hashed_password) is True
+    assert await hasher.verify("wrong_password", hashed_password) is False
+    assert hasher.metrics()["completed"] == 3
+    assert hasher.metrics()["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_limit_returns_503(hasher: PasswordHasher):
+    """Запрос сверх лимита очереди отклоняется, не дожидаясь воркера."""
+    results = await asyncio.gather(
+        hasher.hash("first_password"),
+        hasher.hash("second_password"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], HTTPException)
+    assert results[1].status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert hasher.metrics()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_verify_dummy_always_fails_with_real_bcrypt_work(hasher: PasswordHasher):
+    assert await hasher.verify_dummy("any_password") is False
+    assert hasher.metrics()["completed"] == 1
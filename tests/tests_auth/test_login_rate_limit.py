@@ -0,0 +1,159 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.security import OAuth2PasswordRequestForm
+
+from course_web_service.apps.auth_app import ratelimit
+from course_web_service.apps.auth_app.ratelimit import (
+    InMemoryRateLimiterBackend,
+    LoginRateLimiter,
+    RateLimit,
+)
+from course_web_service.apps.auth_app.services import AuthService
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(ratelimit.time, "monotonic", clock)
+    return clock
+
+
+def make_limiter(maxsize: int = 100) -> LoginRateLimiter:
+    return LoginRateLimiter(
+        backend=InMemoryRateLimiterBackend(maxsize=maxsize, wheel_size=60),
+        per_email=RateLimit(burst=3, per_minute=6),
+        per_ip=RateLimit(burst=5, per_minute=60),
+        enabled=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_email_bucket_rejects_after_burst_and_refills(clock):
+    limiter = make_limiter()
+    for _ in range(3):
+        await limiter.check("User@Example.com ", client_ip=None)
+
+    with pytest.raises(HTTPException) as exc:
+        await limiter.check("user@example.com", client_ip=None)
+    assert exc.value.status_code == 429
+    assert exc.value.headers["Retry-After"] == "10"
+
+    clock.now += 10
+    await limiter.check("user@example.com", client_ip=None)
+
+
+@pytest.mark.asyncio
+async def test_ip_bucket_limits_credential_stuffing_across_emails(clock):
+    limiter = make_limiter()
+    for index in range(5):
+        await limiter.check(f"user-{index}@example.com", client_ip="10.0.0.1")
+
+    with pytest.raises(HTTPException):
+        await limiter.check("fresh@example.com", client_ip="10.0.0.1")
+    await limiter.check("fresh@example.com", client_ip="10.0.0.2")
+
+
+@pytest.mark.asyncio
+async def test_full_buckets_expire_from_time_wheel(clock):
+    limiter = make_limiter()
+    await limiter.check("user@example.com", client_ip="10.0.0.1")
+    assert len(limiter.backend) == 2
+
+    clock.now += 11
+    await limiter.check("other@example.com", client_ip=None)
+
+    assert len(limiter.backend) == 1
+
+
+@pytest.mark.asyncio
+async def test_new_keys_stay_limited_when_full(clock):
+    limiter = make_limiter(maxsize=1)
+    await limiter.check("first@example.com", client_ip=None)
+    for _ in range(3):
+        await limiter.check("second@example.com", client_ip=None)
+
+    with pytest.raises(HTTPException):
+        await limiter.check("second@example.com", client_ip=None)
+    assert limiter.metrics()["evicted"] == 1
+    assert len(limiter.backend) == 1
+
+
+@pytest.mark.asyncio
+async def test_least_recently_hit_bucket_is_evicted(clock):
+    limiter = make_limiter(maxsize=2)
+    for _ in range(3):
+        await limiter.check("attacked@example.com", client_ip=None)
+    await limiter.check("other@example.com", client_ip=None)
+    with pytest.raises(HTTPException):
+        await limiter.check("attacked@example.com", client_ip=None)
+
+    await limiter.check("fresh@example.com", client_ip=None)
+
+    with pytest.raises(HTTPException):
+        await limiter.check("attacked@example.com", client_ip=None)
+    assert limiter.metrics()["evicted"] == 1
+
+
+class CountingUserManager:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_user_by_email(self, user):
+        self.calls += 1
+        raise HTTPException(status_code=404, detail="User not found.")
+
+
+class DummyAuthHandler:
+    def __init__(self):
+        self.dummy_checks = 0
+
+    async def verify_dummy_password(self, plain_password):
+        self.dummy_checks += 1
+        return False
+
+
+def login_form(email: str) -> OAuth2PasswordRequestForm:
+    return OAuth2PasswordRequestForm(username=email, password="password")  # noqa: S106
+
+
+@pytest.mark.asyncio
+async def test_unknown_email_gets_401_after_dummy_hash_check(monkeypatch, clock):
+    monkeypatch.setattr(
+        "course_web_service.apps.auth_app.services.login_rate_limiter", make_limiter()
+    )
+    manager, auth = CountingUserManager(), DummyAuthHandler()
+    service = AuthService(manager=manager, auth=auth, tokens=None)
+
+    with pytest.raises(HTTPException) as exc:
+        await service.login_for_access_token(login_form("ghost@example.com"), client_ip="10.0.0.1")
+
+    assert exc.value.status_code == 401
+    assert auth.dummy_checks == 1
+
+
+@pytest.mark.asyncio
+async def test_limited_login_is_rejected_before_db_lookup(monkeypatch, clock):
+    monkeypatch.setattr(
+        "course_web_service.apps.auth_app.services.login_rate_limiter", make_limiter()
+    )
+    manager, auth = CountingUserManager(), DummyAuthHandler()
+    service = AuthService(manager=manager, auth=auth, tokens=None)
+
+    statuses = []
+    for _ in range(5):
+        try:
+            await service.login_for_access_token(login_form("ghost@example.com"), client_ip=None)
+        except HTTPException as e:
+            statuses.append(e.status_code)
+
+    assert statuses == [401, 401, 401, 429, 429]
+    assert manager.calls == 3
+    assert auth.dummy_checks == 3
@@ -0,0 +1,121 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from fastapi import BackgroundTasks
+from passlib.context import CryptContext
+
+from course_web_service.apps.auth_app import calibration
+from course_web_service.apps.auth_app.hashing import build_crypt_context, needs_rehash
+from course_web_service.apps.auth_app.services import AuthService
+from course_web_service.apps.user_app.schemas import RegisterUser, RoleSchema, UserInDB
+
+PASSWORD = "password"  # noqa: S105
+
+
+def bcrypt_hash(rounds: int) -> str:
+    return CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds).hash(PASSWORD)
+
+
+def test_hash_with_other_rounds_needs_rehash_and_still_verifies():
+    context = build_crypt_context(scheme="bcrypt", bcrypt_rounds=5)
+    old_hash = bcrypt_hash(4)
+
+    assert context.verify(PASSWORD, old_hash)
+    assert context.needs_update(old_hash)
+    assert not context.needs_update(context.hash(PASSWORD))
+
+
+def test_unknown_scheme_is_rejected():
+    with pytest.raises(RuntimeError):
+        build_crypt_context(scheme="md5_crypt")
+
+
+class RehashUserManager:
+    def __init__(self, user: UserInDB):
+        self.user = user
+        self.updates = []
+
+    async def get_user_by_email(self, user):
+        return self.user
+
+    async def update_password_hash(self, user_id, old_hash, new_hash):
+        self.updates.append((user_id, old_hash, new_hash))
+        return True
+
+
+class RehashAuthHandler:
+    async def verify_password(self, plain_password, hashed_password):
+        return True
+
+    def needs_rehash(self, hashed_password):
+        return needs_rehash(hashed_password)
+
+    async def get_password_hash(self, password):
+        return "$2b$12$new"
+
+
+def make_user(hashed_password: str) -> UserInDB:
+    now = datetime.now(UTC)
+    return UserInDB(
+        id=uuid.uuid4(),
+        email="user@example.com",
+        hashed_password=hashed_password,
+        is_active=True,
+        is_verified=True,
+        role=RoleSchema(id=1, name="User", description=None),
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_outdated_hash_is_replaced_in_background():
+    user = make_user(bcrypt_hash(4))
+    manager = RehashUserManager(user)
+    service = AuthService(manager=manager, auth=RehashAuthHandler(), tokens=None)
+    background_tasks = BackgroundTasks()
+
+    await service.authenticate_user(
+        RegisterUser(email=user.email, password=PASSWORD), background_tasks=background_tasks
+    )
+    assert manager.updates == []
+
+    await background_tasks()
+    assert manager.updates == [(user.id, user.hashed_password, "$2b$12$new")]
+
+
+@pytest.mark.asyncio
+async def test_current_hash_is_left_alone():
+    user = make_user(build_crypt_context().hash(PASSWORD))
+    manager = RehashUserManager(user)
+    service = AuthService(manager=manager, auth=RehashAuthHandler(), tokens=None)
+    background_tasks = BackgroundTasks()
+
+    await service.authenticate_user(
+        RegisterUser(email=user.email, password=PASSWORD), background_tasks=background_tasks
+    )
+
+    assert background_tasks.tasks == []
+
+
+def test_pick_cost_takes_highest_cost_within_budget():
+    timings = {10: 60.0, 11: 120.0, 12: 240.0, 13: 480.0}
+
+    assert calibration.pick_cost(range(10, 14), timings.__getitem__, target_ms=250) == 12
+    assert calibration.pick_cost(range(10, 14), timings.__getitem__, target_ms=30) == 10
+
+
+def test_update_env_file_replaces_existing_keys(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("SECRET_KEY=secret\nPASSWORD_BCRYPT_ROUNDS=10\n")
+
+    calibration.update_env_file(
+        env_file, {"password_bcrypt_rounds": 13, "password_hash_target_ms": 250}
+    )
+
+    assert env_file.read_text().splitlines() == [
+        "SECRET_KEY=secret",
+        "PASSWORD_BCRYPT_ROUNDS=13",
+        "PASSWORD_HASH_TARGET_MS=250",
+    ]
@@ -0,0 +1,62 @@
+import time
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from course_web_service.apps.auth_app.cache import InMemoryPrincipalCacheBackend, PrincipalCache
+from course_web_service.apps.user_app.schemas import RoleSchema, UserReturnData
+
+
+def make_user(email: str) -> UserReturnData:
+    now = datetime.now(UTC)
+    return UserReturnData(
+        id=uuid.uuid4(),
+        email=email,
+        is_active=True,
+        is_verified=True,
+        role_id=4,
+        created_at=now,
+        updated_at=now,
+        role=RoleSchema(id=4, name="User", description=None),
+    )
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_hit_miss_and_invalidate():
+    cache = PrincipalCache(backend=InMemoryPrincipalCacheBackend(maxsize=10), ttl=60)
+    user = make_user("user@example.com")
+
+    assert await cache.get(user.email) is None
+    await cache.set(user.email, user)
+    assert await cache.get(user.email) == user
+
+    await cache.invalidate(user.email)
+    assert await cache.get(user.email) is None
+    assert cache.metrics() == {"hits": 1, "misses": 2}
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_ttl_bounded_by_token_exp():
+    """Запись не кэшируется, если токен уже истек."""
+    cache = PrincipalCache(backend=InMemoryPrincipalCacheBackend(maxsize=10), ttl=60)
+    user = make_user("user@example.com")
+
+    await cache.set(user.email, user, expires_at=time.time() - 1)
+
+    assert await cache.get(user.email) is None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_evicts_least_recently_used():
+    backend = InMemoryPrincipalCacheBackend(maxsize=2)
+    first, second, third = (make_user(f"user{i}@example.com") for i in range(3))
+
+    await backend.set(first.email, first, ttl=60)
+    await backend.set(second.email, second, ttl=60)
+    await backend.get(first.email)
+    await backend.set(third.email, third, ttl=60)
+
+    assert await backend.get(second.email) is None
+    assert await backend.get(first.email) == first
+    assert len(backend) == 2
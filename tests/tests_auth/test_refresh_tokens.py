@@ -0,0 +1,182 @@
+import inspect
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from course_web_service.apps import apps_router
+from course_web_service.apps.auth_app.handlers import AuthHandler
+from course_web_service.apps.auth_app.manager import RefreshTokenManager
+from course_web_service.apps.auth_app.revocation import RevokedTokens, revoked_tokens
+from course_web_service.apps.auth_app.services import AuthService
+
+EMAIL = "user@example.com"
+
+
+class FakeRefreshTokenManager:
+    def __init__(self):
+        self.tokens = {}
+        self.rotations = 0
+
+    async def create(self, user_id, record):
+        self.tokens[record.jti] = {
+            "family_id": record.jti,
+            "token_hash": record.token_hash,
+            "expires_at": record.expires_at,
+            "revoked_at": None,
+        }
+
+    async def rotate(self, jti, token_hash, new):
+        self.rotations += 1
+        token = self.tokens.get(jti)
+        if token is None or token["token_hash"] != token_hash or token["revoked_at"]:
+            return False
+        token["revoked_at"] = datetime.now(UTC)
+        self.tokens[new.jti] = {
+            **token,
+            "token_hash": new.token_hash,
+            "expires_at": new.expires_at,
+            "revoked_at": None,
+        }
+        return True
+
+    async def get_token(self, jti):
+        token = self.tokens.get(jti)
+        return SimpleNamespace(**token) if token else None
+
+    async def revoke_family(self, jti):
+        family_id = self.tokens[jti]["family_id"]
+        revoked = []
+        for other_jti, token in self.tokens.items():
+            if token["family_id"] == family_id and token["revoked_at"] is None:
+                token["revoked_at"] = datetime.now(UTC)
+                revoked.append((other_jti, token["expires_at"]))
+        return revoked
+
+
+@pytest.fixture(autouse=True)
+def clear_revoked_tokens():
+    revoked_tokens._jtis.clear()
+
+
+async def login(tokens: FakeRefreshTokenManager) -> tuple[AuthService, str]:
+    service = AuthService(manager=None, auth=AuthHandler(), tokens=tokens)
+    refresh_token, record = await service.auth.issue_refresh_token(EMAIL)
+    await tokens.create(uuid.uuid4(), record)
+    return service, refresh_token
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_token_and_stores_only_hash():
+    tokens = FakeRefreshTokenManager()
+    service, first = await login(tokens)
+
+    response = await service.refresh_access_token(first)
+
+    assert response["refresh_token"] != first
+    assert {token["token_hash"] for token in tokens.tokens.values()} == {
+        AuthHandler.hash_token(first),
+        AuthHandler.hash_token(response["refresh_token"]),
+    }
+
+
+@pytest.mark.asyncio
+async def test_reused_token_revokes_whole_session_without_rotation_query():
+    tokens = FakeRefreshTokenManager()
+    service, first = await login(tokens)
+    second = (await service.refresh_access_token(first))["refresh_token"]
+
+    with pytest.raises(HTTPException) as exc:
+        await service.refresh_access_token(first)
+    assert exc.value.detail == "Refresh token reuse detected."
+    assert tokens.rotations == 1
+
+    with pytest.raises(HTTPException):
+        await service.refresh_access_token(second)
+
+
+@pytest.mark.asyncio
+async def test_reuse_revoked_by_another_worker_is_detected_after_failed_rotation():
+    tokens = FakeRefreshTokenManager()
+    service, first = await login(tokens)
+    await service.refresh_access_token(first)
+    revoked_tokens._jtis.clear()
+
+    with pytest.raises(HTTPException) as exc:
+        await service.refresh_access_token(first)
+
+    assert exc.value.detail == "Refresh token reuse detected."
+    assert all(token["revoked_at"] for token in tokens.tokens.values())
+
+
+@pytest.mark.asyncio
+async def test_tokens_without_jti_are_rejected():
+    service = AuthService(manager=None, auth=AuthHandler(), tokens=FakeRefreshTokenManager())
+    legacy = await service.auth.create_refresh_token(data={"sub": EMAIL})
+
+    with pytest.raises(HTTPException) as exc:
+        await service.refresh_access_token(legacy)
+
+    assert exc.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_revoked_set_syncs_incrementally_and_drops_expired(monkeypatch):
+    now = datetime.now(UTC)
+    live, expired = uuid.uuid4(), uuid.uuid4()
+    calls = []
+
+    async def get_revoked_since(self, since):
+        calls.append(since)
+        return [(live, now + timedelta(days=1), now), (expired, now - timedelta(seconds=1), now)]
+
+    monkeypatch.setattr(RefreshTokenManager, "get_revoked_since", get_revoked_since)
+    revoked = RevokedTokens(interval_s=0)
+    revoked._db = object()
+
+    await revoked.sync()
+    await revoked.sync()
+
+    assert revoked.is_revoked(live)
+    assert not revoked.is_revoked(expired)
+    assert calls[0] is None
+    assert calls[1] < now
+
+
+def test_rotation_is_a_single_conditional_statement():
+    handler_record = SimpleNamespace(
+        jti=uuid.uuid4(), token_hash="0" * 64, expires_at=datetime.now(UTC)
+    )
+    sql = str(
+        RefreshTokenManager(db=None)
+        .rotate_query(uuid.uuid4(), "1" * 64, handler_record)
+        .compile(dialect=postgresql.dialect())
+    )
+
+    assert sql.startswith("WITH rotated AS")
+    assert "refreshtoken.revoked_at IS NULL" in sql
+    assert "INSERT INTO refreshtoken" in sql
+
+
+def test_purge_deletes_in_skip_locked_batches():
+    sql = str(
+        RefreshTokenManager(db=None).purge_expired_query(500).compile(dialect=postgresql.dialect())
+    )
+
+    assert "LIMIT %(param_1)s FOR UPDATE SKIP LOCKED" in sql
+
+
+def test_every_auth_service_receives_refresh_token_manager():
+    """Подклассы AuthService передают tokens в базовый класс, а не оставляют Depends-заглушку."""
+    assert apps_router.routes
+    subclasses = AuthService.__subclasses__()
+    assert len(subclasses) >= 5
+    tokens = FakeRefreshTokenManager()
+    for service_class in subclasses:
+        kwargs = dict.fromkeys(inspect.signature(service_class).parameters)
+        kwargs["tokens"] = tokens
+
+        assert service_class(**kwargs).tokens is tokens, service_class.__name__
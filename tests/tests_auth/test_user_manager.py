@@ -0,0 +1,140 @@
+import uuid
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+
+from course_web_service.apps.auth_app.services import AuthService
+from course_web_service.apps.user_app.enums import ADMIN_ROLE_NAMES
+from course_web_service.apps.user_app.manager import UserManager
+from course_web_service.apps.user_app.roles import RoleRegistry
+from course_web_service.apps.user_app.schemas import GetUserByEmail, RoleSchema
+from course_web_service.database.models import User
+
+
+def test_conditional_update_checks_permissions_in_sql():
+    """Проверка прав выполняется в том же UPDATE ... RETURNING без join с ролями."""
+    manager = UserManager(db=None)
+    target_id = uuid.uuid4()
+
+    query = (
+        update(User)
+        .where(User.id == target_id, manager._caller_can_change(target_id, "caller@example.com"))
+        .values(first_name="Name")
+        .returning(*User.__table__.columns)
+    )
+    sql = str(query.compile(dialect=postgresql.dialect()))
+
+    assert sql.count("UPDATE") == 1
+    assert "EXISTS (SELECT" in sql
+    assert "role" not in sql.replace("role_id", "")
+    assert "RETURNING" in sql
+
+
+def test_role_registry_lookup_is_case_insensitive():
+    registry = RoleRegistry()
+    registry.load(
+        [
+            RoleSchema(id=1, name="Admin", description=None),
+            RoleSchema(id=2, name="Manager", description=None),
+        ]
+    )
+
+    assert registry.get(1).name == "Admin"
+    assert registry.get(None) is None
+    assert registry.id_by_name("admin") == 1
+    assert registry.ids_by_names(["admin", "manager", "unknown"]) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_role_registry_refresh_picks_up_roles_changed_by_other_workers():
+    roles = [RoleSchema(id=1, name="Admin", description=None)]
+
+    async def load_roles():
+        return list(roles)
+
+    registry = RoleRegistry(interval_s=60)
+    registry.start(load_roles)
+    await registry.refresh()
+    roles.append(RoleSchema(id=2, name="Manager", description=None))
+    await registry.refresh()
+    await registry.stop()
+
+    assert registry.id_by_name("manager") == 2
+    assert registry.metrics()["refreshes"] == 2
+
+
+def test_hot_queries_compile_with_bound_parameters():
+    """Значения не попадают в SQL, поэтому кэш компиляции переиспользуется запросами."""
+    manager = UserManager(db=None)
+
+    for query in manager.hot_queries():
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        assert "%(" in sql
+        assert "00000000" not in sql
+
+
+@pytest.mark.parametrize(
+    ("role_name", "privileged"),
+    [("Admin", True), ("manager", True), ("User", False), (None, False)],
+)
+def test_is_privileged_uses_public_role_names(role_name, privileged):
+    role = RoleSchema(id=1, name=role_name, description=None) if role_name else None
+
+    assert AuthService._is_privileged(SimpleNamespace(role=role)) is privileged
+
+
+def test_only_admin_role_passes_admin_check():
+    manager = SimpleNamespace(role=RoleSchema(id=2, name="Manager", description=None))
+    admin = SimpleNamespace(role=RoleSchema(id=1, name="Admin", description=None))
+
+    assert not AuthService._is_privileged(manager, allowed=ADMIN_ROLE_NAMES)
+    assert AuthService._is_privileged(admin, allowed=ADMIN_ROLE_NAMES)
+
+
+class RowResult:
+    """Результат запроса по колонкам: только строки, без ORM-сущностей."""
+
+    def __init__(self, row):
+        self.row = row
+
+    def first(self):
+        return self.row
+
+
+class RowSession:
+    def __init__(self, row):
+        self.row = row
+
+    async def execute(self, query):
+        return RowResult(self.row)
+
+
+@pytest.mark.asyncio
+async def test_user_is_validated_from_column_row():
+    now = datetime.now(UTC)
+    row = SimpleNamespace(
+        id=uuid.uuid4(),
+        email="user@example.com",
+        first_name=None,
+        last_name=None,
+        hashed_password="hash",  # noqa: S106
+        is_active=True,
+        is_verified=True,
+        role_id=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+    @asynccontextmanager
+    async def db_session():
+        yield RowSession(row)
+
+    manager = UserManager(db=SimpleNamespace(db_session=db_session))
+    user = await manager.get_user_by_email(GetUserByEmail(email=row.email))
+
+    assert user.id == row.id
+    assert user.hashed_password == "hash"  # noqa: S105
@@ -0,0 +1,109 @@
+import inspect
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from course_web_service.core.core_dependecy.db_dependency import (
+    DBDependency,
+    InstrumentedAsyncPool,
+    PoolMetrics,
+    get_db,
+    statement_options,
+)
+from course_web_service.core.settings import settings
+
+
+def test_pool_metrics_observe_acquire():
+    metrics = PoolMetrics()
+
+    metrics.observe_acquire(0.2)
+    metrics.observe_acquire(0.4)
+
+    assert metrics.acquired == 2
+    assert metrics.acquire_time_max == 0.4
+    assert metrics.acquire_time_avg == pytest.approx(0.3)
+
+
+@pytest.mark.asyncio
+async def test_db_dependency_uses_configured_pool():
+    """Пул создается один раз с параметрами из DBSettings и не открывает соединений заранее."""
+    db = DBDependency()
+
+    pool = db._engine.sync_engine.pool
+    metrics = db.pool_metrics()
+
+    assert isinstance(pool, InstrumentedAsyncPool)
+    assert metrics["size"] == settings.db_settings.db_pool_size
+    assert metrics["checked_out"] == 0
+    assert metrics["waiters"] == 0
+
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_read_session_falls_back_to_primary_without_replica():
+    db = DBDependency()
+
+    assert not db.has_replica
+    assert db.read_session is db.db_session
+
+    await db.close()
+
+
+def options_for(mode: str) -> dict:
+    return statement_options(settings.db_settings.model_copy(update={"db_statement_mode": mode}))
+
+
+def test_statement_options_for_direct_and_pooler_modes():
+    direct = options_for("direct")
+    pooler = options_for("pooler")
+
+    assert direct["connect_args"] == {
+        "prepared_statement_cache_size": settings.db_settings.db_statement_cache_size
+    }
+    assert direct["query_cache_size"] == settings.db_settings.db_compiled_cache_size
+    assert pooler["connect_args"]["statement_cache_size"] == 0
+    assert pooler["connect_args"]["prepared_statement_cache_size"] == 0
+    name_func = pooler["connect_args"]["prepared_statement_name_func"]
+    assert name_func() != name_func()
+
+    with pytest.raises(RuntimeError):
+        options_for("session")
+
+
+class RecordingEngine:
+    def __init__(self):
+        self.executed = []
+
+    @asynccontextmanager
+    async def connect(self):
+        yield self
+
+    async def execute(self, statement):
+        self.executed.append(statement)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_prepares_statements_on_each_pool_connection(monkeypatch):
+    db = DBDependency()
+    engine = db._engine
+    db._engine = RecordingEngine()
+    monkeypatch.setattr(settings.db_settings, "db_statement_mode", "direct")
+
+    await db.warm_up(["first", "second"])
+
+    assert len(db._engine.executed) == 2 * settings.db_settings.db_pool_size
+
+    db._engine = engine
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_get_db_runs_on_event_loop():
+    """Зависимость асинхронная: FastAPI не отправляет ее в пул потоков."""
+    db = object()
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(db=db)))
+
+    assert inspect.iscoroutinefunction(get_db)
+    assert await get_db(request) is db
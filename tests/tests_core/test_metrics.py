@@ -0,0 +1,99 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from pydantic import SecretStr
+
+from course_web_service.apps.monitoring_app.routes import monitoring_router
+from course_web_service.core.metrics import MetricsRegistry, record_timing
+from course_web_service.core.middleware import TimingMiddleware
+from course_web_service.core.settings import settings
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def client(registry: MetricsRegistry):
+    app = FastAPI()
+    app.add_middleware(TimingMiddleware, registry=registry, slow_request_threshold_ms=10_000)
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        record_timing("jwt", 0.001)
+        return {"item_id": item_id}
+
+    transport = httpx.ASGITransport(app=app)
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header(client: httpx.AsyncClient):
+    response = await client.get("/items/1")
+
+    server_timing = response.headers["server-timing"]
+    assert "app;dur=" in server_timing
+    assert 'db;dur=0.00;desc="0 queries"' in server_timing
+    assert "jwt;dur=1.00" in server_timing
+
+
+@pytest.mark.asyncio
+async def test_latency_histogram_uses_route_template(
+    client: httpx.AsyncClient, registry: MetricsRegistry
+):
+    """Метрики группируются по шаблону маршрута, а не по конкретному URL."""
+    await client.get("/items/1")
+    await client.get("/items/2")
+    registry.register_collector("db_pool", lambda: {"checked_out": 3, "name": "pool"})
+
+    rendered = registry.render()
+
+    assert registry.request_latency[("GET", "/items/{item_id}", "200")].count == 2
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/items/{item_id}",status="200"} 2'
+        in rendered
+    )
+    assert "db_pool_checked_out 3" in rendered
+    assert "db_pool_name" not in rendered
+
+
+def test_collector_counters_are_exported_as_counters(registry: MetricsRegistry):
+    registry.register_collector("cache", lambda: {"hits": 5, "size": 2}, counters=("hits",))
+
+    rendered = registry.render()
+
+    assert "# TYPE cache_hits counter" in rendered
+    assert "# TYPE cache_size gauge" in rendered
+
+
+def make_monitoring_client(client_host: str) -> httpx.AsyncClient:
+    app = FastAPI()
+    app.include_router(monitoring_router)
+    transport = httpx.ASGITransport(app=app, client=(client_host, 12345))
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_metrics_without_token_are_served_only_to_loopback(monkeypatch):
+    monkeypatch.setattr(settings.monitoring_settings, "metrics_token", None)
+
+    local = await make_monitoring_client("127.0.0.1").get("/metrics")
+    remote = await make_monitoring_client("10.0.0.5").get("/metrics")
+
+    assert local.status_code == 200
+    assert remote.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_metrics_require_configured_bearer_token(monkeypatch):
+    monkeypatch.setattr(settings.monitoring_settings, "metrics_token", SecretStr("scrape"))
+    client = make_monitoring_client("10.0.0.5")
+
+    missing = await client.get("/metrics")
+    wrong = await client.get("/metrics", headers={"Authorization": "Bearer other"})
+    valid = await client.get("/metrics", headers={"Authorization": "Bearer scrape"})
+
+    assert missing.status_code == 401
+    assert wrong.status_code == 401
+    assert valid.status_code == 200
@@ -0,0 +1,44 @@
+import json
+import uuid
+from datetime import UTC, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+from course_web_service.apps.user_app.schemas import RoleSchema, UserInDB, UserReturnData
+from course_web_service.core.responses import ORJSONResponse
+
+
+def make_row() -> SimpleNamespace:
+    now = datetime.now(UTC)
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        email="user@example.com",
+        first_name="Name",
+        last_name=None,
+        hashed_password="$2b$12$hash",  # noqa: S106
+        is_active=True,
+        is_verified=False,
+        role_id=4,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_trusted_user_renders_like_validated_response_model():
+    row = make_row()
+    user = UserInDB.model_validate(row, from_attributes=True)
+    user.role = RoleSchema(id=4, name="User", description=None)
+
+    response = ORJSONResponse(user.to_return_data())
+
+    expected = UserReturnData.model_validate({**vars(row), "role": user.role}).model_dump(
+        mode="json"
+    )
+    assert json.loads(response.body) == expected
+    assert "hashed_password" not in json.loads(response.body)
+
+
+def test_orjson_response_serializes_decimals_as_strings():
+    response = ORJSONResponse({"price": Decimal("10.50"), 1: "one"})
+
+    assert json.loads(response.body) == {"price": "10.50", "1": "one"}
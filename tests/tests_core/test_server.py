@@ -0,0 +1,29 @@
+import pytest
+
+from course_web_service.core.server import check_multi_worker_settings
+from course_web_service.core.settings import settings
+
+
+def make_settings(workers: int, redis_url: str | None = None, ttl: int = 60):
+    server = settings.server_settings.model_copy(update={"server_workers": workers})
+    auth = settings.auth_settings.model_copy(
+        update={"principal_cache_redis_url": redis_url, "principal_cache_ttl": ttl}
+    )
+    return server, auth
+
+
+def test_in_memory_principal_cache_is_rejected_with_several_workers():
+    with pytest.raises(RuntimeError):
+        check_multi_worker_settings(*make_settings(workers=4))
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"workers": 1},
+        {"workers": 4, "redis_url": "redis://localhost:6379/0"},
+        {"workers": 4, "ttl": 0},
+    ],
+)
+def test_shared_or_disabled_principal_cache_is_allowed(config):
+    check_multi_worker_settings(*make_settings(**config))
@@ -0,0 +1,84 @@
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from course_web_service.apps.course_app.enums import CourseSort
+from course_web_service.apps.course_app.manager import CourseManager
+from course_web_service.apps.course_app.schemas import CourseListItem
+from course_web_service.apps.course_app.services import CourseService
+from course_web_service.core.pagination import decode_cursor, encode_cursor
+
+
+def compile_sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_newest_page_uses_row_comparison_on_created_at_and_id():
+    manager = CourseManager(db=None)
+    after = (datetime(2026, 1, 1, tzinfo=UTC), 10)
+
+    sql = compile_sql(manager.list_courses_query(CourseSort.NEWEST, limit=21, after=after))
+
+    assert "(course.created_at, course.id) < (" in sql
+    assert "ORDER BY course.created_at DESC, course.id DESC" in sql
+    assert "OFFSET" not in sql
+    assert "description" not in sql
+
+
+def test_price_page_ascending_without_cursor_has_no_filter():
+    manager = CourseManager(db=None)
+
+    sql = compile_sql(manager.list_courses_query(CourseSort.PRICE_ASC, limit=21))
+
+    assert "WHERE" not in sql
+    assert "ORDER BY course.price ASC, course.id ASC" in sql
+
+
+def test_cursor_roundtrip_restores_typed_key():
+    item = CourseListItem(
+        id=7,
+        title="Course",
+        price=Decimal("19.90"),
+        curator_id=1,
+        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+    cursor = encode_cursor(
+        CourseSort.PRICE_ASC.value, CourseService._cursor_values(CourseSort.PRICE_ASC, item)
+    )
+
+    assert CourseService._parse_cursor(CourseSort.PRICE_ASC, cursor) == (Decimal("19.90"), 7)
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor("newest", ["2026-01-01", 1])])
+def test_invalid_or_foreign_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor, CourseSort.PRICE_DESC.value)
+
+    assert exc.value.status_code == 400
+
+
+def test_search_query_uses_indexed_predicates_and_rank_keyset():
+    manager = CourseManager(db=None)
+
+    sql = compile_sql(manager.search_courses_query("python", limit=21, after=(0.5, 3)))
+
+    assert "course.search_vector @@ websearch_to_tsquery" in sql
+    assert "lesson.search_vector @@ websearch_to_tsquery" in sql
+    assert "course.title %%" in sql
+    assert "ILIKE" not in sql
+    assert "course.id) < (" in sql
+    assert sql.rstrip().endswith("DESC, course.id DESC \n LIMIT %(param_3)s".rstrip())
+
+
+@pytest.mark.asyncio
+async def test_search_cursor_is_bound_to_query_text():
+    service = CourseService(manager=None)
+    cursor = encode_cursor(service._search_cursor_scope("python"), [0.5, 3])
+
+    with pytest.raises(HTTPException) as exc:
+        await service.search_courses(text="golang", cursor=cursor, limit=20)
+
+    assert exc.value.status_code == 400
@@ -0,0 +1,111 @@
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from course_web_service.apps.course_app.cache import OutlineCache, outline_cache
+from course_web_service.apps.course_app.manager import CourseManager
+from course_web_service.apps.course_app.services import CourseService
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def make_course(course_id: int = 1):
+    lessons = [
+        SimpleNamespace(id=f"00000000-0000-0000-0000-00000000000{n}", title=f"L{n}", order=n)
+        for n in (1, 2)
+    ]
+    for lesson in lessons:
+        lesson.updated_at = NOW + timedelta(minutes=5)
+    topic = SimpleNamespace(id=1, title="T1", order=1, lessons=lessons, updated_at=NOW)
+    return SimpleNamespace(
+        id=course_id,
+        title="Course",
+        description="Description",
+        price=Decimal("10.00"),
+        curator_id=1,
+        topics=[topic],
+        updated_at=NOW,
+    )
+
+
+class FakeCourseManager:
+    def __init__(self, course):
+        self.course = course
+        self.tree_loads = 0
+
+    async def get_outline_version(self, course_id):
+        if self.course is None:
+            return None
+        return CourseService._tree_version(self.course)
+
+    async def get_outline(self, course_id):
+        self.tree_loads += 1
+        return self.course
+
+
+@pytest.fixture(autouse=True)
+def clear_outline_cache():
+    outline_cache._data.clear()
+
+
+def test_outline_query_loads_tree_in_one_statement_without_lesson_content():
+    sql = str(CourseManager(db=None).outline_query(1).compile(dialect=postgresql.dialect()))
+
+    assert sql.count("SELECT") == 1
+    assert "LEFT OUTER JOIN topic" in sql
+    assert "LEFT OUTER JOIN lesson" in sql
+    assert 'ORDER BY topic_1."order", lesson_1."order"' in sql
+    assert "content" not in sql
+    assert "search_vector" not in sql
+
+
+@pytest.mark.asyncio
+async def test_outline_is_rendered_once_and_revalidated_with_etag():
+    manager = FakeCourseManager(make_course())
+    service = CourseService(manager=manager)
+
+    etag, body = await service.get_outline(course_id=1)
+    cached_etag, cached_body = await service.get_outline(course_id=1)
+    not_modified_etag, not_modified = await service.get_outline(course_id=1, if_none_match=etag)
+
+    assert b'"lessons":[{"id"' in body
+    assert b"content" not in body
+    assert (cached_etag, cached_body) == (etag, body)
+    assert not_modified_etag == etag and not_modified is None
+    assert manager.tree_loads == 1
+
+
+@pytest.mark.asyncio
+async def test_outline_etag_changes_when_lesson_is_removed():
+    course = make_course()
+    service = CourseService(manager=FakeCourseManager(course))
+    etag, _ = await service.get_outline(course_id=1)
+
+    course.topics[0].lessons.pop()
+    new_etag, body = await service.get_outline(course_id=1, if_none_match=etag)
+
+    assert new_etag != etag
+    assert body is not None
+
+
+@pytest.mark.asyncio
+async def test_missing_course_returns_404():
+    service = CourseService(manager=FakeCourseManager(None))
+
+    with pytest.raises(HTTPException) as exc:
+        await service.get_outline(course_id=1)
+
+    assert exc.value.status_code == 404
+
+
+def test_outline_cache_evicts_least_recently_used():
+    cache = OutlineCache(maxsize=1)
+    cache.set(1, '"a"', b"1")
+    cache.set(2, '"b"', b"2")
+
+    assert cache.get(1, '"a"') is None
+    assert cache.get(2, '"b"') == b"2"
@@ -0,0 +1,24 @@
+from pathlib import Path
+
+from course_web_service.database.initial_data.initial_data import InitialDataLoader
+
+DATA_DIR = Path(__file__).parents[2] / "src/course_web_service/database/initial_data"
+
+
+def test_read_seed_parses_yaml_once():
+    loader = InitialDataLoader(data_dir=DATA_DIR)
+
+    data = loader.read_seed()
+
+    assert loader.read_seed() is data
+    assert {role["name"] for role in data["roles"]} == {"Admin", "Manager", "Curator", "User"}
+    assert len(data["users"]) == 2
+
+
+def test_checksum_is_stable_between_loaders():
+    """Одинаковые данные дают одинаковую контрольную сумму — повторный старт пропускает сидинг."""
+    first = InitialDataLoader(data_dir=DATA_DIR).checksum
+    second = InitialDataLoader(data_dir=DATA_DIR).checksum
+
+    assert first == second
+    assert len(first) == 64
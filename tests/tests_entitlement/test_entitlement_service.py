@@ -0,0 +1,105 @@
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from course_web_service.apps.entitlement_app.cache import EntitlementCache, entitlement_cache
+from course_web_service.apps.entitlement_app.manager import EntitlementManager
+from course_web_service.apps.entitlement_app.services import EntitlementService
+
+
+class FakeEntitlementManager:
+    def __init__(self, owned):
+        self.owned = owned
+        self.calls = 0
+
+    async def get_owned_courses(self, user_id):
+        self.calls += 1
+        return frozenset(self.owned.get(user_id, ()))
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    entitlement_cache._data.clear()
+
+
+def make_service(owned) -> tuple[EntitlementService, FakeEntitlementManager]:
+    manager = FakeEntitlementManager(owned)
+    return EntitlementService(entitlements=manager, manager=None, auth=None), manager
+
+
+@pytest.mark.asyncio
+async def test_repeated_checks_hit_cache():
+    user_id = uuid.uuid4()
+    service, manager = make_service({user_id: {1, 2}})
+
+    assert await service.has_access(user_id, 1)
+    assert not await service.has_access(user_id, 3)
+    await service.check_access(user_id, 2)
+    with pytest.raises(HTTPException) as exc:
+        await service.check_access(user_id, 3)
+
+    assert exc.value.status_code == 403
+    assert manager.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_purchase_invalidates_cached_set():
+    user_id = uuid.uuid4()
+    service, manager = make_service({user_id: {1}})
+    assert not await service.has_access(user_id, 2)
+
+    manager.owned[user_id] = {1, 2}
+    entitlement_cache.invalidate(user_id)
+
+    assert await service.has_access(user_id, 2)
+    assert manager.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_purchase_seen_without_local_invalidation():
+    """Покупку мог принять другой воркер: некупленный курс из кэша перепроверяется в БД."""
+    user_id = uuid.uuid4()
+    service, manager = make_service({user_id: {1}})
+    assert not await service.has_access(user_id, 2)
+
+    manager.owned[user_id] = {1, 2}
+
+    assert await service.has_access(user_id, 2)
+    assert await service.has_access(user_id, 1)
+    assert manager.calls == 2
+
+
+def test_stale_load_is_not_cached_after_invalidation():
+    cache = EntitlementCache(maxsize=10, ttl=60)
+    user_id = uuid.uuid4()
+    version = cache.version()
+    cache.invalidate(user_id)
+    cache.set(user_id, frozenset({1}), version)
+
+    assert cache.get(user_id) is None
+
+
+def test_cache_is_bounded_by_size_and_ttl():
+    cache = EntitlementCache(maxsize=2, ttl=60)
+    users = [uuid.uuid4() for _ in range(3)]
+    for user_id in users:
+        cache.set(user_id, frozenset({1}), cache.version())
+    assert cache.get(users[0]) is None
+    assert cache.get(users[2]) == frozenset({1})
+
+    expired = EntitlementCache(maxsize=2, ttl=0)
+    expired.set(users[0], frozenset({1}), expired.version())
+    assert expired.get(users[0]) is None
+
+
+def test_owned_courses_query_reads_purchase_index_columns():
+    sql = str(
+        EntitlementManager(db=None)
+        .owned_courses_query(uuid.uuid4())
+        .compile(dialect=postgresql.dialect())
+    )
+
+    assert "SELECT DISTINCT purchase.course_id" in sql
+    assert "WHERE purchase.user_id = " in sql
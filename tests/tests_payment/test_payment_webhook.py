@@ -0,0 +1,83 @@
+import json
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from pydantic import SecretStr
+from sqlalchemy.dialects import postgresql
+
+from course_web_service.apps.payment_app.cache import seen_transactions
+from course_web_service.apps.payment_app.enums import PaymentStatus
+from course_web_service.apps.payment_app.manager import PaymentManager
+from course_web_service.apps.payment_app.schemas import PaymentWebhook
+from course_web_service.apps.payment_app.services import PaymentService, sign_payload
+from course_web_service.core.settings import settings
+
+SECRET = "webhook-secret"  # noqa: S105
+
+
+class FakePaymentManager:
+    def __init__(self):
+        self.calls = []
+
+    async def record_webhook(self, event):
+        self.calls.append(event)
+        return True
+
+
+@pytest.fixture(autouse=True)
+def webhook_secret(monkeypatch):
+    monkeypatch.setattr(settings.payment_settings, "payment_webhook_secret", SecretStr(SECRET))
+    seen_transactions._data.clear()
+
+
+def webhook_body(status: PaymentStatus) -> bytes:
+    return json.dumps(
+        {
+            "transaction_id": "tx-1",
+            "user_id": str(uuid.uuid4()),
+            "course_id": 1,
+            "amount": "10.00",
+            "payment_method": "card",
+            "status": status.value,
+        }
+    ).encode()
+
+
+@pytest.mark.asyncio
+async def test_retried_webhooks_are_acknowledged_without_db():
+    manager = FakePaymentManager()
+    service = PaymentService(manager=manager)
+    pending, paid = webhook_body(PaymentStatus.PENDING), webhook_body(PaymentStatus.PAID)
+
+    acks = [
+        await service.handle_webhook(body, sign_payload(body, SECRET))
+        for body in (pending, pending, paid, paid, paid)
+    ]
+
+    assert [ack.duplicate for ack in acks] == [False, True, False, True, True]
+    assert [event.status for event in manager.calls] == [PaymentStatus.PENDING, PaymentStatus.PAID]
+
+
+@pytest.mark.asyncio
+async def test_unsigned_webhook_is_rejected_before_processing():
+    manager = FakePaymentManager()
+    body = webhook_body(PaymentStatus.PAID)
+
+    with pytest.raises(HTTPException) as exc:
+        await PaymentService(manager=manager).handle_webhook(body, sign_payload(body, "other"))
+
+    assert exc.value.status_code == 401
+    assert manager.calls == []
+
+
+def test_payment_insert_dedups_by_transaction_id_and_settles_only_pending():
+    manager = PaymentManager(db=None)
+    event = PaymentWebhook.model_validate_json(webhook_body(PaymentStatus.PAID))
+
+    insert_sql = str(manager.insert_payment_query(event).compile(dialect=postgresql.dialect()))
+    settle_sql = str(manager.settle_payment_query(event).compile(dialect=postgresql.dialect()))
+
+    assert "ON CONFLICT (transaction_id) DO NOTHING RETURNING payment.id" in insert_sql
+    assert "payment.status = %(status_1)s" in settle_sql
+    assert "RETURNING payment.user_id, payment.course_id, payment.amount" in settle_sql
@@ -0,0 +1,205 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import DBAPIError
+
+from course_web_service.apps.progress_app.manager import ProgressManager
+from course_web_service.apps.progress_app.schemas import CourseProgressItem, ProgressEvent
+from course_web_service.apps.progress_app.services import ProgressService
+from course_web_service.apps.user_app.schemas import RoleSchema, UserReturnData
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def make_event(assignment_id: uuid.UUID, seconds: int, **kwargs) -> ProgressEvent:
+    return ProgressEvent(
+        assignment_id=assignment_id,
+        lesson_id=uuid.uuid4(),
+        status=f"status-{seconds}",
+        occurred_at=NOW + timedelta(seconds=seconds),
+        **kwargs,
+    )
+
+
+def make_user(role_name: str) -> UserReturnData:
+    return UserReturnData(
+        id=uuid.uuid4(),
+        email="user@example.com",
+        is_active=True,
+        is_verified=True,
+        created_at=NOW,
+        updated_at=NOW,
+        role=RoleSchema(id=1, name=role_name, description=None),
+    )
+
+
+def test_out_of_order_events_collapse_to_latest_per_assignment():
+    first, second = uuid.uuid4(), uuid.uuid4()
+    user_id = uuid.uuid4()
+    events = [
+        make_event(first, 5),
+        make_event(first, 1),
+        make_event(second, 2),
+        make_event(first, 3),
+    ]
+
+    rows = ProgressService.collapse_events(events, default_user_id=user_id)
+
+    assert len(rows) == 2
+    by_assignment = {row["assignment_id"]: row for row in rows}
+    assert by_assignment[first]["status"] == "status-5"
+    assert by_assignment[first]["user_id"] == user_id
+
+
+def test_batch_mixing_naive_and_aware_timestamps_is_collapsed():
+    assignment_id = uuid.uuid4()
+    naive = ProgressEvent(
+        assignment_id=assignment_id,
+        lesson_id=uuid.uuid4(),
+        status="naive",
+        occurred_at=datetime(2026, 1, 1, 0, 0, 10),
+    )
+    events = [naive, make_event(assignment_id, 5)]
+
+    rows = ProgressService.collapse_events(events, default_user_id=uuid.uuid4())
+
+    assert rows[0]["event_at"] == NOW + timedelta(seconds=10)
+    assert rows[0]["event_at"].tzinfo is UTC
+
+
+def test_upsert_only_applies_newer_events():
+    sql = str(ProgressManager(db=None).upsert_query().compile(dialect=postgresql.dialect()))
+
+    assert "ON CONFLICT ON CONSTRAINT uq_userprogress_user_id_assignment_id DO UPDATE" in sql
+    assert "WHERE userprogress.event_at < excluded.event_at" in sql
+    assert "RETURNING userprogress.user_id, userprogress.lesson_id" in sql
+
+
+def test_reporting_for_other_users_requires_privileged_role():
+    event = make_event(uuid.uuid4(), 1, user_id=uuid.uuid4())
+
+    ProgressService._check_can_report(make_user("Manager"), [event])
+    with pytest.raises(HTTPException) as exc:
+        ProgressService._check_can_report(make_user("User"), [event])
+
+    assert exc.value.status_code == 403
+
+
+def test_rollup_is_refreshed_only_for_affected_users_and_courses():
+    manager = ProgressManager(db=None)
+
+    sql = str(
+        manager.rollup_query(user_ids=[uuid.uuid4()], lesson_ids=[uuid.uuid4()]).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    rebuild_sql = str(manager.rollup_query().compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("INSERT INTO course_progress")
+    assert "userprogress.user_id IN" in sql
+    assert "ON CONFLICT (user_id, course_id) DO UPDATE" in sql
+    assert "userprogress.user_id IN" not in rebuild_sql
+
+
+def test_rollup_pairs_are_locked_in_a_stable_order():
+    sql = str(
+        ProgressManager(db=None)
+        .rollup_lock_query(user_ids=[uuid.uuid4()], lesson_ids=[uuid.uuid4()])
+        .compile(dialect=postgresql.dialect())
+    )
+
+    assert sql.startswith("SELECT pg_advisory_xact_lock(hashtext(CAST(anon_1.user_id AS TEXT))")
+    assert "ORDER BY hashtext(CAST(anon_1.user_id AS TEXT)), anon_1.course_id" in sql
+
+
+def test_total_lessons_refresh_updates_only_changed_rollups():
+    sql = str(
+        ProgressManager.refresh_total_lessons_query(course_ids=[1]).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+
+    assert sql.startswith("UPDATE course_progress SET total_lessons=(SELECT count(lesson.id)")
+    assert "WHERE course_progress.total_lessons != (SELECT count(lesson.id)" in sql
+    assert "course_progress.course_id IN" in sql
+
+
+class DeadlockError(Exception):
+    sqlstate = "40P01"
+
+
+class FakeResult:
+    def all(self):
+        return []
+
+
+class FakeSession:
+    def __init__(self, db):
+        self.db = db
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, rows=None):
+        self.db.batches.append(rows)
+        if self.db.deadlocks:
+            self.db.deadlocks -= 1
+            raise DBAPIError("INSERT", rows, DeadlockError())
+        return FakeResult()
+
+    async def commit(self):
+        pass
+
+
+class FakeDB:
+    def __init__(self, deadlocks: int):
+        self.deadlocks = deadlocks
+        self.batches = []
+
+    def db_session(self):
+        return FakeSession(self)
+
+
+def make_rows(count: int) -> list[dict]:
+    user_id = uuid.uuid4()
+    return [{"user_id": user_id, "assignment_id": uuid.uuid4()} for _ in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_progress_rows_are_sorted_and_retried_after_deadlock():
+    db = FakeDB(deadlocks=1)
+    rows = make_rows(5)
+
+    assert await ProgressManager(db=db).upsert_progress(rows) == 0
+
+    assert len(db.batches) == 2
+    assert db.batches[-1] == sorted(rows, key=lambda row: row["assignment_id"])
+
+
+@pytest.mark.asyncio
+async def test_repeated_deadlocks_are_reported_as_conflict():
+    db = FakeDB(deadlocks=10)
+
+    with pytest.raises(HTTPException) as exc:
+        await ProgressManager(db=db).upsert_progress(make_rows(2))
+
+    assert exc.value.status_code == 409
+
+
+def test_dashboard_item_reports_completion_percent():
+    item = CourseProgressItem(
+        course_id=1,
+        course_title="Course",
+        completed_lessons=5,
+        total_lessons=8,
+        average_score=None,
+        last_activity_at=None,
+    )
+
+    assert item.model_dump()["completion_percent"] == 62.5
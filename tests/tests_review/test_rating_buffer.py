@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from course_web_service.apps.review_app.buffer import RatingBuffer
+
+
+class FakeSession:
+    def __init__(self, db):
+        self.db = db
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query):
+        if self.db.hang is not None:
+            self.db.hang.set()
+            await asyncio.Event().wait()
+        if self.db.fail:
+            raise RuntimeError("db is down")
+        self.db.statements.append(query)
+
+    async def commit(self):
+        pass
+
+
+class FakeDB:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.hang: asyncio.Event | None = None
+        self.statements = []
+
+    def db_session(self):
+        return FakeSession(self)
+
+
+@pytest.mark.asyncio
+async def test_deltas_for_hot_course_are_coalesced_into_one_update():
+    db = FakeDB()
+    buffer = RatingBuffer(interval_ms=10_000)
+    buffer.start(db)
+    for rating in (5, 4, 3):
+        buffer.add(course_id=7, sum_delta=rating, count_delta=1)
+    buffer.add(course_id=3, sum_delta=2, count_delta=0)
+
+    await buffer.stop()
+
+    assert len(db.statements) == 1
+    params = db.statements[0].compile(dialect=postgresql.dialect()).params
+    assert list(params.values()) == [3, 2, 0, 7, 12, 3]
+    assert buffer.metrics()["pending_courses"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_deltas_for_next_attempt():
+    db = FakeDB(fail=True)
+    buffer = RatingBuffer(interval_ms=10_000)
+    buffer.start(db)
+    buffer.add(course_id=1, sum_delta=5, count_delta=1)
+
+    await buffer.stop()
+    db.fail = False
+    buffer.add(course_id=1, sum_delta=4, count_delta=1)
+    await buffer.flush()
+
+    params = db.statements[0].compile(dialect=postgresql.dialect()).params
+    assert list(params.values()) == [1, 9, 2]
+    assert buffer.failed_flushes == 1
+
+
+def test_disabled_buffer_is_not_used():
+    buffer = RatingBuffer(interval_ms=0)
+    buffer.start(FakeDB())
+
+    assert not buffer.enabled
+
+
+@pytest.mark.asyncio
+async def test_flush_cancelled_on_shutdown_keeps_deltas_for_final_flush():
+    db = FakeDB()
+    db.hang = asyncio.Event()
+    buffer = RatingBuffer(interval_ms=1)
+    buffer.start(db)
+    buffer.add(course_id=1, sum_delta=5, count_delta=1)
+    await db.hang.wait()
+
+    db.hang = None
+    await buffer.stop()
+
+    params = db.statements[0].compile(dialect=postgresql.dialect()).params
+    assert list(params.values()) == [1, 5, 1]
+    assert buffer.metrics()["pending_courses"] == 0
@@ -0,0 +1,173 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Insert, Update
+
+from course_web_service.apps.course_app.enums import CourseSort
+from course_web_service.apps.course_app.manager import CourseManager
+from course_web_service.apps.review_app.manager import ReviewManager
+from course_web_service.apps.review_app.schemas import CreateReview, UpdateReview
+
+
+def compile_sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_rating_delta_is_applied_atomically_without_touching_updated_at():
+    sql = compile_sql(ReviewManager.rating_delta_query(course_id=1, sum_delta=4, count_delta=1))
+
+    assert "rating_sum=(course.rating_sum +" in sql
+    assert "rating_count=(course.rating_count +" in sql
+    assert "updated_at=course.updated_at" in sql
+
+
+def test_catalog_sorts_by_materialized_rating():
+    sql = compile_sql(CourseManager(db=None).list_courses_query(CourseSort.RATING, limit=21))
+
+    assert "ORDER BY course.rating_avg DESC, course.id DESC" in sql
+    assert "review" not in sql
+
+
+def test_resubmitting_review_is_a_single_upsert_statement():
+    review = CreateReview(course_id=1, rating=5, comment="Great")
+
+    sql = compile_sql(ReviewManager(db=None).submit_review_query(uuid.uuid4(), review))
+
+    assert sql.startswith("INSERT INTO review")
+    assert "ON CONFLICT ON CONSTRAINT uq_review_user_id_course_id DO UPDATE" in sql
+    assert "(xmax = 0) AS inserted" in sql
+
+
+def test_previous_rating_is_read_under_row_lock():
+    sql = compile_sql(ReviewManager(db=None).lock_previous_rating_query(uuid.uuid4(), 1))
+
+    assert sql.endswith("FOR UPDATE")
+
+
+class FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def mappings(self):
+        return self
+
+    def one(self):
+        return self.row
+
+
+class FakeSession:
+    """Отвечает на блокирующий SELECT и upsert заранее заданными результатами."""
+
+    def __init__(self, previous_ratings, returned_rows):
+        self.previous_ratings = list(previous_ratings)
+        self.returned_rows = list(returned_rows)
+        self.statements = []
+        self.rollbacks = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def scalar(self, query):
+        return self.previous_ratings.pop(0)
+
+    async def execute(self, query):
+        self.statements.append(query)
+        if isinstance(query, Insert | Update) and query.table.name == "review":
+            return FakeResult(self.returned_rows.pop(0))
+        return None
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+    async def commit(self):
+        pass
+
+
+class FakeDB:
+    def __init__(self, session: FakeSession):
+        self.session = session
+
+    def db_session(self):
+        return self.session
+
+
+def review_row(rating: int, inserted: bool) -> dict:
+    now = datetime.now(UTC)
+    return {
+        "id": 1,
+        "user_id": uuid.uuid4(),
+        "course_id": 1,
+        "rating": rating,
+        "comment": "Great",
+        "created_at": now,
+        "updated_at": now,
+        "inserted": inserted,
+    }
+
+
+def rating_delta_params(session: FakeSession) -> list:
+    query = session.statements[-1]
+    return list(query.compile(dialect=postgresql.dialect()).params.values())
+
+
+@pytest.mark.asyncio
+async def test_first_review_increments_rating_count():
+    session = FakeSession(previous_ratings=[None], returned_rows=[review_row(5, inserted=True)])
+    review = CreateReview(course_id=1, rating=5, comment="Great")
+
+    _, created = await ReviewManager(db=FakeDB(session)).submit_review(uuid.uuid4(), review)
+
+    assert created
+    assert rating_delta_params(session) == [5, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_submit_is_retried_as_replacement():
+    """Проигравший гонку за вставку не считает отзыв новым и повторяет чтение под блокировкой."""
+    session = FakeSession(
+        previous_ratings=[None, 3],
+        returned_rows=[review_row(5, inserted=False), review_row(5, inserted=False)],
+    )
+    review = CreateReview(course_id=1, rating=5, comment="Great")
+
+    _, created = await ReviewManager(db=FakeDB(session)).submit_review(uuid.uuid4(), review)
+
+    assert not created
+    assert session.rollbacks == 1
+    assert rating_delta_params(session) == [2, 0, 1]
+
+
+def test_review_listing_uses_course_keyset():
+    sql = compile_sql(ReviewManager(db=None).list_reviews_query(1, limit=21, after=(None, 5)))
+
+    assert "(review.created_at, review.id) < (" in sql
+    assert "ORDER BY review.created_at DESC, review.id DESC" in sql
+
+
+@pytest.mark.asyncio
+async def test_review_update_moves_rating_difference_under_lock():
+    session = FakeSession(previous_ratings=[2], returned_rows=[review_row(5, inserted=False)])
+
+    await ReviewManager(db=FakeDB(session)).update_review(
+        review_id=1, course_id=1, user_id=uuid.uuid4(), update_data=UpdateReview(rating=5)
+    )
+
+    assert rating_delta_params(session) == [3, 0, 1]
+
+
+@pytest.mark.asyncio
+async def test_empty_review_update_is_rejected():
+    session = FakeSession(previous_ratings=[], returned_rows=[])
+
+    with pytest.raises(HTTPException) as exc:
+        await ReviewManager(db=FakeDB(session)).update_review(
+            review_id=1, course_id=1, user_id=uuid.uuid4(), update_data=UpdateReview()
+        )
+
+    assert exc.value.status_code == 422
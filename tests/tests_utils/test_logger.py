@@ -0,0 +1,71 @@
+import json
+import logging
+import queue
+from logging.handlers import RotatingFileHandler, WatchedFileHandler
+
+from course_web_service.utils.logger import (
+    AppLogger,
+    BoundedQueueHandler,
+    JsonLinesFormatter,
+    LoggerConfig,
+)
+
+
+def make_record(msg: str, *args) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, None)
+
+
+def test_json_lines_formatter_renders_lazy_args():
+    line = JsonLinesFormatter().format(make_record("User %s logged in", "user@example.com"))
+
+    payload = json.loads(line)
+    assert payload["message"] == "User user@example.com logged in"
+    assert payload["level"] == "INFO"
+    assert "\n" not in line
+
+
+def test_bounded_queue_handler_drops_when_full():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1), block=False)
+
+    handler.handle(make_record("first"))
+    handler.handle(make_record("second"))
+
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
+
+
+def test_app_logger_writes_through_queue_with_size_rotation(tmp_path):
+    """Запись попадает в файл через QueueListener, а max_log_size включает ротацию по размеру."""
+    config = LoggerConfig(
+        name="test_queue_logger",
+        log_dir=tmp_path,
+        log_file="app.log",
+        max_log_size=1024,
+        multi_process=False,
+    )
+    app_logger = AppLogger(config=config)
+    app_logger.setup()
+
+    app_logger.logger.info("Hello %s", "world")
+    handlers = app_logger._listener.handlers
+    app_logger.shutdown()
+
+    assert any(isinstance(handler, RotatingFileHandler) for handler in handlers)
+    assert "Hello world" in (tmp_path / "app.log").read_text()
+
+
+def test_file_handler_reopens_after_external_rotation_with_several_workers(tmp_path):
+    """При нескольких воркерах процессы не ротируют общий файл сами, а переоткрывают его."""
+    config = LoggerConfig(
+        log_dir=tmp_path, log_file="app.log", max_log_size=1024, multi_process=True
+    )
+    handler = AppLogger(config=config)._create_file_handler()
+
+    handler.handle(make_record("before rotation"))
+    (tmp_path / "app.log").rename(tmp_path / "app.log.1")
+    handler.handle(make_record("after rotation"))
+    handler.close()
+
+    assert isinstance(handler, WatchedFileHandler)
+    assert "before rotation" in (tmp_path / "app.log.1").read_text()
+    assert "after rotation" in (tmp_path / "app.log").read_text()